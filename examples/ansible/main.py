@@ -14,12 +14,13 @@
 # ==============================================================================
 import argparse
 import getpass
+import os
 from pathlib import Path
 from typing import Any
 
 from thc_devops_toolkit.infrastructure.ansible import Playbook
 
-ansible_example_dir = Path(__file__).resolve().parent
+ansible_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 playbook_file = ansible_example_dir / "helloworld.yml"
 inventory_file = ansible_example_dir / "inventory.ini"
 MY_ENV_VAR = "SomeValue"
@@ -29,7 +30,16 @@ MY_ENV_VAR = "SomeValue"
 class HelloWorldPlaybook(Playbook):
     """Ansible playbook for Hello World example."""
 
-    def __init__(self, playbook_file: str | Path, inventory_file: str | Path, limit: str, extravars: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        playbook_file: str | Path,
+        inventory_file: str | Path,
+        limit: str,
+        extravars: dict[str, Any],
+        forks: int = 30,
+        strategy: str = "free",
+        pipelining: bool = True,
+    ) -> None:
         """Initialize the HelloWorldPlaybook instance.
 
         Args:
@@ -37,8 +47,19 @@ class HelloWorldPlaybook(Playbook):
             inventory_file (str | Path): Path to the Ansible inventory file.
             limit (str): Limit for the Ansible playbook execution.
             extravars (dict[str, Any]): Extra variables for the Ansible playbook.
+            forks (int, optional): Number of hosts configured in parallel. Defaults to 30.
+            strategy (str, optional): Ansible execution strategy. Defaults to "free".
+            pipelining (bool, optional): Whether to enable SSH pipelining. Defaults to True.
         """
-        super().__init__(playbook_file=playbook_file, inventory_file=inventory_file, limit=limit, extravars=extravars)
+        super().__init__(
+            playbook_file=playbook_file,
+            inventory_file=inventory_file,
+            limit=limit,
+            extravars=extravars,
+            forks=forks,
+            strategy=strategy,
+            pipelining=pipelining,
+        )
 
     @property
     def mandatory_vars(self) -> set[str]:
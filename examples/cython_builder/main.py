@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
 import shutil
 from pathlib import Path
 
 from thc_devops_toolkit.utils.cython_builder import CythonBuilder
 from thc_devops_toolkit.version_control.git import GitCredential, GitRepo
 
-cython_builder_example_dir = Path(__file__).resolve().parent
+cython_builder_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 repo_url = "https://github.com/psf/requests"
 repo_local_path = cython_builder_example_dir / "requests"
 package_to_build = cython_builder_example_dir / "requests/src/requests"
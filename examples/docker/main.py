@@ -14,9 +14,13 @@
 # ==============================================================================
 import argparse
 import getpass
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from thc_devops_toolkit.containerization.docker import (
+    DockerExecSession,
+    ImageRef,
     docker_build,
     docker_copy,
     docker_exec,
@@ -38,10 +42,11 @@ cr_host = "docker.io"
 image_name = "busybox"
 image_tag = "latest"
 tmp_tag = "tmp"
-full_image_name = f"{cr_host}/{image_name}:{image_tag}"
+base_image = ImageRef(host=cr_host, repo="", name=image_name, tag=image_tag)
 container_name = "my_busybox"
+max_workers = 8
 
-docker_example_dir = Path(__file__).resolve().parent
+docker_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 dockerfile_path = docker_example_dir / "Dockerfile"
 
 
@@ -50,23 +55,25 @@ def main() -> None:
     parser.add_argument("--username", required=True, help="Docker registry username")
     args = parser.parse_args()
     username = args.username
-    password = getpass.getpass("Docker registry password: ")
-    new_image = f"{cr_host}/{username}/{image_name}:{image_tag}"
-    new_image_tmp = f"{cr_host}/{username}/{image_name}:{tmp_tag}"
+    new_image = ImageRef(host=cr_host, repo=username, name=image_name, tag=image_tag)
+    new_image_tmp = new_image.with_tag(tmp_tag)
 
-    docker_login(cr_host=cr_host, username=username, password=password)
-    docker_pull(full_image_name=full_image_name)
+    # The public base image does not need the login, so pull it while prompting for the password and logging in.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pull = executor.submit(docker_pull, full_image_name=base_image)
+        password = getpass.getpass("Docker registry password: ")
+        docker_login(cr_host=cr_host, username=username, password=password)
+        pull.result()
+    # Size and digest are derived from the same inspect result instead of inspecting the image again.
+    image_info = docker_inspect(target_object=base_image)
+    logger.highlight(level=LogLevel.DEBUG, message=f"Image info: {image_info}")
     logger.highlight(
         level=LogLevel.DEBUG,
-        message=f"Image info: {docker_inspect(target_object=full_image_name)}",
+        message=f"Image size: {get_image_size(full_image_name=base_image, image_info=image_info)}",
     )
     logger.highlight(
         level=LogLevel.DEBUG,
-        message=f"Image size: {get_image_size(full_image_name=full_image_name)}",
-    )
-    logger.highlight(
-        level=LogLevel.DEBUG,
-        message=f"Image digest: {get_image_digest(full_image_name=full_image_name, precision=64)}",
+        message=f"Image digest: {get_image_digest(full_image_name=base_image, precision=64, image_info=image_info)}",
     )
     docker_build(
         full_image_name=new_image,
@@ -74,11 +81,14 @@ def main() -> None:
         build_args=[{"key": "ARG1", "value": "Hello World!"}],
     )
     docker_tag(source_full_image_name=new_image, target_full_image_name=new_image_tmp)
-    docker_remove_image(full_image_name=new_image)
-    docker_remove_image(full_image_name=new_image_tmp)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Removing the two tags commutes, so both removals are issued together.
+        removals = [executor.submit(docker_remove_image, full_image_name=image) for image in (new_image, new_image_tmp)]
+        for removal in removals:
+            removal.result()
     # docker_push(full_image_name=new_image)
     container_id = docker_run_daemon(
-        full_image_name=full_image_name,
+        full_image_name=base_image,
         remove=False,
         container_name=container_name,
         entrypoint="sh",
@@ -94,15 +104,17 @@ def main() -> None:
         source=dockerfile_path,
         target=f"{container_name}:/",
     )
+    # several commands share one docker exec
+    with DockerExecSession(obj=container_id, workdir="/") as session:
+        for command in (["ls", "/"], ["cat", "/etc/os-release"]):
+            docker_exec(command=command, session=session, print_output=True)
     docker_stop(
         obj=container_id,
         timeout=10,
-        poll_interval=1,
     )
     docker_remove(
         obj=container_name,
         timeout=10,
-        poll_interval=1,
     )
 
 
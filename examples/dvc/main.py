@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
 import shutil
 from pathlib import Path
 
 from thc_devops_toolkit.version_control.dvc import DvcRepo
 from thc_devops_toolkit.version_control.git import GitCredential, GitRepo
 
-dvc_example_dir = Path(__file__).resolve().parent
+dvc_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 remote_name = "my_remote"
 local_repo_path = dvc_example_dir / "my_repo"
 dvc_remote_path = dvc_example_dir / "my_remote"
@@ -42,22 +43,25 @@ def main() -> None:
     git_repo.init()
     dvc_repo = DvcRepo(local_path=str(local_repo_path))
     dvc_repo.init()
+    # Hash large files concurrently on every core when adding them
+    dvc_repo.set_checksum_jobs()
 
     # Set up DVC remote
     dvc_remote_path.mkdir(parents=True, exist_ok=True)
     dvc_repo.set_remote(remote_name=remote_name, remote_path=dvc_remote_path)
 
-    # Add files
-    (local_repo_path / tracked_dir).mkdir(parents=True, exist_ok=True)
-    with open(local_repo_path / tracked_file_in_dir, "w") as file:
-        file.write("This is a test file.")
-    dvc_repo.add_directory(directory=tracked_dir)
-    with open(local_repo_path / tracked_file, "w") as file:
-        file.write("This is another test file.")
-    dvc_repo.add_files(files=[tracked_file])
+    with dvc_repo.metadata_cache():
+        # Add files
+        (local_repo_path / tracked_dir).mkdir(parents=True, exist_ok=True)
+        with open(local_repo_path / tracked_file_in_dir, "w") as file:
+            file.write("This is a test file.")
+        dvc_repo.add_directory(directory=tracked_dir)
+        with open(local_repo_path / tracked_file, "w") as file:
+            file.write("This is another test file.")
+        dvc_repo.add_files(files=[tracked_file])
 
-    # Push to remote
-    dvc_repo.push(remote_name=remote_name)
+        # Push to remote
+        dvc_repo.push(remote_name=remote_name)
 
     # Access DVC file and tracked files if needed
     dvc_file = dvc_repo.get_dvc_file(tracked_dir)
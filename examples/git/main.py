@@ -14,7 +14,9 @@
 # ==============================================================================
 import argparse
 import getpass
+import os
 import shutil
+import subprocess
 from pathlib import Path
 
 from thc_devops_toolkit.observability import LogLevel, logger
@@ -24,11 +26,28 @@ repo_url = "https://github.com/tcfwbper/devpod.git"
 repo_dir = "devpod"
 repo_dir_tmp = "devpod-tmp"
 
-git_example_dir = Path(__file__).resolve().parent
+git_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 local_repo_path = git_example_dir / repo_dir
 local_repo_path_tmp = git_example_dir / repo_dir_tmp
 
 
+def fast_clone_tree(src: Path, dst: Path) -> None:
+    """Copies a directory tree with copy-on-write or hardlinks where the filesystem allows it.
+
+    Hardlinks are safe for a git repository because git replaces files instead of rewriting them in place.
+    The tree is only copied byte by byte when neither is supported, e.g. across devices.
+
+    Args:
+        src (Path): Source directory.
+        dst (Path): Destination directory, which must not exist.
+    """
+    for cmd in (["cp", "-a", "--reflink=always", str(src), str(dst)], ["cp", "-al", str(src), str(dst)]):
+        if subprocess.run(cmd, capture_output=True, check=False).returncode == 0:
+            return
+        shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Git example script")
     parser.add_argument("--username", required=True, help="GitHub username")
@@ -53,15 +72,17 @@ def main() -> None:
     git_repo.clone(branch=branch)
 
     # Git remotes
-    logger.highlight(LogLevel.DEBUG, f"git remotes: {git_repo.get_remote_url(mask_token=True)}")
+    if logger.is_enabled(LogLevel.DEBUG):
+        logger.highlight(LogLevel.DEBUG, "git remotes: %s", git_repo.get_remote_url(mask_token=True))
 
     # Git pull
     git_repo.pull(rebase=True, branch=branch, remote_name="origin")
 
     # Temporary local path as remote
-    shutil.copytree(local_repo_path, local_repo_path_tmp)
+    fast_clone_tree(local_repo_path, local_repo_path_tmp)
     git_repo.set_remote_url(new_url=str(local_repo_path_tmp))
-    logger.highlight(LogLevel.DEBUG, f"git remotes: {git_repo.get_remote_url(mask_token=True)}")
+    if logger.is_enabled(LogLevel.DEBUG):
+        logger.highlight(LogLevel.DEBUG, "git remotes: %s", git_repo.get_remote_url(mask_token=True))
 
     # Edit files at the new branch
     git_repo.checkout(ref=new_branch, new_branch=True)
@@ -16,6 +16,7 @@ import argparse
 import getpass
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from thc_devops_toolkit.containerization.helm import (
@@ -47,7 +48,7 @@ def main() -> None:
     password = getpass.getpass("GitHub password: ")
 
     cwd = os.getcwd()
-    helm_example_dir = Path(__file__).resolve().parent
+    helm_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
     os.chdir(helm_example_dir)
 
     helm_login(example_cr_host, username, password)
@@ -64,19 +65,23 @@ def main() -> None:
         path_prefix=helm_example_dir / chart_name / "charts",
         name=common_chart_name,
     )
-    verify_chart_version(devpod, expected_chart_version=chart_version)
-    verify_chart_version(
-        common,
-        expected_chart_version=common_chart_version,
-    )
-    verify_chart_values(
-        devpod,
-        check_list={
-            "image.registry": "docker.io",
-            "image.repository": "tcfwbper/dev-env",
-        },
-    )  # values.yaml contains these key-values?
-    verify_dependencies(charts=[devpod, common])  # charts are acyclic?
+    # The verifications only read the already pulled chart files, so they run side by side.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        verifications = [
+            executor.submit(verify_chart_version, devpod, expected_chart_version=chart_version),
+            executor.submit(verify_chart_version, common, expected_chart_version=common_chart_version),
+            executor.submit(
+                verify_chart_values,
+                devpod,
+                check_list={
+                    "image.registry": "docker.io",
+                    "image.repository": "tcfwbper/dev-env",
+                },
+            ),  # values.yaml contains these key-values?
+            executor.submit(verify_dependencies, charts=[devpod, common]),  # charts are acyclic?
+        ]
+        for verification in verifications:
+            verification.result()
     helm_package(chart=devpod)
     # helm_push(devpod, repository=remote_chart_private)
 
@@ -12,13 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
 from pathlib import Path
 
-import pandas as pd
-
 from thc_devops_toolkit.documentation.markdown import MarkdownDocumentManager, MarkdownTable
 
-md_example_dir = Path(__file__).resolve().parent
+md_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 md_file = md_example_dir / "my_file.md"
 
 
@@ -34,17 +33,19 @@ def main() -> None:
         {"Project": "THC-DEVOPS-TOOLKIT", "Owner": "Tsung-Han Chang"},
         {"Project": "DEVPOD", "Owner": "Pesci Chang"},
     ]
-    dataframe = pd.DataFrame(sample_data)
-    table = MarkdownTable(table_id="my_projects", dataframe=dataframe)
+    table = MarkdownTable(table_id="my_projects", rows=sample_data)
 
     # Update markdown file
-    doc_manager.lines.append("# My Projects")
-    doc_manager.lines.append("")
+    doc_manager.extend(["# My Projects", ""])
     doc_manager.insert_table(table, len(doc_manager.lines))
-    doc_manager.lines.append("")
-    doc_manager.lines.append("## Notes")
-    doc_manager.lines.append("- There are some useful projects.")
-    doc_manager.lines.append("- Welcome to pull and contribute.")
+    doc_manager.extend(
+        [
+            "",
+            "## Notes",
+            "- There are some useful projects.",
+            "- Welcome to pull and contribute.",
+        ]
+    )
 
     # Update an existing project or insert a new project
     table.upsert_row(data={"Project": "DEVPOD", "Owner": "Tsung-Han Chang"}, primary_key="Project")
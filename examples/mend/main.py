@@ -14,6 +14,7 @@
 # ==============================================================================
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 from thc_devops_toolkit.observability import LogLevel, logger
 from thc_devops_toolkit.security.mend_api_helper import (
@@ -33,12 +34,16 @@ def main() -> None:
 
     refresh_token = get_refresh_token(args.email, args.user_key)
     jwt_token = get_jwt_token(refresh_token)
-    alerts = get_alerts_by_library(args.project_token, jwt_token)
+    # Alerts and vulnerabilities are independent queries, so both requests are in flight at once.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        alerts_future = executor.submit(get_alerts_by_library, args.project_token, jwt_token)
+        vulnerabilities_future = executor.submit(get_vulnerabilities_by_project, args.project_token, jwt_token)
+        alerts = alerts_future.result()
+        vulnerabilities = vulnerabilities_future.result()
     logger.highlight(
         level=LogLevel.DEBUG,
         message=f"Alerts: {alerts}",
     )
-    vulnerabilities = get_vulnerabilities_by_project(args.project_token, jwt_token)
     logger.highlight(
         level=LogLevel.DEBUG,
         message=f"Vulnerabilities: {vulnerabilities}",
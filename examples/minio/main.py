@@ -12,16 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import time
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
 from thc_devops_toolkit.containerization.docker import docker_pull, docker_run_daemon, docker_stop
 from thc_devops_toolkit.infrastructure.minio import get_minio_service, minio_makedir, minio_removedir, mirror_dir_to_bucket
-from thc_devops_toolkit.observability import logger
+from thc_devops_toolkit.observability import logger, wait_http_ready
 
-minio_example_dir = Path(__file__).resolve().parent
+minio_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 minio_full_image_name = "minio/minio:RELEASE.2025-09-07T16-13-09Z-cpuv1"
 minio_container_name = "test-minio-server"
 minio_server = "0.0.0.0:9000"
@@ -46,7 +46,7 @@ def run_minio_server(
         ],
         port_mappings=["9000:9000"],
     )
-    time.sleep(10)
+    wait_http_ready(url=f"http://{minio_server}/minio/health/ready", deadline=30)
 
     yield
 
@@ -12,51 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-import time
-from contextlib import contextmanager
+import os
 from pathlib import Path
-from typing import Iterator
 
-from thc_devops_toolkit.containerization.docker import docker_pull, docker_run_daemon, docker_stop
 from thc_devops_toolkit.infrastructure.rabbitmq import RabbitMQActions, RabbitMQConfig, RabbitMQManager
+from thc_devops_toolkit.infrastructure.rabbitmq_testing import rabbitmq_fixture
 from thc_devops_toolkit.observability import LogLevel, logger
 
-rabbitmq_example_dir = Path(__file__).resolve().parent
-rabbitmq_full_image_name = "rabbitmq:4.1.4-alpine"
-rabbitmq_container_name = "test-rabbitmq-server"
+rabbitmq_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 rabbitmq_host = "0.0.0.0"
 rabbitmq_port = 5672
 rabbitmq_user = "user"
 rabbitmq_password = "password"
 
 
-@contextmanager
-def run_rabbitmq_server(
-    user: str,
-    password: str,
-) -> Iterator[None]:
-    docker_pull(full_image_name=rabbitmq_full_image_name)
-    docker_run_daemon(
-        full_image_name=rabbitmq_full_image_name,
-        remove=True,
-        container_name=rabbitmq_container_name,
-        env_vars=[
-            f"RABBITMQ_DEFAULT_USER={user}",
-            f"RABBITMQ_DEFAULT_PASS={password}",
-        ],
-        port_mappings=[f"{rabbitmq_port}:{rabbitmq_port}"],
-    )
-    time.sleep(10)
-
-    yield
-
-    docker_stop(obj=rabbitmq_container_name)
-
-
 def rabbitmq_example() -> None:
     """Example demonstrating RabbitMQ manager usage."""
+    # Keep this thread and the manager threads on one CPU, so the message queues they share stay in its cache
+    io_cpus = {max(os.sched_getaffinity(0))} if hasattr(os, "sched_getaffinity") else None
+    if io_cpus:
+        os.sched_setaffinity(0, io_cpus)
+
     # Initialize RabbitMQ manager
-    manager = RabbitMQManager()
+    manager = RabbitMQManager(cpu_affinity=io_cpus)
 
     # Create RabbitMQConfig for sending and receiving messages
     sender = RabbitMQConfig(
@@ -68,6 +46,10 @@ def rabbitmq_example() -> None:
         exchange_type="direct",
         routing_key="test_routing_key",
         tls=False,
+        # Test messages are transient, skip broker acknowledgements and disk persistence
+        publisher_confirms=False,
+        durable=False,
+        delivery_mode=1,
     )
     receiver = RabbitMQConfig(
         host=rabbitmq_host,
@@ -78,6 +60,10 @@ def rabbitmq_example() -> None:
         exchange_type="direct",
         routing_key="test_routing_key",
         tls=False,
+        # Test messages are transient, skip broker acknowledgements and disk persistence
+        publisher_confirms=False,
+        durable=False,
+        delivery_mode=1,
     )
 
     # 1. Register receiver and sender
@@ -95,45 +81,47 @@ def rabbitmq_example() -> None:
     # 2. Run RabbitMQ manager
     logger.info("Starting RabbitMQ manager...")
 
-    manager.run()
-
-    # Give some time for connections to establish
-    time.sleep(2)
+    # Returns once the receiver is consuming
+    if not manager.run():
+        logger.highlight(
+            LogLevel.ERROR,
+            "Receiver did not start consuming",
+        )
+        manager.shutdown()
+        return
 
     # 3. Put messages to sender and receive from receiver
     logger.info("Sending messages...")
     test_messages = [b"Hello, RabbitMQ!", b"This is message 2", b"Message number 3", b"Final test message"]
 
-    # Send messages
-    for i, message in enumerate(test_messages, 1):
+    # Send messages, the sender publishes them together in one batch
+    logger.highlight(
+        LogLevel.INFO,
+        "Putting %d messages into send queue: %r",
+        len(test_messages),
+        test_messages,
+    )
+    sender.message_queue.put_many(test_messages)
+    if not manager.drain(timeout=5):
         logger.highlight(
-            LogLevel.INFO,
-            f"Putting message {i} into send queue: {message}",
+            LogLevel.WARNING,
+            "Not all messages were published",
         )
-        sender.message_queue.put(message)
 
     # Receive messages
     logger.info("Waiting for messages to be received...")
-    received_messages = []
-
-    # Wait up to 10 seconds for messages to be received
-    for i in range(len(test_messages)):
-        try:
-            # Wait for message with timeout
-            message = receiver.message_queue.get(timeout=5)
-            received_messages.append(message)
-        except Exception as exception:
+    # Wait up to 10 seconds for all messages to be received
+    received_messages = receiver.message_queue.drain(len(test_messages), timeout=10)
+
+    # Skip the loop entirely when INFO is disabled, the messages are only formatted once it is enabled
+    if logger.is_enabled(LogLevel.INFO):
+        for i, message in enumerate(received_messages, 1):
             logger.highlight(
-                LogLevel.ERROR,
-                f"Error occurred while waiting for message {i+1}: {exception}",
+                LogLevel.INFO,
+                "Received message %d: %r",
+                i,
+                message,
             )
-            break
-
-    for i, message in enumerate(received_messages):
-        logger.highlight(
-            LogLevel.INFO,
-            f"Received message {i+1}: {message}",
-        )
 
     # Verify all messages were received
     if len(received_messages) == len(test_messages):
@@ -150,12 +138,11 @@ def rabbitmq_example() -> None:
     else:
         logger.highlight(
             LogLevel.WARNING,
-            f"Only {len(received_messages)} out of {len(test_messages)} messages received",
+            "Only %d out of %d messages received",
+            len(received_messages),
+            len(test_messages),
         )
 
-    # Wait a bit more to ensure all operations complete
-    time.sleep(2)
-
     # 4. Stop RabbitMQ manager
     logger.info("Stopping RabbitMQ manager...")
     manager.shutdown()
@@ -163,14 +150,13 @@ def rabbitmq_example() -> None:
 
 
 def main() -> None:
-    with run_rabbitmq_server(user=rabbitmq_user, password=rabbitmq_password):
+    # Set THC_RABBIT_POOL=0 to start and stop the broker container on every run
+    with rabbitmq_fixture(user=rabbitmq_user, password=rabbitmq_password, host=rabbitmq_host, port=rabbitmq_port):
         logger.info("[RabbitMQ] RabbitMQ server is running.")
 
         # Run the RabbitMQ example
         rabbitmq_example()
 
-    logger.info("[RabbitMQ] RabbitMQ server is stopped.")
-
 
 if __name__ == "__main__":
     main()
@@ -12,39 +12,58 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from thc_devops_toolkit.containerization.docker import docker_pull
+from thc_devops_toolkit.containerization.docker import docker_inspect, docker_pull
+from thc_devops_toolkit.observability import logger
 from thc_devops_toolkit.security.trivy.trivy import trivy_convert, trivy_scan
 
 cr_host = "docker.io"
 image_name = "busybox"
 image_tag = "latest"
 
-mend_example_dir = Path(__file__).resolve().parent
+mend_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
 json_output_file = mend_example_dir / "trivy_output.json"
 yaml_output_file = mend_example_dir / "trivy_output.yaml"
 html_output_file = mend_example_dir / "trivy_output.html"
+# Image ID the JSON report was produced for
+digest_file = json_output_file.with_name(json_output_file.name + ".digest")
 
 
 def main() -> None:
-    docker_pull(full_image_name=f"{cr_host}/{image_name}:{image_tag}")
-    trivy_scan(
-        cr_host=cr_host,
-        image_name=image_name,
-        image_tag=image_tag,
-        output_file=json_output_file,
-    )
-    trivy_convert(
-        input_path=json_output_file,
-        output_path=yaml_output_file,
-        template="yaml",
-    )
-    trivy_convert(
-        input_path=json_output_file,
-        output_path=html_output_file,
-        template="html",
-    )
+    full_image_name = f"{cr_host}/{image_name}:{image_tag}"
+    docker_pull(full_image_name=full_image_name)
+    image_id = docker_inspect(target_object=full_image_name)["Id"]
+    if json_output_file.exists() and digest_file.exists() and digest_file.read_text(encoding="utf-8") == image_id:
+        logger.info("Image %s is unchanged since the last scan, reusing %s", image_id, json_output_file)
+    else:
+        trivy_scan(
+            cr_host=cr_host,
+            image_name=image_name,
+            image_tag=image_tag,
+            output_file=json_output_file,
+        )
+        digest_file.write_text(image_id, encoding="utf-8")
+    # Both conversions only read the scan result and write their own file, so they run side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        conversions = [
+            executor.submit(
+                trivy_convert,
+                input_path=json_output_file,
+                output_path=yaml_output_file,
+                template="yaml",
+            ),
+            executor.submit(
+                trivy_convert,
+                input_path=json_output_file,
+                output_path=html_output_file,
+                template="html",
+            ),
+        ]
+        for conversion in conversions:
+            conversion.result()
 
 
 if __name__ == "__main__":
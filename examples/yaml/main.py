@@ -12,36 +12,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
 from pathlib import Path
 
 from ruamel.yaml import YAML
 
-from thc_devops_toolkit.utils.yaml import get_value_from_dict, set_value_to_dict
+from thc_devops_toolkit.observability import logger
+from thc_devops_toolkit.utils.yaml import get_value_from_dict, resolve_parent, set_value_to_dict
 
-yaml_example_dir = Path(__file__).resolve().parent
-yaml_file: str = str(yaml_example_dir / "example.yaml")
+yaml_example_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+yaml_file: Path = yaml_example_dir / "example.yaml"
 
 
 def main() -> None:
-    yaml = YAML()
-    with open(yaml_file) as f:
+    # The data is only read and modified in memory, so the libyaml based safe loader is enough
+    yaml = YAML(typ="safe", pure=False)
+    with yaml_file.open("rb") as f:
         data = yaml.load(f)
-    get_value_from_dict(data, key_path="foo.bar[0].baz")
-    set_value_to_dict(data, key_path="foo.bar[0].baz", value="new value")
-    get_value_from_dict(data, key_path="foo.bar[0].baz")
-
-    get_value_from_dict(data, "foo.'complex.key'.baz")
-    set_value_to_dict(data, "foo.'complex.key'.baz", "new complex value")
-    get_value_from_dict(data, "foo.'complex.key'.baz")
-
+    # Each key path is resolved once, the value is then read and written directly on its parent
+    for key_path, value in (
+        ("foo.bar[0].baz", "new value"),
+        ("foo.'complex.key'.baz", "new complex value"),
+        ("foo.nested_array[1][0]", 99),
+    ):
+        parent, key = resolve_parent(data, key_path)
+        logger.info("%s: %s", key_path, parent[key])
+        parent[key] = value
+        logger.info("%s: %s", key_path, parent[key])
+
+    # set_value_to_dict also creates missing containers and list slots
     get_value_from_dict(data, "foo.empty_list")
     set_value_to_dict(data, "foo.empty_list[0]", "first item")
     get_value_from_dict(data, "foo.empty_list")
 
-    get_value_from_dict(data, "foo.nested_array[1][0]")
-    set_value_to_dict(data, "foo.nested_array[1][0]", 99)
-    get_value_from_dict(data, "foo.nested_array[1][0]")
-
 
 if __name__ == "__main__":
     main()
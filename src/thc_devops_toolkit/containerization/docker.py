@@ -17,19 +17,489 @@
 Functions include login, pull, push, build, tag, run, stop, remove, copy, exec, and image inspection utilities.
 """
 
-import json
+import asyncio
+import http.client
+import math
+import os
 import re
+import shlex
+import socket
 import subprocess
+import tempfile
+import threading
 import time
 from collections import deque
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from types import TracebackType
+from typing import Any, NoReturn
+from urllib.parse import quote, urlencode
 
 from thc_devops_toolkit.observability import LogLevel, logger
 
+try:
+    # optional, decodes the daemon's JSON straight from bytes several times faster than the stdlib
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+# number of trailing docker build output lines kept for the error message
+_BUILD_OUTPUT_TAIL_LINES = 50
+
+# registry tokens expire after an hour, logins are reused for 55 minutes
+_LOGIN_TTL = 3300.0
+# (cr_host, username) -> monotonic time until which the last successful login is reused
+_AUTH_CACHE: dict[tuple[str, str], float] = {}
+
+# ANSI escape sequences pasted along with a password, matched on the encoded password
+_ANSI_ESCAPE_RE = re.compile(rb"\x1b\[[0-9;]*[A-Za-z~]")
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# the digest probe runs before every pull, a registry that is slower than this is simply pulled from
+_REGISTRY_TIMEOUT = 1.0
+# registries that rejected an anonymous probe or did not answer it, they are not probed again in the process
+_UNPROBEABLE_REGISTRIES: set[str] = set()
+# key="value" parameters of a WWW-Authenticate challenge
+_AUTH_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
+# manifest lists and OCI indexes first, RepoDigests of multi-platform images refer to them
+_MANIFEST_HEADERS = {
+    "Accept": ", ".join(
+        [
+            "application/vnd.oci.image.index.v1+json",
+            "application/vnd.docker.distribution.manifest.list.v2+json",
+            "application/vnd.oci.image.manifest.v1+json",
+            "application/vnd.docker.distribution.manifest.v2+json",
+        ]
+    )
+}
+
+# registry transfers running at once in this process, more trip registry rate limits
+_MAX_CONCURRENT_TRANSFERS = 5
+_transfer_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_TRANSFERS)
+
+# static argv prefixes of the docker CLI wrappers
+_PULL = ("docker", "pull")
+_PUSH = ("docker", "push")
+_TAG = ("docker", "tag")
+_STOP = ("docker", "stop")
+_RM = ("docker", "rm")
+_RMI = ("docker", "rmi")
+_CP = ("docker", "cp")
+_INSPECT = ("docker", "inspect")
+
+_DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+_ENGINE_TIMEOUT = 30.0
+# one keep-alive Engine API connection per thread, http.client connections are not thread-safe
+_engine_local = threading.local()
+
+
+def _docker_cli_env() -> dict[str, str]:
+    """Builds the environment for docker CLI invocations.
+
+    CLI hints are disabled so that each command only talks to the daemon instead of also running
+    the "What's next" plugin hooks after it completes.
+
+    Returns:
+        dict[str, str]: The environment for the docker CLI process.
+    """
+    return {**os.environ, "DOCKER_CLI_HINTS": "false"}
+
+
+class DockerCommandError(RuntimeError):
+    """A docker CLI command exited with a non-zero code.
+
+    The output is kept as captured and only decoded when the error is displayed.
+
+    Attributes:
+        action (str): Description of the failed operation, e.g. "Failed to pull image: repo/image:tag".
+        cmd (list[str]): The command that failed.
+        returncode (int | None): The exit code of the command.
+        output (bytes | str): The stderr (or, for builds, the end of the combined output) of the command.
+    """
+
+    def __init__(self, action: str, cmd: list[str], returncode: int | None, output: bytes | str) -> None:
+        super().__init__(action, cmd, returncode, output)
+        self.action = action
+        self.cmd = cmd
+        self.returncode = returncode
+        self.output = output
+
+    def __str__(self) -> str:
+        output = self.output.decode("utf-8", errors="replace") if isinstance(self.output, bytes) else self.output
+        return f"{self.action} (exit code: {self.returncode})\n{output}"
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """An HTTP connection to the Docker Engine API over its Unix socket.
+
+    Attributes:
+        socket_path (str): The path of the daemon socket.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = _ENGINE_TIMEOUT) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        """Connects to the daemon socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+    def send_request(self, method: str, path: str) -> tuple[int, bytes]:
+        """Sends a request and reads the whole response.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+
+        Returns:
+            tuple[int, bytes]: The response status and body.
+        """
+        self.request(method, path)
+        response = self.getresponse()
+        return response.status, response.read()
+
+
+def _engine_socket_path() -> str | None:
+    """Finds the local daemon socket the docker CLI would talk to.
+
+    Remote daemons (tcp/ssh hosts or a non-default docker context) are left to the CLI, which knows
+    how to reach them.
+
+    Returns:
+        str | None: The socket path, or None if the daemon is not reachable through a local socket.
+    """
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host:
+        return docker_host.removeprefix("unix://") if docker_host.startswith("unix://") else None
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context is None:
+        config_dir = os.environ.get("DOCKER_CONFIG", os.path.join(os.path.expanduser("~"), ".docker"))
+        try:
+            with open(os.path.join(config_dir, "config.json"), "rb") as config_file:
+                context = _json_loads(config_file.read()).get("currentContext")
+        except (OSError, ValueError):
+            context = None
+    if context not in (None, "", "default"):
+        return None
+    return _DEFAULT_DOCKER_SOCKET if os.path.exists(_DEFAULT_DOCKER_SOCKET) else None
+
+
+def _engine_request(socket_path: str, method: str, path: str) -> tuple[int, bytes]:
+    """Sends a request to the Docker Engine API, reusing this thread's connection.
+
+    A kept-alive connection may have been closed by the daemon in the meantime, so a failed request
+    is retried once on a fresh connection.
+
+    Args:
+        socket_path (str): The path of the daemon socket.
+        method (str): The HTTP method.
+        path (str): The request path.
+
+    Returns:
+        tuple[int, bytes]: The response status and body.
+
+    Raises:
+        OSError: If the daemon cannot be reached.
+        http.client.HTTPException: If the daemon response is malformed.
+    """
+    conn: _UnixHTTPConnection | None = getattr(_engine_local, "conn", None)
+    if conn is not None and conn.socket_path == socket_path:
+        try:
+            return conn.send_request(method, path)
+        except (OSError, http.client.HTTPException):
+            conn.close()
+    conn = _UnixHTTPConnection(socket_path)
+    _engine_local.conn = conn
+    try:
+        return conn.send_request(method, path)
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        _engine_local.conn = None
+        raise
+
+
+def _engine_inspect(target_object: str, kinds: tuple[str, ...] = ("containers", "images")) -> dict[str, Any] | None:
+    """Inspects a container or image through the Docker Engine API.
+
+    Containers are looked up before images, the same order the docker CLI uses.
+
+    Args:
+        target_object (str): The name or ID of the Docker object.
+        kinds (tuple[str, ...], optional): The object kinds to look up, in order. Defaults to containers then images.
+
+    Returns:
+        dict[str, Any] | None: The inspection result, or None if the object was not found or the API
+            is not reachable, in which case the caller falls back to the CLI.
+    """
+    socket_path = _engine_socket_path()
+    if socket_path is None:
+        return None
+    quoted = quote(target_object, safe="/:@")
+    for kind in kinds:
+        try:
+            status, body = _engine_request(socket_path, "GET", f"/{kind}/{quoted}/json")
+        except (OSError, http.client.HTTPException) as exc:
+            logger.debug("Docker Engine API unavailable at %s: %s", socket_path, exc)
+            return None
+        if status == 200:
+            object_info: dict[str, Any] = _json_loads(body)
+            return object_info
+        if status != 404:
+            return None
+    return None
+
+
+def _engine_call(method: str, path: str) -> bool:
+    """Runs a control-plane operation through the Docker Engine API.
+
+    Args:
+        method (str): The HTTP method.
+        path (str): The request path, with the object names already quoted.
+
+    Returns:
+        bool: True if the daemon completed the operation, False if the API is not reachable or the
+            operation failed, in which case the caller runs the docker CLI for the canonical error.
+    """
+    socket_path = _engine_socket_path()
+    if socket_path is None:
+        return False
+    try:
+        status, _ = _engine_request(socket_path, method, path)
+    except (OSError, http.client.HTTPException) as exc:
+        logger.debug("Docker Engine API unavailable at %s: %s", socket_path, exc)
+        return False
+    # 304: the container was already stopped
+    return 200 <= status < 300 or status == 304
+
+
+def _split_image_name(full_image_name: str) -> tuple[str, str, str]:
+    """Splits an image name into registry host, repository and tag the way the docker CLI does.
+
+    Args:
+        full_image_name (str): The image name, e.g. "busybox" or "registry:5000/team/app:1.0".
+
+    Returns:
+        tuple[str, str, str]: The registry host, the repository and the tag.
+    """
+    host, sep, path = full_image_name.partition("/")
+    if not sep or ("." not in host and ":" not in host and host != "localhost"):
+        host, path = "docker.io", full_image_name
+    if host == "docker.io" and "/" not in path:
+        path = f"library/{path}"
+    colon = path.rfind(":")
+    if colon > path.rfind("/"):
+        return host, path[:colon], path[colon + 1 :]
+    return host, path, "latest"
+
+
+def _remote_digest(full_image_name: str) -> str | None:
+    """Resolves the manifest digest of an image tag with a single registry HEAD request.
+
+    Registries that answer with a bearer challenge are retried once with an anonymous token, anything
+    else (private registries, digest references, network errors) yields None. Hosts logged in to with
+    docker_login are private and never probed, registries that refuse anonymous access or cannot be
+    reached are remembered in _UNPROBEABLE_REGISTRIES and not probed again.
+
+    Args:
+        full_image_name (str): The full image name (including tag).
+
+    Returns:
+        str | None: The "sha256:..." digest, or None if it could not be resolved.
+    """
+    import urllib.error  # pylint: disable=import-outside-toplevel
+    import urllib.request  # pylint: disable=import-outside-toplevel
+
+    if "@" in full_image_name:
+        return None
+    host, repository, tag = _split_image_name(full_image_name)
+    registry = "registry-1.docker.io" if host == "docker.io" else host
+    # docker_login may add to _AUTH_CACHE from another thread, iterate over a snapshot
+    if registry in _UNPROBEABLE_REGISTRIES or any(cr_host in (host, registry) for cr_host, _ in list(_AUTH_CACHE)):
+        return None
+    request = urllib.request.Request(f"https://{registry}/v2/{repository}/manifests/{tag}", method="HEAD", headers=_MANIFEST_HEADERS)
+    try:
+        try:
+            with urllib.request.urlopen(request, timeout=_REGISTRY_TIMEOUT) as response:
+                digest: str | None = response.headers.get("Docker-Content-Digest")
+                return digest
+        except urllib.error.HTTPError as exc:
+            challenge = exc.headers.get("WWW-Authenticate", "")
+            if exc.code != 401 or not challenge.startswith("Bearer "):
+                if exc.code in (401, 403):
+                    _UNPROBEABLE_REGISTRIES.add(registry)
+                return None
+        params = dict(_AUTH_PARAM_RE.findall(challenge))
+        realm = params.pop("realm", "")
+        token_url = f"{realm}?{urlencode(params)}"
+        with urllib.request.urlopen(token_url, timeout=_REGISTRY_TIMEOUT) as response:
+            token_info = _json_loads(response.read())
+        request.add_header("Authorization", f"Bearer {token_info.get('token') or token_info.get('access_token')}")
+        with urllib.request.urlopen(request, timeout=_REGISTRY_TIMEOUT) as response:
+            digest = response.headers.get("Docker-Content-Digest")
+            return digest
+    except urllib.error.HTTPError as exc:
+        if exc.code in (401, 403):
+            _UNPROBEABLE_REGISTRIES.add(registry)
+        logger.debug("Could not resolve the registry digest of %s: %s", full_image_name, exc)
+        return None
+    except OSError as exc:
+        # unreachable or firewalled, later pulls should not wait for the timeout again
+        _UNPROBEABLE_REGISTRIES.add(registry)
+        logger.debug("Could not resolve the registry digest of %s: %s", full_image_name, exc)
+        return None
+    except ValueError as exc:
+        logger.debug("Could not resolve the registry digest of %s: %s", full_image_name, exc)
+        return None
+
+
+def _run(
+    cmd: list[str], failure: str, *args: object, check: bool = True, capture_stdout: bool = True
+) -> subprocess.CompletedProcess[bytes]:
+    """Runs a docker CLI command and raises if it fails.
+
+    The failure message is only formatted when the command fails.
+
+    Args:
+        cmd (list[str]): The command to run.
+        failure (str): %-style description of the operation used in the error, e.g. "Failed to pull image: %s".
+        *args (object): Arguments for the failure description.
+        check (bool, optional): Raise on a non-zero exit code. Defaults to True.
+        capture_stdout (bool, optional): Capture stdout, otherwise it is discarded and only stderr gets a pipe.
+            Defaults to True.
+
+    Returns:
+        subprocess.CompletedProcess[bytes]: The finished process.
+
+    Raises:
+        DockerCommandError: If the command fails and check is True.
+    """
+    stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
+    process = subprocess.run(cmd, stdout=stdout, stderr=subprocess.PIPE, check=False, env=_docker_cli_env())
+    if process.returncode != 0 and check:
+        _raise_failure(cmd, process.returncode, process.stderr, failure, args)
+    return process
+
+
+async def _arun(cmd: list[str], failure: str, *args: object, capture_stdout: bool = True) -> bytes:
+    """Runs a docker CLI command without blocking the event loop and raises if it fails.
+
+    Args:
+        cmd (list[str]): The command to run.
+        failure (str): %-style description of the operation used in the error, e.g. "Failed to pull image: %s".
+        *args (object): Arguments for the failure description.
+        capture_stdout (bool, optional): Capture stdout, otherwise it is discarded. Defaults to True.
+
+    Returns:
+        bytes: The captured stdout, empty if it was discarded.
+
+    Raises:
+        DockerCommandError: If the command fails.
+    """
+    stdout_target = asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=stdout_target, stderr=asyncio.subprocess.PIPE, env=_docker_cli_env())
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        _raise_failure(cmd, process.returncode, stderr, failure, args)
+    return stdout or b""
+
+
+async def _arun_transfer(cmd: list[str], failure: str, *args: object) -> None:
+    """Runs a docker pull or push with _arun once one of the process-wide transfer slots is free.
+
+    The slot is waited for in a worker thread, so a queued transfer does not block the event loop.
+
+    Args:
+        cmd (list[str]): The command to run.
+        failure (str): %-style description of the operation used in the error, e.g. "Failed to pull image: %s".
+        *args (object): Arguments for the failure description.
+
+    Raises:
+        DockerCommandError: If the command fails.
+    """
+    acquire = asyncio.ensure_future(asyncio.to_thread(_transfer_slots.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # the worker thread takes the slot anyway, hand it back as soon as it has
+        acquire.add_done_callback(lambda _: _transfer_slots.release())
+        raise
+    try:
+        await _arun(cmd, failure, *args, capture_stdout=False)
+    finally:
+        _transfer_slots.release()
+
+
+def _raise_failure(cmd: list[str], returncode: int | None, stderr: bytes | None, failure: str, args: tuple[object, ...]) -> NoReturn:
+    """Logs and raises the error of a failed docker CLI command.
+
+    Args:
+        cmd (list[str]): The command that failed.
+        returncode (int | None): The exit code of the command.
+        stderr (bytes | None): The captured stderr of the command.
+        failure (str): %-style description of the operation.
+        args (tuple[object, ...]): Arguments for the failure description.
+
+    Raises:
+        DockerCommandError: Always, with the exit code and stderr.
+    """
+    action = failure % args
+    logger.highlight(level=LogLevel.ERROR, message=f"{action} (exit code: {returncode})")
+    raise DockerCommandError(action, cmd, returncode, stderr or b"")
+
+
+@dataclass(frozen=True)
+class ImageRef:
+    """A reference to a Docker image, hashable so it can be used as a dict key.
+
+    Attributes:
+        host (str): The registry host.
+        repo (str): The repository (user or organization) in the registry, may be empty.
+        name (str): The image name.
+        tag (str): The image tag.
+    """
+
+    host: str
+    repo: str
+    name: str
+    tag: str = "latest"
+
+    @cached_property
+    def full(self) -> str:
+        """str: The full image name, built once per reference."""
+        path = f"{self.repo}/{self.name}" if self.repo else self.name
+        return f"{self.host}/{path}:{self.tag}"
+
+    def with_tag(self, tag: str) -> "ImageRef":
+        """Returns a reference to the same image with another tag.
+
+        Args:
+            tag (str): The new tag.
+
+        Returns:
+            ImageRef: The new image reference.
+        """
+        return ImageRef(host=self.host, repo=self.repo, name=self.name, tag=tag)
+
+    def __str__(self) -> str:
+        return self.full
+
 
 def docker_login(cr_host: str, username: str, password: str) -> None:
     """Logs in to a Docker registry.
 
+    A successful login is remembered for the process, repeated calls for the same host and user
+    within the token lifetime return without running ``docker login`` again.
+
     Args:
         cr_host (str): The Docker registry host.
         username (str): The username for authentication.
@@ -38,70 +508,166 @@ def docker_login(cr_host: str, username: str, password: str) -> None:
     Raises:
         RuntimeError: If login fails.
     """
+    cache_key = (cr_host, username)
+    now = time.monotonic()
+    if _AUTH_CACHE.get(cache_key, 0.0) > now:
+        logger.debug("Reusing Docker registry login: %s with user: %s", cr_host, username)
+        return
     logger.info("Logging in to Docker registry: %s with user: %s", cr_host, username)
-    password = re.sub(r"\x1b\[[0-9;]*[A-Za-z~]", "", password)  # Clean ANSI escape codes
+    password_bytes = _ANSI_ESCAPE_RE.sub(b"", password.encode("utf-8"))  # Clean ANSI escape codes
     cmd = ["docker", "login", cr_host, "-u", username, "--password-stdin"]
-    process = subprocess.run(cmd, input=password.encode("utf-8"), capture_output=True, check=False)
+    process = subprocess.run(cmd, input=password_bytes, capture_output=True, check=False, env=_docker_cli_env())
     if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8")
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to login to Docker registry {cr_host}: {process.stderr.decode('utf-8')}",
-        )
-        raise RuntimeError(
-            f"Failed to login to Docker registry {cr_host} (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
+            message=f"Failed to login to Docker registry {cr_host}: {stderr}",
         )
+        raise DockerCommandError(f"Failed to login to Docker registry {cr_host}", cmd, process.returncode, process.stderr)
+    _AUTH_CACHE[cache_key] = now + _LOGIN_TTL
     logger.info("Successfully logged in to Docker registry: %s", cr_host)
 
 
-def docker_pull(full_image_name: str) -> None:
-    """Pulls a Docker image from a registry.
+def _is_up_to_date(full_image_name: str) -> bool:
+    """Checks whether the local image has the digest the registry reports for its tag.
 
     Args:
         full_image_name (str): The full image name (including tag).
 
+    Returns:
+        bool: True if the image is present locally and matches the registry.
+    """
+    local_info = _engine_inspect(full_image_name, kinds=("images",))
+    if not local_info:
+        return False
+    remote_digest = _remote_digest(full_image_name)
+    return bool(remote_digest) and any(digest.endswith(f"@{remote_digest}") for digest in local_info.get("RepoDigests") or [])
+
+
+def docker_pull(full_image_name: str | ImageRef, force: bool = False) -> None:
+    """Pulls a Docker image from a registry.
+
+    If the image is present locally and its digest matches the one the registry reports for the tag,
+    the pull is skipped. The check needs the local daemon socket and a registry that allows anonymous
+    manifest reads and answers within _REGISTRY_TIMEOUT, otherwise the image is pulled.
+    At most _MAX_CONCURRENT_TRANSFERS pulls and pushes run at once in the process.
+
+    Args:
+        full_image_name (str | ImageRef): The full image name (including tag).
+        force (bool, optional): Always run docker pull. Defaults to False.
+
     Raises:
         RuntimeError: If pull fails.
     """
+    if not force and _is_up_to_date(str(full_image_name)):
+        logger.info("Docker image is up to date, skipping pull: %s", full_image_name)
+        return
     logger.info("Pulling Docker image: %s", full_image_name)
-    cmd = ["docker", "pull", full_image_name]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        stderr = process.stderr.decode("utf-8") if process.stderr else ""
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to pull image: {full_image_name} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(f"Failed to pull image: {full_image_name} (exit code: {process.returncode})\n{stderr}")
+    with _transfer_slots:
+        _run([*_PULL, str(full_image_name)], "Failed to pull image: %s", full_image_name, capture_stdout=False)
+    invalidate_inspect_cache()
     logger.info("Successfully pulled Docker image: %s", full_image_name)
 
 
-def docker_push(full_image_name: str) -> None:
+def ensure_image(full_image_name: str | ImageRef) -> bool:
+    """Pulls a Docker image unless it is already present locally.
+
+    Args:
+        full_image_name (str | ImageRef): The full image name (including tag).
+
+    Returns:
+        bool: True if the image was pulled, False if it was already present.
+
+    Raises:
+        RuntimeError: If pull fails.
+    """
+    cmd = ["docker", "image", "inspect", "--format", "{{.Id}}", str(full_image_name)]
+    # only the exit code is needed
+    process = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, env=_docker_cli_env())
+    if process.returncode == 0:
+        logger.info("Docker image already present: %s", full_image_name)
+        return False
+    docker_pull(full_image_name)
+    return True
+
+
+def docker_push(full_image_name: str | ImageRef) -> None:
     """Pushes a Docker image to a registry.
 
+    At most _MAX_CONCURRENT_TRANSFERS pulls and pushes run at once in the process.
+
     Args:
-        full_image_name (str): The full image name (including tag).
+        full_image_name (str | ImageRef): The full image name (including tag).
 
     Raises:
         RuntimeError: If push fails.
     """
     logger.info("Pushing Docker image: %s", full_image_name)
-    cmd = ["docker", "push", full_image_name]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        stderr = process.stderr.decode("utf-8") if process.stderr else ""
+    with _transfer_slots:
+        _run([*_PUSH, str(full_image_name)], "Failed to push image: %s", full_image_name, capture_stdout=False)
+    invalidate_inspect_cache()
+    logger.info("Successfully pushed Docker image: %s", full_image_name)
+
+
+def _run_many(action: str, func: Callable[[str | ImageRef], None], images: list[str | ImageRef], max_workers: int) -> None:
+    """Runs a per-image docker operation for several images concurrently.
+
+    Args:
+        action (str): The operation name used in the error message (e.g., "pull").
+        func (Callable[[str | ImageRef], None]): The per-image operation.
+        images (list[str | ImageRef]): The full image names.
+        max_workers (int): Max concurrent docker CLI invocations.
+
+    Raises:
+        RuntimeError: If the operation fails for any image, listing every failed image.
+    """
+    failures: list[str] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func, image): image for image in images}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except RuntimeError as exception:
+                failures.append(f"{futures[future]}: {exception}")
+    if failures:
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to push image: {full_image_name} (exit code: {process.returncode})",
+            message=f"Failed to {action} {len(failures)} of {len(images)} images",
         )
-        raise RuntimeError(f"Failed to push image: {full_image_name} (exit code: {process.returncode})\n{stderr}")
-    logger.info("Successfully pushed Docker image: %s", full_image_name)
+        raise RuntimeError(f"Failed to {action} {len(failures)} of {len(images)} images\n" + "\n".join(failures))
+
+
+def docker_pull_many(images: list[str | ImageRef], max_workers: int = _MAX_CONCURRENT_TRANSFERS) -> None:
+    """Pulls several Docker images concurrently.
+
+    Args:
+        images (list[str | ImageRef]): The full image names (including tags).
+        max_workers (int, optional): Max concurrent pulls. Defaults to 5.
+
+    Raises:
+        RuntimeError: If any pull fails, after all pulls have finished.
+    """
+    _run_many("pull", docker_pull, images, max_workers)
 
 
-def docker_inspect(target_object: str) -> dict[str, Any]:
+def docker_push_many(images: list[str | ImageRef], max_workers: int = _MAX_CONCURRENT_TRANSFERS) -> None:
+    """Pushes several Docker images concurrently.
+
+    Args:
+        images (list[str | ImageRef]): The full image names (including tags).
+        max_workers (int, optional): Max concurrent pushes. Defaults to 5.
+
+    Raises:
+        RuntimeError: If any push fails, after all pushes have finished.
+    """
+    _run_many("push", docker_push, images, max_workers)
+
+
+def docker_inspect(target_object: str | ImageRef) -> dict[str, Any]:
     """Inspects a Docker object (image or container).
 
     Args:
-        target_object (str): The name or ID of the Docker object.
+        target_object (str | ImageRef): The name or ID of the Docker object.
 
     Returns:
         dict[str, Any]: The inspection result as a dictionary.
@@ -110,98 +676,319 @@ def docker_inspect(target_object: str) -> dict[str, Any]:
         RuntimeError: If inspect fails.
     """
     logger.info("Inspecting Docker object: %s", target_object)
-    cmd = ["docker", "inspect", target_object]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
+    object_info = _engine_inspect(str(target_object))
+    if object_info is not None:
+        return object_info
+    # remote daemons and objects other than containers and images go through the CLI
+    process = _run([*_INSPECT, str(target_object)], "Failed to inspect: %s", target_object)
+    object_info = _json_loads(process.stdout)[0]
+    return object_info
+
+
+@lru_cache(maxsize=256)
+def _inspect_image_cached(full_image_name: str) -> dict[str, Any]:
+    """Inspects an image, memoizing the result until invalidate_inspect_cache is called.
+
+    Args:
+        full_image_name (str): The image name.
+
+    Returns:
+        dict[str, Any]: The inspection result, shared between callers and not to be modified.
+    """
+    return docker_inspect(full_image_name)
+
+
+def invalidate_inspect_cache() -> None:
+    """Forgets memoized image inspect results.
+
+    Pull, push, build, tag and image removal through this module call it themselves; call it after
+    changing images by other means when get_image_digest or get_image_size must see the change.
+    """
+    _inspect_image_cached.cache_clear()
+
+
+def docker_inspect_many(target_objects: list[str | ImageRef]) -> list[dict[str, Any]]:
+    """Inspects several Docker objects at once.
+
+    Objects the Engine API cannot resolve are inspected with a single ``docker inspect`` call for all of
+    them, so N objects cost at most one CLI process instead of N. Pass the results to get_image_size or
+    get_image_digest as image_info.
+
+    Args:
+        target_objects (list[str | ImageRef]): The names or IDs of the Docker objects.
+
+    Returns:
+        list[dict[str, Any]]: The inspection results, in the order of target_objects.
+
+    Raises:
+        RuntimeError: If inspect fails for any object.
+    """
+    logger.info("Inspecting %d Docker objects", len(target_objects))
+    results = [_engine_inspect(str(target_object)) for target_object in target_objects]
+    missing = [str(target_object) for target_object, object_info in zip(target_objects, results) if object_info is None]
+    if missing:
+        process = _run([*_INSPECT, *missing], "Failed to inspect: %s", ", ".join(missing))
+        fallback = iter(_json_loads(process.stdout))
+        results = [object_info if object_info is not None else next(fallback) for object_info in results]
+    return [object_info for object_info in results if object_info is not None]
+
+
+def _stream_build(cmd: list[str], failure: str) -> None:
+    """Runs a BuildKit build command, streaming its output to the debug log.
+
+    Args:
+        cmd (list[str]): The build command.
+        failure (str): Description of the build used in the error, e.g. "Failed to build: repo/image:tag".
+
+    Raises:
+        DockerCommandError: If the build fails, with the end of its output.
+    """
+    # Only the end of the output is kept for the error message
+    output_tail: deque[str] = deque(maxlen=_BUILD_OUTPUT_TAIL_LINES)
+    env = {**_docker_cli_env(), "DOCKER_BUILDKIT": "1"}
+    log_output = logger.is_enabled(LogLevel.DEBUG)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env) as process:
+        for raw_line in process.stdout or []:
+            line = raw_line.decode("utf-8", errors="replace").rstrip()
+            output_tail.append(line)
+            if log_output:
+                logger.debug("%s", line)
+        returncode = process.wait()
+    if returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to inspect: {target_object} (exit code: {process.returncode})",
+            message=f"{failure} (exit code: {returncode})",
         )
-        raise RuntimeError(f"Failed to inspect: {target_object} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
-    object_info: dict[str, Any] = json.loads(str(process.stdout, "UTF-8"))[0]
-    return object_info
+        raise DockerCommandError(failure, cmd, returncode, "\n".join(output_tail))
+    invalidate_inspect_cache()
 
 
-def docker_build(
-    full_image_name: str,
+def docker_build(  # pylint: disable=too-many-arguments
+    full_image_name: str | ImageRef,
     docker_file_path: str,
     build_args: list[dict[str, Any]] | None,
+    cache_from: list[str] | None = None,
+    cache_to: list[str] | None = None,
+    context: str = ".",
+    platform: str | None = None,
+    buildx: bool = False,
 ) -> None:
     """Builds a Docker image from a Dockerfile.
 
+    The build runs with BuildKit, so independent stages build concurrently, and its output is streamed
+    line by line to the debug log instead of being buffered in memory.
+
     Args:
-        full_image_name (str): The full image name to tag.
+        full_image_name (str | ImageRef): The full image name to tag.
         docker_file_path (str): Path to the Dockerfile.
         build_args (list[dict[str, Any]] | None): Build arguments as a list of dicts with 'key' and 'value'.
+        cache_from (list[str] | None, optional): External cache sources (e.g., ["type=registry,ref=repo/image:cache"]).
+            Defaults to None.
+        cache_to (list[str] | None, optional): Cache export destinations (e.g., ["type=inline"]). Defaults to None.
+        context (str, optional): The build context directory. Defaults to ".".
+        platform (str | None, optional): Target platform(s), e.g. "linux/amd64". Defaults to the daemon's platform.
+        buildx (bool, optional): Build with ``docker buildx build --load``, which supports cache exporters
+            other than inline (e.g., "type=registry,ref=repo/image:cache,mode=max"). Defaults to False.
 
     Raises:
         RuntimeError: If build fails.
     """
     logger.info("Building Docker image: %s from %s", full_image_name, docker_file_path)
-    cmd = ["docker", "build"]
-    if build_args:
-        for build_arg in build_args:
-            cmd.extend(["--build-arg", f"{build_arg['key']}={build_arg['value']}"])
-    cmd.extend(["-t", full_image_name])
-    cmd.extend(["-f", docker_file_path])
-    cmd.append(".")
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to build: {full_image_name} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(f"Failed to build: {full_image_name} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
+    # the argv is assembled in one list display
+    cmd = [
+        "docker",
+        *(("buildx", "build", "--load") if buildx else ("build",)),
+        *(("--platform", platform) if platform else ()),
+        *(arg for build_arg in build_args or () for arg in ("--build-arg", f"{build_arg['key']}={build_arg['value']}")),
+        *(arg for cache_source in cache_from or () for arg in ("--cache-from", cache_source)),
+        *(arg for cache_destination in cache_to or () for arg in ("--cache-to", cache_destination)),
+        "-t",
+        str(full_image_name),
+        "-f",
+        docker_file_path,
+        context,
+    ]
+    _stream_build(cmd, f"Failed to build: {full_image_name}")
     logger.info("Successfully built Docker image: %s", full_image_name)
 
 
+def make_builder(docker_file_path: str, arg_keys: list[str], context: str = ".") -> Callable[..., None]:
+    """Prepares docker builds of one Dockerfile that always take the same build arguments.
+
+    The argv skeleton is assembled once, each build only fills in the argument values, which keeps
+    matrix builds of many variants from rebuilding the same command over and over.
+
+    Args:
+        docker_file_path (str): Path to the Dockerfile.
+        arg_keys (list[str]): The build argument names.
+        context (str, optional): The build context directory. Defaults to ".".
+
+    Returns:
+        Callable[..., None]: ``build(full_image_name, **values)`` that builds the image with a value for
+            every build argument name. It raises KeyError if a value is missing and RuntimeError if the
+            build fails.
+    """
+    arg_prefixes = tuple((key, f"{key}=") for key in arg_keys)
+    tail = ("-f", docker_file_path, context)
+
+    def build(full_image_name: str | ImageRef, **values: Any) -> None:
+        logger.info("Building Docker image: %s from %s", full_image_name, docker_file_path)
+        cmd = ["docker", "build"]
+        for key, prefix in arg_prefixes:
+            cmd += ("--build-arg", prefix + str(values[key]))
+        cmd += ("-t", str(full_image_name), *tail)
+        _stream_build(cmd, f"Failed to build: {full_image_name}")
+        logger.info("Successfully built Docker image: %s", full_image_name)
+
+    return build
+
+
+@dataclass
+class BuildSpec:
+    """One image of a docker_build_many call.
+
+    Attributes:
+        full_image_name (str | ImageRef): The full image name to tag.
+        docker_file_path (str): Path to the Dockerfile.
+        build_args (list[dict[str, Any]]): Build arguments as a list of dicts with 'key' and 'value'.
+        context (str): The build context directory.
+    """
+
+    full_image_name: str | ImageRef
+    docker_file_path: str
+    build_args: list[dict[str, Any]] = field(default_factory=list)
+    context: str = "."
+
+
+def _has_buildx() -> bool:
+    """Checks whether the docker buildx plugin is installed.
+
+    Returns:
+        bool: True if ``docker buildx`` is available.
+    """
+    process = subprocess.run(
+        ["docker", "buildx", "version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False, env=_docker_cli_env()
+    )
+    return process.returncode == 0
+
+
+def docker_build_many(specs: list[BuildSpec], push: bool = False, max_workers: int = 4) -> None:
+    """Builds several Docker images in one ``docker buildx bake`` run.
+
+    Bake builds independent targets concurrently and shares one BuildKit cache between them, so common
+    base layers are fetched once. Without buildx the images are built with docker_build (and pushed
+    with docker_push) in a thread pool instead.
+
+    Args:
+        specs (list[BuildSpec]): The images to build.
+        push (bool, optional): Push the images after building, otherwise they are loaded into the local
+            image store. Defaults to False.
+        max_workers (int, optional): Max concurrent builds without buildx. Defaults to 4.
+
+    Raises:
+        RuntimeError: If any build or push fails.
+    """
+    if not specs:
+        return
+    if not _has_buildx():
+        logger.info("docker buildx is not available, building %d images separately", len(specs))
+        by_image = {str(spec.full_image_name): spec for spec in specs}
+
+        def build(image: str | ImageRef) -> None:
+            spec = by_image[str(image)]
+            docker_build(spec.full_image_name, spec.docker_file_path, spec.build_args, context=spec.context)
+            if push:
+                docker_push(spec.full_image_name)
+
+        _run_many("build", build, [spec.full_image_name for spec in specs], max_workers)
+        return
+    import json  # pylint: disable=import-outside-toplevel
+
+    # bake resolves a relative dockerfile against the context, docker build against the working directory
+    targets = {
+        f"target-{index}": {
+            "context": os.path.abspath(spec.context),
+            "dockerfile": os.path.abspath(spec.docker_file_path),
+            "tags": [str(spec.full_image_name)],
+            "args": {str(build_arg["key"]): str(build_arg["value"]) for build_arg in spec.build_args},
+        }
+        for index, spec in enumerate(specs)
+    }
+    bake_file = {"group": {"default": {"targets": list(targets)}}, "target": targets}
+    images = ", ".join(str(spec.full_image_name) for spec in specs)
+    logger.info("Building Docker images with buildx bake: %s", images)
+    with tempfile.NamedTemporaryFile("w", suffix=".json", prefix="docker-bake-", delete=False) as file:
+        json.dump(bake_file, file)
+    try:
+        cmd = ["docker", "buildx", "bake", "-f", file.name, "--progress", "plain", "--push" if push else "--load"]
+        _stream_build(cmd, f"Failed to build: {images}")
+    finally:
+        os.unlink(file.name)
+    logger.info("Successfully built Docker images: %s", images)
+
+
 def docker_tag(
-    source_full_image_name: str,
-    target_full_image_name: str,
+    source_full_image_name: str | ImageRef,
+    target_full_image_name: str | ImageRef,
 ) -> None:
     """Tags a Docker image with a new name.
 
     Args:
-        source_full_image_name (str): The source image name.
-        target_full_image_name (str): The target image name.
+        source_full_image_name (str | ImageRef): The source image name.
+        target_full_image_name (str | ImageRef): The target image name.
 
     Raises:
         RuntimeError: If tagging fails.
     """
     logger.info("Tagging Docker image: %s as %s", source_full_image_name, target_full_image_name)
-    cmd = ["docker", "tag", source_full_image_name, target_full_image_name]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to tag: {target_full_image_name} from {source_full_image_name} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(
-            f"Failed to tag: {target_full_image_name} from {source_full_image_name} (exit code: {process.returncode})\n"
-            f"{str(process.stderr, 'UTF-8')}"
-        )
+    target = str(target_full_image_name)
+    colon = target.rfind(":")
+    repository, tag = (target[:colon], target[colon + 1 :]) if colon > target.rfind("/") else (target, "latest")
+    if _engine_call("POST", f"/images/{quote(str(source_full_image_name), safe='/:@')}/tag?{urlencode({'repo': repository, 'tag': tag})}"):
+        invalidate_inspect_cache()
+        logger.info("Successfully tagged Docker image: %s", target_full_image_name)
+        return
+    _run(
+        [*_TAG, str(source_full_image_name), str(target_full_image_name)],
+        "Failed to tag: %s from %s",
+        target_full_image_name,
+        source_full_image_name,
+        capture_stdout=False,
+    )
+    invalidate_inspect_cache()
     logger.info("Successfully tagged Docker image: %s", target_full_image_name)
 
 
-def docker_run_daemon(  # pylint: disable=too-many-arguments
-    full_image_name: str,
+def docker_run_daemon(  # pylint: disable=too-many-arguments,too-many-branches
+    full_image_name: str | ImageRef,
     remove: bool = False,
     container_name: str | None = None,
     entrypoint: str | None = None,
     command: list[str] | None = None,
     env_vars: list[str] | None = None,
     port_mappings: list[str] | None = None,
+    restart_policy: str | None = None,
+    health_cmd: str | None = None,
+    health_interval: str | None = None,
+    health_timeout: str | None = None,
+    health_retries: int | None = None,
 ) -> str:
     """Runs a Docker image in daemon mode (detached container).
 
     Args:
-        full_image_name (str): The image to run.
+        full_image_name (str | ImageRef): The image to run.
         remove (bool, optional): Remove container after exit. Defaults to False.
         container_name (str | None, optional): Name for the container. Defaults to None.
         entrypoint (str | None, optional): Entrypoint override. Defaults to None.
         command (list[str] | None, optional): Command to run. Defaults to None.
         env_vars (list[str] | None, optional): Environment variables (e.g., ["VAR1=value1", "VAR2=value2"]). Defaults to None.
         port_mappings (list[str] | None, optional): Port mappings (e.g., ["8080:80", "3000:3000"]). Defaults to None.
+        restart_policy (str | None, optional): Restart policy (e.g., "unless-stopped"). Defaults to None.
+        health_cmd (str | None, optional): Healthcheck command run in the container (e.g., "rabbitmq-diagnostics -q ping").
+            Defaults to None.
+        health_interval (str | None, optional): Time between healthchecks (e.g., "500ms"). Defaults to None.
+        health_timeout (str | None, optional): Max time of one healthcheck (e.g., "2s"). Defaults to None.
+        health_retries (int | None, optional): Consecutive failures until unhealthy. Defaults to None.
 
     Returns:
         str: The container ID.
@@ -210,134 +997,201 @@ def docker_run_daemon(  # pylint: disable=too-many-arguments
         RuntimeError: If run fails.
     """
     logger.info("Running Docker image: %s in daemon mode", full_image_name)
-    cmd = ["docker", "run", "-d"]
-    if remove:
-        cmd.append("--rm")
-    if container_name:
-        cmd.extend(["--name", container_name])
-    if env_vars:
-        for env_var in env_vars:
-            cmd.extend(["-e", env_var])
-    if port_mappings:
-        for port_mapping in port_mappings:
-            cmd.extend(["-p", port_mapping])
-    if entrypoint:
-        cmd.extend(["--entrypoint", entrypoint])
-    cmd.append(full_image_name)
-    if command:
-        cmd.extend(command)
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to run image: {full_image_name} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(f"Failed to run image: {full_image_name} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
-    container_id = str(process.stdout, "UTF-8").strip()
+    # the argv is assembled in one list display
+    cmd = [
+        "docker",
+        "run",
+        "-d",
+        *(("--rm",) if remove else ()),
+        *(("--name", container_name) if container_name else ()),
+        *(arg for env_var in env_vars or () for arg in ("-e", env_var)),
+        *(arg for port_mapping in port_mappings or () for arg in ("-p", port_mapping)),
+        *(("--restart", restart_policy) if restart_policy else ()),
+        *(("--health-cmd", health_cmd) if health_cmd else ()),
+        *(("--health-interval", health_interval) if health_interval else ()),
+        *(("--health-timeout", health_timeout) if health_timeout else ()),
+        *(("--health-retries", str(health_retries)) if health_retries is not None else ()),
+        *(("--entrypoint", entrypoint) if entrypoint else ()),
+        str(full_image_name),
+        *(command or ()),
+    ]
+    process = _run(cmd, "Failed to run image: %s", full_image_name)
+    container_id = process.stdout.strip().decode("ascii")
     logger.info("Successfully started container: %s", container_id)
     return container_id
 
 
-def docker_stop(obj: str, timeout: int = 10, poll_interval: float = 1.0) -> None:
+def docker_wait_healthy(obj: str, timeout: float = 60.0, poll_interval: float = 0.1) -> None:
+    """Waits until a container's healthcheck reports healthy.
+
+    Containers without a healthcheck are treated as healthy.
+
+    Args:
+        obj (str): The container name or ID.
+        timeout (float, optional): Max seconds to wait. Defaults to 60.0.
+        poll_interval (float, optional): Seconds between status checks. Defaults to 0.1.
+
+    Raises:
+        RuntimeError: If the container turns unhealthy or is not healthy in time.
+    """
+    logger.info("Waiting for Docker container to be healthy: %s", obj)
+    end = time.monotonic() + timeout
+    while True:
+        health = docker_inspect(obj).get("State", {}).get("Health")
+        status = health.get("Status") if health else "healthy"
+        if status == "healthy":
+            logger.info("Docker container is healthy: %s", obj)
+            return
+        if status == "unhealthy":
+            logger.highlight(
+                level=LogLevel.ERROR,
+                message=f"Docker container {obj} is unhealthy",
+            )
+            raise RuntimeError(f"Docker container {obj} is unhealthy")
+        if time.monotonic() >= end:
+            logger.highlight(
+                level=LogLevel.ERROR,
+                message=f"Timeout waiting for container {obj} to be healthy",
+            )
+            raise RuntimeError(f"Timeout waiting for container {obj} to be healthy")
+        time.sleep(poll_interval)
+
+
+def _wait_for_container_event(obj: str, events: list[str], since: float, until: float) -> bool:
+    """Blocks on the docker events stream until the container emits one of the given events.
+
+    Events since the given time are replayed, so an event emitted before the stream was opened is not missed.
+    The stream is closed by the daemon at the until time.
+
+    Args:
+        obj (str): The container name or ID.
+        events (list[str]): The event actions to wait for (e.g., ["die"]).
+        since (float): Unix timestamp from which events are considered.
+        until (float): Unix timestamp at which to stop waiting.
+
+    Returns:
+        bool: True if one of the events was received, False if the stream ended first.
+    """
+    cmd = ["docker", "events", "--since", f"{since:.3f}", "--until", f"{until:.3f}", "--filter", f"container={obj}"]
+    for event in events:
+        cmd.extend(["--filter", f"event={event}"])
+    cmd.extend(["--format", "{{.Action}}"])
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=_docker_cli_env()) as process:
+        line = process.stdout.readline() if process.stdout else b""
+        process.terminate()
+    return bool(line.strip())
+
+
+def _inspect_state(obj: str) -> str:
+    """Reads only the status of a container, e.g. "running" or "exited".
+
+    The Engine API is asked first; the CLI fallback formats the single field so no inspect JSON has to be parsed.
+
+    Args:
+        obj (str): The container name or ID.
+
+    Returns:
+        str: The container status, or an empty string if the container does not exist.
+    """
+    socket_path = _engine_socket_path()
+    if socket_path is not None:
+        try:
+            status, body = _engine_request(socket_path, "GET", f"/containers/{quote(obj)}/json")
+        except (OSError, http.client.HTTPException) as exc:
+            logger.debug("Docker Engine API unavailable at %s: %s", socket_path, exc)
+            status = 0
+        if status == 200:
+            container_status: str = _json_loads(body).get("State", {}).get("Status", "")
+            return container_status
+        if status == 404:
+            return ""
+    process = subprocess.run(
+        [*_INSPECT, "--type", "container", "--format", "{{.State.Status}}", obj],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        env=_docker_cli_env(),
+    )
+    if process.returncode != 0:
+        return ""
+    return process.stdout.strip().decode("ascii", errors="replace")
+
+
+def docker_stop(obj: str, timeout: int = 10, poll_interval: float = 1.0) -> None:  # pylint: disable=unused-argument
     """Stops a running Docker container or object and waits until it is stopped.
 
+    Instead of polling, the container state is checked once and the docker events stream is used to wait for the
+    container to die if it is still running.
+
     Args:
         obj (str): The container or object name/ID.
         timeout (int, optional): Max seconds to wait for stop. Defaults to 10.
-        poll_interval (float, optional): Seconds between status checks. Defaults to 1.0.
+        poll_interval (float, optional): Unused, kept for backward compatibility. Defaults to 1.0.
 
     Raises:
         RuntimeError: If stop fails or container does not stop in time.
     """
     logger.info("Stopping Docker object: %s", obj)
-    cmd = ["docker", "stop", obj]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
+    start = time.time()
+    if not _engine_call("POST", f"/containers/{quote(obj)}/stop"):
+        _run([*_STOP, obj], "Failed to stop: %s", obj, capture_stdout=False)
+    # Wait until container is actually stopped; a missing container counts as stopped
+    stopped = _inspect_state(obj) in ("", "exited")
+    if not stopped and not _wait_for_container_event(obj, ["die"], since=start, until=time.time() + timeout):
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to stop: {obj} (exit code: {process.returncode})",
+            message=f"Timeout waiting for container {obj} to stop",
         )
-        raise RuntimeError(f"Failed to stop: {obj} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
-    # Wait until container is actually stopped
-    start = time.time()
-    while True:
-        try:
-            info = docker_inspect(obj)
-            state = info.get("State", {})
-            if state.get("Status") == "exited":
-                break
-        except Exception:  # pylint: disable=broad-except
-            # If inspect fails, maybe container is gone
-            break
-        if time.time() - start > timeout:
-            logger.highlight(
-                level=LogLevel.ERROR,
-                message=f"Timeout waiting for container {obj} to stop",
-            )
-            raise RuntimeError(f"Timeout waiting for container {obj} to stop")
-        time.sleep(poll_interval)
+        raise RuntimeError(f"Timeout waiting for container {obj} to stop")
     logger.info("Successfully stopped Docker object: %s", obj)
 
 
-def docker_remove(obj: str, ignore_errors: bool = False, timeout: int = 10, poll_interval: float = 1.0) -> None:
+def docker_remove(  # pylint: disable=unused-argument
+    obj: str, ignore_errors: bool = False, timeout: int = 10, poll_interval: float = 1.0
+) -> None:
     """Removes a Docker container and waits until it is removed.
 
+    Instead of polling, the container is inspected once and the docker events stream is used to wait for the
+    container to be destroyed if it still exists.
+
     Args:
         obj (str): The container name or ID.
         ignore_errors (bool, optional): Ignore errors if True. Defaults to False.
-        timeout (int, optional): Max seconds to wait for removal. Defaults to 30.
-        poll_interval (float, optional): Seconds between status checks. Defaults to 1.0.
+        timeout (int, optional): Max seconds to wait for removal. Defaults to 10.
+        poll_interval (float, optional): Unused, kept for backward compatibility. Defaults to 1.0.
 
     Raises:
         RuntimeError: If remove fails and ignore_errors is False, or container not removed in time.
     """
     logger.info("Removing Docker container: %s", obj)
-    cmd = ["docker", "rm", obj]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0 and not ignore_errors:
+    start = time.time()
+    if not _engine_call("DELETE", f"/containers/{quote(obj)}"):
+        _run([*_RM, obj], "Failed to remove: %s", obj, check=not ignore_errors, capture_stdout=False)
+    # Wait until container is actually removed
+    removed = not _inspect_state(obj)
+    if not removed and not _wait_for_container_event(obj, ["destroy"], since=start, until=time.time() + timeout):
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to remove: {obj} (exit code: {process.returncode})",
+            message=f"Timeout waiting for container {obj} to be removed",
         )
-        raise RuntimeError(f"Failed to remove: {obj} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
-    # Wait until container is actually removed
-    start = time.time()
-    while True:
-        try:
-            docker_inspect(obj)
-        except Exception:  # pylint: disable=broad-except
-            # If inspect fails, container is gone
-            break
-        if time.time() - start > timeout:
-            logger.highlight(
-                level=LogLevel.ERROR,
-                message=f"Timeout waiting for container {obj} to be removed",
-            )
-            if not ignore_errors:
-                raise RuntimeError(f"Timeout waiting for container {obj} to be removed")
-            break
-        time.sleep(poll_interval)
+        if not ignore_errors:
+            raise RuntimeError(f"Timeout waiting for container {obj} to be removed")
     logger.info("Successfully removed Docker container: %s", obj)
 
 
-def docker_remove_image(full_image_name: str) -> None:
+def docker_remove_image(full_image_name: str | ImageRef) -> None:
     """Removes a Docker image.
 
     Args:
-        full_image_name (str): The full image name.
+        full_image_name (str | ImageRef): The full image name.
 
     Raises:
         RuntimeError: If remove fails.
     """
     logger.info("Removing Docker image: %s", full_image_name)
-    cmd = ["docker", "rmi", full_image_name]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to remove image: {full_image_name} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(f"Failed to remove image: {full_image_name} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
+    if not _engine_call("DELETE", f"/images/{quote(str(full_image_name), safe='/:@')}"):
+        _run([*_RMI, str(full_image_name)], "Failed to remove image: %s", full_image_name, capture_stdout=False)
+    invalidate_inspect_cache()
     logger.info("Successfully removed Docker image: %s", full_image_name)
 
 
@@ -352,22 +1206,128 @@ def docker_copy(source: str, target: str) -> None:
         RuntimeError: If copy fails.
     """
     logger.info("Copying from %s to %s", source, target)
-    cmd = ["docker", "cp", source, target]
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
-        logger.highlight(
-            level=LogLevel.ERROR,
-            message=f"Failed to copy {source} to {target} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(f"Failed to copy {source} to {target} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
+    _run([*_CP, source, target], "Failed to copy %s to %s", source, target, capture_stdout=False)
     logger.info("Successfully copied from %s to %s", source, target)
 
 
+class DockerExecSession:
+    """A long-lived shell inside a running container that runs commands without a new ``docker exec`` each.
+
+    ``docker exec -i <obj> sh`` is started once, every command is written to the shell's stdin and its
+    output is framed with a random end marker that carries the exit code. Commands run with stdin from
+    /dev/null so they cannot consume the command stream. A session is not thread-safe.
+
+    Attributes:
+        obj (str): Container name or ID.
+        workdir (str | None): Working directory of the shell inside the container.
+    """
+
+    def __init__(self, obj: str, workdir: str | None = None) -> None:
+        self.obj = obj
+        self.workdir = workdir
+        cmd = ["docker", "exec", "-i", *(("-w", workdir) if workdir else ()), obj, "sh"]
+        logger.info("Opening docker exec session in container: %s at %s", obj, workdir)
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            env=_docker_cli_env(),
+        )
+
+    def __enter__(self) -> "DockerExecSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def run(self, command: list[str]) -> tuple[int, bytes, bytes]:
+        """Runs a command in the session shell.
+
+        Args:
+            command (list[str]): The command to execute.
+
+        Returns:
+            tuple[int, bytes, bytes]: The exit code, stdout and stderr of the command.
+
+        Raises:
+            RuntimeError: If the session shell has exited.
+        """
+        marker = os.urandom(16).hex()
+        script = f"{shlex.join(command)} </dev/null; printf '{marker}%d\\n' $?; printf '{marker}\\n' >&2\n"
+        if self._process.stdin is None or self._process.stdin.closed or self._process.stdout is None or self._process.stderr is None:
+            raise RuntimeError(f"docker exec session at {self.obj} is closed")
+        try:
+            self._process.stdin.write(script.encode("utf-8"))
+        except BrokenPipeError as exc:
+            raise RuntimeError(f"docker exec session at {self.obj} has exited (exit code: {self._process.poll()})") from exc
+        stdout_fd = self._process.stdout.fileno()
+        frames = self._read_frames([stdout_fd, self._process.stderr.fileno()], marker.encode("ascii"))
+        stdout, trailer = frames[stdout_fd]
+        return int(trailer), stdout, frames[self._process.stderr.fileno()][0]
+
+    def _read_frames(self, fds: list[int], marker: bytes) -> dict[int, tuple[bytes, bytes]]:
+        """Reads each stream up to the end marker line.
+
+        Both streams are read as they become ready so a command filling one pipe cannot block the shell
+        while the other is being waited on.
+
+        Args:
+            fds (list[int]): The file descriptors to read.
+            marker (bytes): The end marker.
+
+        Returns:
+            dict[int, tuple[bytes, bytes]]: The output before the marker and the rest of the marker line
+                for each file descriptor.
+
+        Raises:
+            RuntimeError: If the session shell exits before writing the marker.
+        """
+        import selectors  # pylint: disable=import-outside-toplevel
+
+        buffers = {fd: bytearray() for fd in fds}
+        frames: dict[int, tuple[bytes, bytes]] = {}
+        with selectors.DefaultSelector() as selector:
+            for fd in fds:
+                selector.register(fd, selectors.EVENT_READ)
+            while len(frames) < len(fds):
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        raise RuntimeError(f"docker exec session at {self.obj} has exited (exit code: {self._process.wait()})")
+                    buffer = buffers[key.fd]
+                    buffer += chunk
+                    # only the tail can hold the marker line: the new chunk plus a marker and exit code split off before it
+                    start = buffer.find(marker, max(0, len(buffer) - len(chunk) - len(marker) - 8))
+                    end = buffer.find(b"\n", start) if start != -1 else -1
+                    if end != -1:
+                        frames[key.fd] = (bytes(buffer[:start]), bytes(buffer[start + len(marker) : end]))
+                        selector.unregister(key.fd)
+        return frames
+
+    def close(self) -> None:
+        """Ends the session shell and waits for it to exit."""
+        if self._process.stdin is not None and not self._process.stdin.closed:
+            self._process.stdin.close()
+        self._process.wait()
+        for stream in (self._process.stdout, self._process.stderr):
+            if stream is not None:
+                stream.close()
+        logger.info("Closed docker exec session in container: %s", self.obj)
+
+
 def docker_exec(
     command: list[str] | None = None,
     workdir: str | None = None,
     obj: str | None = None,
     print_output: bool = False,
+    session: DockerExecSession | None = None,
 ) -> None:
     """Executes a command inside a running Docker container.
 
@@ -376,60 +1336,65 @@ def docker_exec(
         workdir (str | None, optional): Working directory inside the container.
         obj (str | None, optional): Container name or ID.
         print_output (bool, optional): Print command output. Defaults to False.
+        session (DockerExecSession | None, optional): Runs the command in this session instead of a new
+            ``docker exec``, obj and workdir are then taken from the session. Defaults to None.
 
     Raises:
         ValueError: If command is not provided.
         RuntimeError: If exec fails.
     """
-    logger.info(
-        "Executing command in Docker container: %s at %s: %s",
-        obj,
-        workdir,
-        " ".join(command) if command else "",
-    )
-    cmd = ["docker", "exec"]
-    if workdir:
-        cmd.extend(["-w", workdir])
-    if obj:
-        cmd.append(obj)
+    if session is not None:
+        obj, workdir = session.obj, session.workdir
+    if logger.is_enabled(LogLevel.INFO):
+        logger.info(
+            "Executing command in Docker container: %s at %s: %s",
+            obj,
+            workdir,
+            " ".join(command) if command else "",
+        )
     if not command:
         logger.highlight(
             level=LogLevel.ERROR,
             message="Must pass command while docker exec",
         )
         raise ValueError("Must pass command while docker exec")
-    cmd.extend(command)
-    process = subprocess.run(cmd, capture_output=True, check=False)
-    if process.returncode != 0:
+    if session is not None:
+        cmd = command
+        returncode, stdout, stderr = session.run(command)
+    else:
+        cmd = ["docker", "exec", *(("-w", workdir) if workdir else ()), *((obj,) if obj else ()), *command]
+        process = subprocess.run(cmd, capture_output=True, check=False, env=_docker_cli_env())
+        returncode, stdout, stderr = process.returncode, process.stdout, process.stderr
+    if returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to exec {command} at {obj}:{workdir} (exit code: {process.returncode})",
-        )
-        raise RuntimeError(
-            f"Failed to exec {command} at {obj}:{workdir} (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
+            message=f"Failed to exec {command} at {obj}:{workdir} (exit code: {returncode})",
         )
+        raise DockerCommandError(f"Failed to exec {command} at {obj}:{workdir}", cmd, returncode, stderr)
     # print output?
-    if print_output:
-        if process.stdout:
+    if print_output and logger.is_enabled(LogLevel.INFO):
+        if stdout:
             logger.info("STDOUT from command %s at %s:%s", " ".join(command), obj, workdir)
             logger.highlight(
                 level=LogLevel.INFO,
-                message=process.stdout.decode("utf-8"),
+                message=stdout.decode("utf-8"),
             )
-        if process.stderr:
+        if stderr:
             logger.info("STDERR from command %s at %s:%s", " ".join(command), obj, workdir)
             logger.highlight(
                 level=LogLevel.INFO,
-                message=process.stderr.decode("utf-8"),
+                message=stderr.decode("utf-8"),
             )
 
 
-def get_image_digest(full_image_name: str, precision: int = 6) -> str:
+def get_image_digest(full_image_name: str | ImageRef, precision: int = 6, image_info: dict[str, Any] | None = None) -> str:
     """Gets the image digest (sha256) of a Docker image.
 
     Args:
-        full_image_name (str): The image name.
+        full_image_name (str | ImageRef): The image name.
         precision (int, optional): Number of characters to return. Defaults to 6.
+        image_info (dict[str, Any] | None, optional): A previous docker_inspect result for the image.
+            The image is inspected, memoized until invalidate_inspect_cache, if None. Defaults to None.
 
     Returns:
         str: The image digest prefix.
@@ -443,35 +1408,34 @@ def get_image_digest(full_image_name: str, precision: int = 6) -> str:
             message="Precision must be between 6 and 64",
         )
         raise ValueError("Precision must be between 6 and 64")
-    image_info = docker_inspect(full_image_name)
+    if image_info is None:
+        image_info = _inspect_image_cached(str(full_image_name))
     if not image_info["RepoDigests"]:
         logger.highlight(
             level=LogLevel.WARNING,
             message=f"No RepoDigests found for image: {full_image_name}",
         )
         return ""
-    digest = image_info["RepoDigests"][0].split("sha256:")
-    if len(digest) < 2:
+    # RepoDigests entries are "<repo>@sha256:<hex>"
+    repo_digest: str = image_info["RepoDigests"][0]
+    start = repo_digest.rfind("sha256:")
+    if start < 0:
         logger.highlight(
             level=LogLevel.WARNING,
             message=f"Digest format error for image: {full_image_name}",
         )
         return ""
-    full_digest = digest[1]
-    if not isinstance(full_digest, str):
-        logger.highlight(
-            level=LogLevel.WARNING,
-            message=f"Digest is not a string for image: {full_image_name}",
-        )
-        return ""
-    return full_digest[:precision]
+    start += len("sha256:")
+    return repo_digest[start : start + precision]
 
 
-def get_image_size(full_image_name: str) -> str:
+def get_image_size(full_image_name: str | ImageRef, image_info: dict[str, Any] | None = None) -> str:
     """Gets the size of a Docker image in human-readable format.
 
     Args:
-        full_image_name (str): The image name.
+        full_image_name (str | ImageRef): The image name.
+        image_info (dict[str, Any] | None, optional): A previous docker_inspect result for the image.
+            The image is inspected, memoized until invalidate_inspect_cache, if None. Defaults to None.
 
     Returns:
         str: The image size as a string.
@@ -479,7 +1443,8 @@ def get_image_size(full_image_name: str) -> str:
     Raises:
         KeyError: If size key is not found in inspect output.
     """
-    image_info = docker_inspect(full_image_name)
+    if image_info is None:
+        image_info = _inspect_image_cached(str(full_image_name))
     size_key = "Size"
     if size_key not in image_info:
         logger.highlight(
@@ -488,10 +1453,112 @@ def get_image_size(full_image_name: str) -> str:
         )
         raise KeyError(f"Key '{size_key}' not found in docker inspect output")
     image_size = float(image_info[size_key])
-    units = deque(["B", "KB", "MB", "GB", "TB", "PB"])
-    while image_size > 1000 and len(units) > 1:
-        image_size /= 1000.0
-        units.popleft()
+    unit_index = 0
+    if image_size > 1000:
+        unit_index = min(int(math.log10(image_size) // 3), len(_SIZE_UNITS) - 1)
+        # a unit is only used once the size exceeds it, 1000B stays in bytes
+        if image_size <= 1000.0**unit_index:
+            unit_index -= 1
+        image_size /= 1000.0**unit_index
     precision = 0 if image_size > 100 else 1 if image_size > 10 else 2
-    unit = units.popleft() if units else "B"
-    return f"{image_size:.{precision}f}{unit}"
+    return f"{image_size:.{precision}f}{_SIZE_UNITS[unit_index]}"
+
+
+def get_image_metadata(full_image_name: str | ImageRef, precision: int = 6) -> tuple[str, str]:
+    """Gets the image digest and the human-readable size of a Docker image from a single inspect.
+
+    Args:
+        full_image_name (str | ImageRef): The image name.
+        precision (int, optional): Number of digest characters to return. Defaults to 6.
+
+    Returns:
+        tuple[str, str]: The image digest prefix and the image size, see get_image_digest and get_image_size.
+
+    Raises:
+        ValueError: If precision is out of range.
+        KeyError: If size key is not found in inspect output.
+    """
+    image_info = _inspect_image_cached(str(full_image_name))
+    return (
+        get_image_digest(full_image_name, precision=precision, image_info=image_info),
+        get_image_size(full_image_name, image_info=image_info),
+    )
+
+
+async def adocker_pull(full_image_name: str | ImageRef, force: bool = False) -> None:
+    """Pulls a Docker image from a registry without blocking the event loop, see docker_pull.
+
+    Args:
+        full_image_name (str | ImageRef): The full image name (including tag).
+        force (bool, optional): Always run docker pull. Defaults to False.
+
+    Raises:
+        RuntimeError: If pull fails.
+    """
+    if not force and await asyncio.to_thread(_is_up_to_date, str(full_image_name)):
+        logger.info("Docker image is up to date, skipping pull: %s", full_image_name)
+        return
+    logger.info("Pulling Docker image: %s", full_image_name)
+    await _arun_transfer([*_PULL, str(full_image_name)], "Failed to pull image: %s", full_image_name)
+    invalidate_inspect_cache()
+    logger.info("Successfully pulled Docker image: %s", full_image_name)
+
+
+async def adocker_push(full_image_name: str | ImageRef) -> None:
+    """Pushes a Docker image to a registry without blocking the event loop.
+
+    At most _MAX_CONCURRENT_TRANSFERS pulls and pushes run at once in the process.
+
+    Args:
+        full_image_name (str | ImageRef): The full image name (including tag).
+
+    Raises:
+        RuntimeError: If push fails.
+    """
+    logger.info("Pushing Docker image: %s", full_image_name)
+    await _arun_transfer([*_PUSH, str(full_image_name)], "Failed to push image: %s", full_image_name)
+    invalidate_inspect_cache()
+    logger.info("Successfully pushed Docker image: %s", full_image_name)
+
+
+async def adocker_tag(source_full_image_name: str | ImageRef, target_full_image_name: str | ImageRef) -> None:
+    """Tags a Docker image with a new name without blocking the event loop.
+
+    Args:
+        source_full_image_name (str | ImageRef): The source image name.
+        target_full_image_name (str | ImageRef): The target image name.
+
+    Raises:
+        RuntimeError: If tagging fails.
+    """
+    logger.info("Tagging Docker image: %s as %s", source_full_image_name, target_full_image_name)
+    await _arun(
+        [*_TAG, str(source_full_image_name), str(target_full_image_name)],
+        "Failed to tag: %s from %s",
+        target_full_image_name,
+        source_full_image_name,
+        capture_stdout=False,
+    )
+    invalidate_inspect_cache()
+    logger.info("Successfully tagged Docker image: %s", target_full_image_name)
+
+
+async def adocker_inspect(target_object: str | ImageRef) -> dict[str, Any]:
+    """Inspects a Docker object (image or container) without blocking the event loop, see docker_inspect.
+
+    Args:
+        target_object (str | ImageRef): The name or ID of the Docker object.
+
+    Returns:
+        dict[str, Any]: The inspection result as a dictionary.
+
+    Raises:
+        RuntimeError: If inspect fails.
+    """
+    logger.info("Inspecting Docker object: %s", target_object)
+    object_info = await asyncio.to_thread(_engine_inspect, str(target_object))
+    if object_info is not None:
+        return object_info
+    stdout = await _arun([*_INSPECT, str(target_object)], "Failed to inspect: %s", target_object)
+    object_info = _json_loads(stdout)[0]
+    return object_info
@@ -17,11 +17,15 @@
 Functions include login, pull, push, package, verify chart versions/values, and dependency checking utilities.
 """
 
+import asyncio
 import os
 import re
 import subprocess
-from collections import defaultdict
+import threading
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -30,11 +34,58 @@ from ruamel.yaml import YAML
 from thc_devops_toolkit.observability import LogLevel, logger
 from thc_devops_toolkit.utils.yaml import get_value_from_dict
 
+_ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z~]")
 
-@dataclass
+# YAML instances keep parser state and are not thread-safe, so one loader is kept per thread
+_yaml_local = threading.local()
+
+
+def _safe_yaml() -> YAML:
+    """Returns this thread's safe YAML loader, creating it on first use.
+
+    Returns:
+        YAML: The loader. pure=False selects the libyaml based parser from ruamel.yaml.clib when it is installed.
+    """
+    loader: YAML | None = getattr(_yaml_local, "loader", None)
+    if loader is None:
+        loader = _yaml_local.loader = YAML(typ="safe", pure=False)
+    return loader
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_file(path: str, mtime_ns: int, size: int) -> Any:  # pylint: disable=unused-argument
+    """Parses a YAML file, memoized on the file path and its stat signature.
+
+    Args:
+        path (str): Path to the YAML file.
+        mtime_ns (int): The file modification time, so that an edited file is parsed again.
+        size (int): The file size, so that an edit within the mtime granularity is parsed again.
+
+    Returns:
+        Any: The parsed YAML document. It is shared between callers and must not be mutated.
+    """
+    return _safe_yaml().load(Path(path))
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parses a YAML file, reusing the result while the file is unchanged.
+
+    Args:
+        path (Path): Path to the YAML file.
+
+    Returns:
+        Any: The parsed YAML document. It is shared between callers and must not be mutated.
+    """
+    stat = path.stat()
+    return _load_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(slots=True, frozen=True)
 class Chart:
     """Represents a Helm chart and its metadata.
 
+    Instances are immutable and slotted; build a new Chart (e.g. with dataclasses.replace) to change a field.
+
     Attributes:
         name (str): The chart name.
         version (str): The chart version.
@@ -67,7 +118,6 @@ class Chart:
         chart_root = Path(path_prefix) / name
         chart_yaml: Path = chart_root / "Chart.yaml"
         values_yaml: Path = chart_root / "values.yaml"
-        yaml = YAML(typ="safe")
 
         if not chart_yaml.is_file():
             raise FileNotFoundError(f"Chart.yaml not found at {chart_yaml}")
@@ -75,7 +125,7 @@ class Chart:
             raise FileNotFoundError(f"values.yaml not found at {values_yaml}")
 
         # Load Chart.yaml
-        chart_data = yaml.load(chart_yaml)
+        chart_data = _load_yaml(chart_yaml)
         if not chart_data or "version" not in chart_data:
             raise ValueError(f"Chart version not found in {chart_yaml}")
         version = chart_data["version"]
@@ -93,6 +143,15 @@ class Chart:
         )
 
 
+def _helm_env() -> dict[str, str]:
+    """Returns the environment for helm commands, with OCI registry support enabled.
+
+    Returns:
+        dict[str, str]: A copy of the process environment with HELM_EXPERIMENTAL_OCI set.
+    """
+    return {**os.environ, "HELM_EXPERIMENTAL_OCI": "1"}
+
+
 def helm_login(cr_host: str, username: str, password: str) -> None:
     """Logs in to a Helm registry.
 
@@ -105,17 +164,17 @@ def helm_login(cr_host: str, username: str, password: str) -> None:
         RuntimeError: If login fails.
     """
     logger.info("Logging in to Helm registry: %s", cr_host)
-    password = re.sub(r"\x1b\[[0-9;]*[A-Za-z~]", "", password)  # Clean ANSI escape codes
+    password = _ANSI_ESCAPE_RE.sub("", password)  # Clean ANSI escape codes
     cmd = ["helm", "registry", "login", cr_host, "-u", username, "--password-stdin"]
-    env = os.environ.copy()
-    env["HELM_EXPERIMENTAL_OCI"] = "1"
-    process = subprocess.run(cmd, input=password.encode("utf-8"), capture_output=True, check=False, env=env)
+    process = subprocess.run(cmd, input=password.encode("utf-8"), capture_output=True, check=False, env=_helm_env())
     if process.returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
             message=f"Failed to login to Helm registry {cr_host} (exit code: {process.returncode})",
         )
-        raise RuntimeError(f"Failed to login to Helm registry {cr_host} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}")
+        raise RuntimeError(
+            f"Failed to login to Helm registry {cr_host} (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
+        )
     logger.info("Successfully logged in to Helm registry: %s", cr_host)
 
 
@@ -134,16 +193,14 @@ def helm_pull(remote_chart: str, version: str, untar: bool = False) -> None:
     cmd = ["helm", "pull", remote_chart, "--version", version]
     if untar:
         cmd.append("--untar")
-    env = os.environ.copy()
-    env["HELM_EXPERIMENTAL_OCI"] = "1"
-    process = subprocess.run(cmd, capture_output=True, check=False, env=env)
+    process = subprocess.run(cmd, capture_output=True, check=False, env=_helm_env())
     if process.returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
             message=f"Failed to pull '{remote_chart}' with version {version} (exit code: {process.returncode})",
         )
         raise RuntimeError(
-            f"Failed to pull '{remote_chart}' with version {version} (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}"
+            f"Failed to pull '{remote_chart}' with version {version} (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
         )
     logger.info("Successfully pulled Helm chart: %s", remote_chart)
 
@@ -160,16 +217,14 @@ def helm_package(chart: Chart) -> None:
     chart_path = str(Path(chart.path_prefix) / chart.name)
     logger.info("Packaging Helm chart at path: %s", chart_path)
     cmd = ["helm", "package", chart_path]
-    env = os.environ.copy()
-    env["HELM_EXPERIMENTAL_OCI"] = "1"
-    process = subprocess.run(cmd, capture_output=True, check=False, env=env)
+    process = subprocess.run(cmd, capture_output=True, check=False, env=_helm_env())
     if process.returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
             message=f"Failed to package Helm chart at path '{chart_path}' (exit code: {process.returncode})",
         )
         raise RuntimeError(
-            f"Failed to package Helm chart on path '{chart_path}' (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}"
+            f"Failed to package Helm chart on path '{chart_path}' (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
         )
     logger.info("Successfully packaged Helm chart: %s", chart.name)
 
@@ -187,20 +242,154 @@ def helm_push(chart: Chart, repository: str) -> None:
     tgz_file = chart.name + "-" + chart.version + ".tgz"
     logger.info("Pushing Helm chart %s to repository: %s", tgz_file, repository)
     cmd = ["helm", "push", tgz_file, repository]
-    env = os.environ.copy()
-    env["HELM_EXPERIMENTAL_OCI"] = "1"
-    process = subprocess.run(cmd, capture_output=True, check=False, env=env)
+    process = subprocess.run(cmd, capture_output=True, check=False, env=_helm_env())
+    if process.returncode != 0:
+        message = f"Failed to push '{tgz_file}' to '{repository}' (exit code: {process.returncode})\n{process.stderr.decode('utf-8')}"
+        logger.highlight(level=LogLevel.ERROR, message=message)
+        raise RuntimeError(message)
+    logger.info("Successfully pushed Helm chart: %s", tgz_file)
+
+
+async def _ahelm_run(cmd: list[str], failure: str) -> None:
+    """Runs a helm command without blocking the event loop and raises if it fails.
+
+    Args:
+        cmd (list[str]): The command to run.
+        failure (str): Description of the operation used in the error, e.g. "Failed to pull 'chart' with version 1.0.0".
+
+    Raises:
+        RuntimeError: If the command fails.
+    """
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE, env=_helm_env())
+    _, stderr = await process.communicate()
     if process.returncode != 0:
         logger.highlight(
             level=LogLevel.ERROR,
-            message=f"Failed to push '{tgz_file}' to '{repository}' (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}",
-        )
-        raise RuntimeError(
-            f"Failed to push '{tgz_file}' to '{repository}' (exit code: {process.returncode})\n{str(process.stderr, 'UTF-8')}"
+            message=f"{failure} (exit code: {process.returncode})",
         )
+        raise RuntimeError(f"{failure} (exit code: {process.returncode})\n{stderr.decode('utf-8')}")
+
+
+async def ahelm_pull(remote_chart: str, version: str, untar: bool = False) -> None:
+    """Pulls a Helm chart from a remote registry without blocking the event loop, see helm_pull.
+
+    Args:
+        remote_chart (str): The remote chart name.
+        version (str): The chart version.
+        untar (bool): Whether to untar the chart after pulling.
+
+    Raises:
+        RuntimeError: If pull fails.
+    """
+    logger.info("Pulling Helm chart %s with version %s", remote_chart, version)
+    cmd = ["helm", "pull", remote_chart, "--version", version, *(("--untar",) if untar else ())]
+    await _ahelm_run(cmd, f"Failed to pull '{remote_chart}' with version {version}")
+    logger.info("Successfully pulled Helm chart: %s", remote_chart)
+
+
+async def ahelm_package(chart: Chart) -> None:
+    """Packages a Helm chart into a .tgz archive without blocking the event loop, see helm_package.
+
+    Args:
+        chart (Chart): The chart to package.
+
+    Raises:
+        RuntimeError: If packaging fails.
+    """
+    chart_path = str(Path(chart.path_prefix) / chart.name)
+    logger.info("Packaging Helm chart at path: %s", chart_path)
+    await _ahelm_run(["helm", "package", chart_path], f"Failed to package Helm chart on path '{chart_path}'")
+    logger.info("Successfully packaged Helm chart: %s", chart.name)
+
+
+async def ahelm_push(chart: Chart, repository: str) -> None:
+    """Pushes a packaged Helm chart to a remote repository without blocking the event loop, see helm_push.
+
+    Args:
+        chart (Chart): The chart to push.
+        repository (str): The repository to push to.
+
+    Raises:
+        RuntimeError: If push fails.
+    """
+    tgz_file = chart.name + "-" + chart.version + ".tgz"
+    logger.info("Pushing Helm chart %s to repository: %s", tgz_file, repository)
+    await _ahelm_run(["helm", "push", tgz_file, repository], f"Failed to push '{tgz_file}' to '{repository}'")
     logger.info("Successfully pushed Helm chart: %s", tgz_file)
 
 
+def _gather_bounded(action: str, names: list[str], coroutines: list[Coroutine[Any, Any, None]], max_workers: int) -> None:
+    """Runs per-chart helm coroutines concurrently, at most max_workers at a time.
+
+    Args:
+        action (str): The operation name used in the error message (e.g., "pull").
+        names (list[str]): The chart names, in the order of the coroutines.
+        coroutines (list[Coroutine[Any, Any, None]]): The per-chart operations.
+        max_workers (int): Max concurrent helm invocations.
+
+    Raises:
+        RuntimeError: If the operation fails for any chart, listing every failed chart.
+    """
+
+    async def gather() -> list[BaseException | None]:
+        slots = asyncio.Semaphore(max_workers)
+
+        async def bounded(coroutine: Coroutine[Any, Any, None]) -> None:
+            async with slots:
+                await coroutine
+
+        return await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines), return_exceptions=True)
+
+    results = asyncio.run(gather())
+    failures = [f"{name}: {result}" for name, result in zip(names, results) if isinstance(result, RuntimeError)]
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, RuntimeError):
+            raise result
+    if failures:
+        logger.highlight(
+            level=LogLevel.ERROR,
+            message=f"Failed to {action} {len(failures)} of {len(names)} charts",
+        )
+        raise RuntimeError(f"Failed to {action} {len(failures)} of {len(names)} charts\n" + "\n".join(failures))
+
+
+def helm_pull_many(remote_charts: list[tuple[str, str]], untar: bool = False, max_workers: int = 4) -> None:
+    """Pulls several Helm charts concurrently.
+
+    Must not be called from a running event loop; await ahelm_pull there instead.
+
+    Args:
+        remote_charts (list[tuple[str, str]]): The remote chart names and versions.
+        untar (bool, optional): Whether to untar the charts after pulling. Defaults to False.
+        max_workers (int, optional): Max concurrent pulls. Defaults to 4.
+
+    Raises:
+        RuntimeError: If any pull fails, after all pulls have finished.
+    """
+    _gather_bounded(
+        "pull",
+        [remote_chart for remote_chart, _ in remote_charts],
+        [ahelm_pull(remote_chart, version, untar=untar) for remote_chart, version in remote_charts],
+        max_workers,
+    )
+
+
+def helm_push_many(charts: list[Chart], repository: str, max_workers: int = 4) -> None:
+    """Pushes several packaged Helm charts to a remote repository concurrently.
+
+    Must not be called from a running event loop; await ahelm_push there instead.
+
+    Args:
+        charts (list[Chart]): The charts to push.
+        repository (str): The repository to push to.
+        max_workers (int, optional): Max concurrent pushes. Defaults to 4.
+
+    Raises:
+        RuntimeError: If any push fails, after all pushes have finished.
+    """
+    _gather_bounded("push", [chart.name for chart in charts], [ahelm_push(chart, repository) for chart in charts], max_workers)
+
+
 def verify_chart_version(
     chart: Chart,
     expected_chart_version: str,
@@ -216,9 +405,8 @@ def verify_chart_version(
     """
     chart_root = Path(chart.path_prefix) / chart.name
     chart_yaml: Path = chart_root / "Chart.yaml"
-    yaml = YAML(typ="safe")
     logger.info("Verifying chart version for %s", chart_yaml)
-    chart_data = yaml.load(chart_yaml)
+    chart_data = _load_yaml(chart_yaml)
     if not chart_data or "version" not in chart_data:
         logger.highlight(
             level=LogLevel.ERROR,
@@ -252,9 +440,8 @@ def verify_chart_values(
     are_values_correct = True
     chart_root = Path(chart.path_prefix) / chart.name
     values_yaml: Path = chart_root / "values.yaml"
-    yaml = YAML(typ="safe")
     logger.info("Verifying chart values for %s", values_yaml)
-    values_data = yaml.load(values_yaml)
+    values_data = _load_yaml(values_yaml)
     # Check if the checklist is a dictionary
     if not isinstance(check_list, dict):
         logger.highlight(
@@ -290,6 +477,42 @@ def verify_chart_values(
     return are_values_correct
 
 
+def _verify_chart(chart: Chart, expected_chart_version: str | None) -> bool:
+    """Runs verify_chart_version and verify_chart_values for one chart of verify_charts.
+
+    Args:
+        chart (Chart): The chart to verify.
+        expected_chart_version (str | None): The expected version string, the version is not checked if None.
+
+    Returns:
+        bool: True if all checks passed, False otherwise.
+    """
+    version_ok = expected_chart_version is None or verify_chart_version(chart, expected_chart_version)
+    values_ok = not chart.check_list or verify_chart_values(chart, chart.check_list)
+    return version_ok and values_ok
+
+
+def verify_charts(charts: list[Chart], expected_versions: dict[str, str] | None = None, max_workers: int = 4) -> dict[str, bool]:
+    """Verifies the versions and values of several charts concurrently.
+
+    Each chart's version is checked against expected_versions and its values against its own check_list.
+    The Chart.yaml and values.yaml files are read and parsed in a thread pool, each worker with its own YAML loader.
+
+    Args:
+        charts (list[Chart]): The charts to verify.
+        expected_versions (dict[str, str] | None, optional): Expected version per chart name; charts without
+            an entry are not version checked. Defaults to None.
+        max_workers (int, optional): Maximum number of charts verified at once. Defaults to 4.
+
+    Returns:
+        dict[str, bool]: Whether all checks passed, per chart name.
+    """
+    versions = expected_versions or {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda chart: _verify_chart(chart, versions.get(chart.name)), charts)
+        return {chart.name: passed for chart, passed in zip(charts, results)}
+
+
 def verify_dependencies(charts: list[Chart]) -> None:
     """Verifies that chart dependencies are valid and acyclic.
 
@@ -301,39 +524,35 @@ def verify_dependencies(charts: list[Chart]) -> None:
     """
     logger.info("Verifying chart dependencies...")
     # build graph
-    graph: dict[str, Chart] = defaultdict(None)
-    for chart in charts:
-        graph[chart.name] = chart
-
-    # define dfs
-    visited = set()
-    recursive_stack = set()
-
-    def verify_dependencies_dfs(chart: Chart) -> None:
-        chart_name = chart.name
-        # cycle detected?
-        if chart_name in recursive_stack:
-            logger.error("Cyclic dependencies detected at %s", chart_name)
-            raise ValueError("Cyclic dependencies detected")
-        # skip?
-        if chart_name in visited:
-            return
-        recursive_stack.add(chart_name)
-
-        # handle neighbors
-        chart_dependencies = chart.dependencies if chart.dependencies else []
-        for dependency in chart_dependencies:
+    graph: dict[str, Chart] = {chart.name: chart for chart in charts}
+
+    # iterative dfs: charts on the path are in recursive_stack, finished charts in visited
+    visited: set[str] = set()
+    recursive_stack: set[str] = set()
+    for root in graph.values():
+        if root.name in visited:
+            continue
+        recursive_stack.add(root.name)
+        stack: list[tuple[Chart, Iterator[str]]] = [(root, iter(root.dependencies or []))]
+        while stack:
+            chart, dependencies = stack[-1]
+            chart_name = chart.name
+            dependency = next(dependencies, None)
+            if dependency is None:
+                # dependencies verified
+                stack.pop()
+                recursive_stack.remove(chart_name)
+                visited.add(chart_name)
+                logger.debug("Dependencies verified for chart: %s", chart_name)
+                continue
             if dependency not in graph:
                 logger.error("Dependency '%s' of chart '%s' not found", dependency, chart_name)
                 raise ValueError(f"Dependency '{dependency}' of chart '{chart_name}' not found")
-            verify_dependencies_dfs(graph[dependency])
-
-        # dependencies verified
-        recursive_stack.remove(chart_name)
-        visited.add(chart_name)
-        logger.debug("Dependencies verified for chart: %s", chart_name)
-
-    # try dfs
-    for chart in graph.values():
-        verify_dependencies_dfs(chart)
+            # cycle detected?
+            if dependency in recursive_stack:
+                logger.error("Cyclic dependencies detected at %s", dependency)
+                raise ValueError("Cyclic dependencies detected")
+            if dependency not in visited:
+                recursive_stack.add(dependency)
+                stack.append((graph[dependency], iter(graph[dependency].dependencies or [])))
     logger.info("All chart dependencies verified successfully.")
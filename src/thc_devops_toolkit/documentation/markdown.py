@@ -17,24 +17,44 @@
 Includes MarkdownDocumentManager for managing tables in markdown files, and MarkdownTable for table operations.
 """
 
+import os
 import re
+import shutil
 import uuid
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any
 
 from thc_devops_toolkit.observability import LogLevel, logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 _markdown_comment_head: str = "<!--"
 _markdown_comment_tail: str = "-->"
 _markdown_table_marker: str = "MarkdownDocumentManager:Table"
 _markdown_table_id_argument: str = "table_id="
+_FILE_BUFFER_SIZE: int = 1 << 20
+_TABLE_MARKER_RE = re.compile(
+    rf"^{re.escape(_markdown_comment_head)}{re.escape(_markdown_table_marker)}\s+"
+    rf"{re.escape(_markdown_table_id_argument)}(.*?){re.escape(_markdown_comment_tail)}$"
+)
+
+
+def _is_table_line(stripped_line: str) -> bool:
+    """Checks whether a stripped line is a markdown table line like "| something | else |".
+
+    Args:
+        stripped_line (str): The line without surrounding whitespace.
+
+    Returns:
+        bool: True if the line starts and ends with a pipe.
+    """
+    return len(stripped_line) >= 2 and stripped_line[0] == "|" and stripped_line[-1] == "|"
 
 
-def get_empty_dataframe(header: list[Hashable]) -> pd.DataFrame:
+def get_empty_dataframe(header: list[Hashable]) -> "pd.DataFrame":
     """Creates an empty DataFrame with the specified header.
 
     Args:
@@ -43,11 +63,13 @@ def get_empty_dataframe(header: list[Hashable]) -> pd.DataFrame:
     Returns:
         pd.DataFrame: An empty DataFrame with the given columns.
     """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     logger.debug("Creating empty table with header: %s", header)
     return pd.DataFrame(columns=header)
 
 
-def match_mask(dataframe: pd.DataFrame, column: Hashable, match_value: Any) -> pd.Series:
+def match_mask(dataframe: "pd.DataFrame", column: Hashable, match_value: Any) -> "pd.Series":
     """Returns a boolean mask for rows where column matches match_value.
 
     Args:
@@ -59,23 +81,26 @@ def match_mask(dataframe: pd.DataFrame, column: Hashable, match_value: Any) -> p
         pd.Series[bool]: Boolean mask for matching rows.
     """
     logger.debug("Matching mask for column '%s' with value '%s'", column, match_value)
-    condition = pd.Series([True] * len(dataframe))
-    condition &= dataframe[column] == match_value
-    return condition
+    # the comparison is already a boolean Series on the DataFrame's own index
+    return dataframe[column] == match_value
 
 
 @dataclass
 class MarkdownTable:
-    """Represents a markdown table with a unique table_id and DataFrame.
+    """Represents a markdown table with a unique table_id and its data.
+
+    The data is held either in a DataFrame or, to avoid importing pandas, as a list of row dicts.
 
     Attributes:
         table_id (str): Unique identifier for the table.
         dataframe (pd.DataFrame | None): The table data.
+        rows (list[dict[Hashable, Any]] | None): The table data as row dicts, used instead of dataframe when given.
     """
 
     # please ensure table_id is unique in a markdown document
     table_id: str = ""
-    dataframe: pd.DataFrame | None = None
+    dataframe: "pd.DataFrame | None" = None
+    rows: list[dict[Hashable, Any]] | None = None
 
     def upsert_row(self, data: dict[Hashable, Any], primary_key: str, insert_ahead: bool = False) -> None:
         """Upserts a row into the table by primary key.
@@ -86,6 +111,12 @@ class MarkdownTable:
             insert_ahead (bool, optional): Insert at the top if True. Defaults to False.
         """
         logger.info("Upserting row with primary_key %s: %s", primary_key, data)
+        if self.rows is not None and self.dataframe is None:
+            self._upsert_native_row(data=data, primary_key=primary_key, insert_ahead=insert_ahead)
+            return
+
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         # Ensure dataframe is initialized
         if self.dataframe is None:
             self.dataframe = get_empty_dataframe(list(data.keys()))
@@ -108,6 +139,111 @@ class MarkdownTable:
             else:
                 self.dataframe.loc[len(self.dataframe)] = data
 
+    def upsert_rows(self, rows: Iterable[dict[Hashable, Any]], primary_key: str, insert_ahead: bool = False) -> None:
+        """Upserts several rows by primary key, with the same result as calling upsert_row for each row in order.
+
+        Existing rows are found through a primary key index built once, and new rows are added in a single
+        concatenation instead of growing the table one row at a time.
+
+        Args:
+            rows (Iterable[dict[Hashable, Any]]): Rows to insert or update.
+            primary_key (str): The primary key column.
+            insert_ahead (bool, optional): Insert new rows at the top if True. Defaults to False.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        logger.info("Upserting %d rows with primary_key %s", len(rows), primary_key)
+        if self.dataframe is None and self.rows is None:
+            self.dataframe = get_empty_dataframe(list(rows[0].keys()))
+        if self.dataframe is None:
+            current_rows = self.rows if self.rows is not None else []
+            native_index = {row.get(primary_key): row for row in reversed(current_rows)}
+            new_native_rows: list[dict[Hashable, Any]] = []
+            for data in rows:
+                existing = native_index.get(data[primary_key])
+                if existing is not None:
+                    existing.update((key, value) for key, value in data.items() if value is not None)
+                else:
+                    native_index[data[primary_key]] = dict(data)
+                    new_native_rows.append(native_index[data[primary_key]])
+            if insert_ahead:
+                new_native_rows.reverse()
+                self.rows = new_native_rows + current_rows
+            else:
+                current_rows.extend(new_native_rows)
+                self.rows = current_rows
+            return
+
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        dataframe = self.dataframe
+        row_index = {key: idx for idx, key in reversed(list(dataframe[primary_key].items()))}
+        new_rows: dict[Any, dict[Hashable, Any]] = {}
+        for data in rows:
+            key = data[primary_key]
+            if key in row_index:
+                row_idx = row_index[key]
+                for column, value in data.items():
+                    if value is not None:
+                        dataframe.at[row_idx, column] = value
+            elif key in new_rows:
+                new_rows[key].update((column, value) for column, value in data.items() if value is not None)
+            else:
+                new_rows[key] = dict(data)
+        if not new_rows:
+            return
+        if insert_ahead:
+            new_df = pd.DataFrame(list(reversed(new_rows.values())))
+            self.dataframe = pd.concat([new_df, dataframe], ignore_index=True) if len(dataframe) else new_df
+        else:
+            new_df = pd.DataFrame(list(new_rows.values()), columns=dataframe.columns)
+            self.dataframe = pd.concat([dataframe, new_df], ignore_index=True) if len(dataframe) else new_df
+
+    def _upsert_native_row(self, data: dict[Hashable, Any], primary_key: str, insert_ahead: bool) -> None:
+        """Upserts a row into the row dicts by primary key.
+
+        Args:
+            data (dict[Hashable, Any]): Row data to insert or update.
+            primary_key (str): The primary key column.
+            insert_ahead (bool): Insert at the top if True.
+        """
+        rows = self.rows if self.rows is not None else []
+        for row in rows:
+            if row.get(primary_key) == data[primary_key]:
+                # hit
+                logger.info("Updating existing row with primary_key %s", primary_key)
+                row.update((key, value) for key, value in data.items() if value is not None)
+                return
+        # new data
+        logger.info("Inserting new row")
+        if insert_ahead:
+            rows.insert(0, dict(data))
+        else:
+            rows.append(dict(data))
+        self.rows = rows
+
+    def to_markdown_lines(self) -> list[str]:
+        """Renders the table as markdown lines.
+
+        Returns:
+            list[str]: The markdown table lines, or an empty list if the table has no data.
+        """
+        table: str
+        if self.dataframe is not None:
+            table = self.dataframe.to_markdown(index=False)
+        elif self.rows:
+            from tabulate import tabulate  # type: ignore[import-untyped]  # pylint: disable=import-outside-toplevel
+
+            table = tabulate(self.rows, headers="keys", tablefmt="pipe")
+        else:
+            return []
+        table_lines = table.split("\n")
+        # Remove empty lines at the end
+        while table_lines and not table_lines[-1].strip():
+            table_lines.pop()
+        return table_lines
+
 
 class MarkdownDocumentManager:
     """Manages a markdown document, supporting table parsing, insertion, and saving.
@@ -134,8 +270,9 @@ class MarkdownDocumentManager:
         """Loads the markdown document from file and parses tables."""
         logger.info("Loading markdown document from: %s", self.file_path)
         if self.file_path.exists():
-            with self.file_path.open("r", encoding="utf-8") as file:
-                self.lines = [line.rstrip() for line in file.readlines()]
+            # iterate the file object directly, readlines() would build a second list of the raw lines
+            with self.file_path.open("r", encoding="utf-8", buffering=_FILE_BUFFER_SIZE) as file:
+                self.lines = [line.rstrip() for line in file]
         else:
             logger.highlight(
                 LogLevel.WARNING,
@@ -149,7 +286,8 @@ class MarkdownDocumentManager:
         # housekeeping
         self.tables.clear()
 
-        # parse document
+        # parse document into a new line list, tables replace the lines they span
+        parsed_lines: list[str | MarkdownTable] = []
         i: int = 0
         table_id: str | None = None
 
@@ -159,25 +297,23 @@ class MarkdownDocumentManager:
                 line = line_obj.strip()
             else:
                 # If it's a MarkdownTable, skip marker/table logic
+                parsed_lines.append(line_obj)
                 table_id = None
                 i += 1
                 continue
 
             # is table marker?
-            table_marker_pattern = (
-                rf"^{_markdown_comment_head}{_markdown_table_marker}\s+{_markdown_table_id_argument}(.*?){_markdown_comment_tail}$"
-            )
-            match_ = re.match(table_marker_pattern, line)
+            match_ = _TABLE_MARKER_RE.match(line)
             if match_:
+                parsed_lines.append(line_obj)
                 table_id = match_.group(1).strip()
                 i += 1
                 continue
 
             # is table?
-            # This match table like "| something | else |"
-            if re.match(r"^\s*\|.*\|\s*$", line):
+            if _is_table_line(line):
                 logger.debug("Found markdown table at line %d", i)
-                markdown_table = self._parse_table(i)
+                markdown_table, end_line = self._parse_table(i)
                 if markdown_table:
                     # if table_id is not defined, we don't care about this table
                     # just assign a temporary and random one
@@ -189,21 +325,26 @@ class MarkdownDocumentManager:
                         )
                     markdown_table.table_id = table_id
                     self.tables[table_id] = markdown_table
+                    parsed_lines.append(markdown_table)
                     table_id = None
-                    i += 1
+                    i = end_line
                     continue
 
+            parsed_lines.append(line_obj)
             table_id = None  # table_id only works when table is immediately after marker
             i += 1
 
-    def _parse_table(self, start_line: int) -> MarkdownTable | None:
-        """Parses a markdown table starting at a given line.
+        self.lines = parsed_lines
+
+    def _parse_table(self, start_line: int) -> tuple[MarkdownTable | None, int]:
+        """Parses a markdown table starting at a given line, without modifying the document lines.
 
         Args:
             start_line (int): The line index to start parsing.
 
         Returns:
-            MarkdownTable | None: Parsed table or None if not found.
+            tuple[MarkdownTable | None, int]: Parsed table or None if not found, and the index of the first line after
+                the table.
         """
         logger.info("Parsing table starting at line: %d", start_line)
         if start_line >= len(self.lines):
@@ -211,18 +352,20 @@ class MarkdownDocumentManager:
                 LogLevel.WARNING,
                 f"Start line {start_line} out of range for table parsing.",
             )
-            return None
+            return None, start_line
 
         table_lines: list[str] = []
         i = start_line
 
         while i < len(self.lines):
             line_obj = self.lines[i]
-            if isinstance(line_obj, str) and re.match(r"^\s*\|.*\|\s*$", line_obj):
-                table_lines.append(line_obj.strip())
-                i += 1
-            else:
+            if not isinstance(line_obj, str):
                 break
+            line = line_obj.strip()
+            if not _is_table_line(line):
+                break
+            table_lines.append(line)
+            i += 1
 
         # at least 2 lines for a table (header + separator)
         if len(table_lines) < 2:
@@ -230,31 +373,29 @@ class MarkdownDocumentManager:
                 LogLevel.WARNING,
                 f"Table at line {start_line} has less than 2 lines, skipping.",
             )
-            return None
+            return None, i
 
         header = [col.strip() for col in table_lines[0].split("|")[1:-1]]
 
-        data = []
+        # rows are kept as plain lists in header order, pandas maps them to the columns by position
+        data: list[list[str]] = []
         for row in table_lines[2:]:  # skip header and separator
             cols = [col.strip() for col in row.split("|")[1:-1]]
             if len(cols) == len(header):
-                data_item = {header[j]: cols[j] for j in range(len(header))}
-                data.append(data_item)
+                data.append(cols)
             else:
                 logger.highlight(
                     LogLevel.WARNING,
                     f"Row in table at line {start_line} has mismatched columns, skipping row: {row}",
                 )
 
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         dataframe = pd.DataFrame(data, columns=header)
 
         markdown_table = MarkdownTable(table_id="", dataframe=dataframe)
-
-        # replace lines with table object
-        del self.lines[start_line:i]
-        self.lines.insert(start_line, markdown_table)
-        logger.info("Inserted MarkdownTable object at line: %d", start_line)
-        return markdown_table
+        logger.info("Parsed MarkdownTable object spanning lines %d to %d", start_line, i - 1)
+        return markdown_table, i
 
     @staticmethod
     def _get_tmp_table_id() -> str:
@@ -302,6 +443,14 @@ class MarkdownDocumentManager:
         self.tables[table.table_id] = table
         logger.info("Inserted table with id '%s' at line %d", table.table_id, line_idx)
 
+    def extend(self, lines: Iterable[str]) -> None:
+        """Appends text lines to the end of the document in one step.
+
+        Args:
+            lines (Iterable[str]): The lines to append.
+        """
+        self.lines.extend(lines)
+
     def list_tables(self) -> list[str]:
         """Lists all table ids in the document.
 
@@ -313,30 +462,26 @@ class MarkdownDocumentManager:
     def save_document(self) -> None:
         """Saves the current document (including tables) to file."""
         logger.info("Saving document to: %s", self.file_path)
-        # Create a new list to hold the final content
-        final_lines: list[str] = []
-        i = 0
-
-        while i < len(self.lines):
-            # is table?
-            line_obj = self.lines[i]
-            if isinstance(line_obj, MarkdownTable):
-                markdown_table = line_obj
-                if markdown_table.dataframe is not None:
-                    logger.info("Writing table with id %s to file.", markdown_table.table_id)
-                    table_lines = markdown_table.dataframe.to_markdown(index=False).split("\n")
-                    # Remove empty lines at the end
-                    while table_lines and not table_lines[-1].strip():
-                        table_lines.pop()
-                    final_lines.extend(table_lines)
-            elif isinstance(line_obj, str):
-                # Keep original line
-                final_lines.append(line_obj)
-            i += 1
-        # Write to file
-        with self.file_path.open("w", encoding="utf-8") as file:
-            for line in final_lines:
-                file.write(line + "\n")
+        # Write to a temporary file and swap it in, so the document is never left half written.
+        # A symlinked document is written through to its target, which keeps its permissions.
+        file_path = self.file_path.resolve()
+        tmp_file_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            with tmp_file_path.open("w", encoding="utf-8", buffering=_FILE_BUFFER_SIZE) as file:
+                for line_obj in self.lines:
+                    # is table?
+                    if isinstance(line_obj, MarkdownTable):
+                        logger.info("Writing table with id %s to file.", line_obj.table_id)
+                        file.writelines(line + "\n" for line in line_obj.to_markdown_lines())
+                    elif isinstance(line_obj, str):
+                        # Keep original line
+                        file.write(line_obj + "\n")
+            if file_path.exists():
+                shutil.copymode(file_path, tmp_file_path)
+            os.replace(tmp_file_path, file_path)
+        finally:
+            # Left over only if writing failed
+            tmp_file_path.unlink(missing_ok=True)
         logger.info("Document saved successfully to: %s", self.file_path)
 
     @staticmethod
@@ -26,12 +26,15 @@ from thc_devops_toolkit.observability.logger import LogLevel, logger
 class Playbook(ABC):
     """Abstract base class for Ansible playbooks."""
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         playbook_file: str | Path,
         inventory_file: str | Path,
         limit: str,
         extravars: dict[str, Any],
+        forks: int | None = None,
+        strategy: str | None = None,
+        pipelining: bool | None = None,
     ) -> None:
         """Initialize the Playbook instance.
 
@@ -40,11 +43,20 @@ class Playbook(ABC):
             inventory_file (str | Path): Path to the Ansible inventory file.
             limit (str): Limit for the Ansible playbook execution.
             extravars (dict[str, Any]): Extra variables for the Ansible playbook.
+            forks (int | None, optional): Number of hosts configured in parallel. Defaults to None, which keeps
+                the value of the ansible.cfg in effect.
+            strategy (str | None, optional): Ansible execution strategy. Defaults to None, which keeps the value
+                of the ansible.cfg in effect.
+            pipelining (bool | None, optional): Whether to enable SSH pipelining. Defaults to None, which keeps
+                the value of the ansible.cfg in effect.
         """
         self.playbook_file = str(playbook_file)
         self.inventory_file = str(inventory_file)
         self.limit = limit
         self.extravars = extravars
+        self.forks = forks
+        self.strategy = strategy
+        self.pipelining = pipelining
 
     @property
     @abstractmethod
@@ -75,6 +87,25 @@ class Playbook(ABC):
             logger.highlight(level=LogLevel.ERROR, message=f"Missing mandatory extravars: {', '.join(missing_vars)}")
             raise ValueError(f"Missing mandatory extravars: {', '.join(missing_vars)}")
 
+    @property
+    def config_envvars(self) -> dict[str, str]:
+        """Environment variables carrying the execution settings that were passed explicitly.
+
+        Environment variables take precedence over single options of the ansible.cfg in effect, so only
+        the settings given to the constructor are emitted, every other option of that file still applies.
+
+        Returns:
+            dict[str, str]: A mapping of ANSIBLE_* variable names to their values.
+        """
+        envvars = {}
+        if self.forks is not None:
+            envvars["ANSIBLE_FORKS"] = str(self.forks)
+        if self.strategy is not None:
+            envvars["ANSIBLE_STRATEGY"] = self.strategy
+        if self.pipelining is not None:
+            envvars["ANSIBLE_PIPELINING"] = str(self.pipelining)
+        return envvars
+
     def override_vars(self) -> None:
         """Override extravars with vars from vars_overrides."""
         self.extravars.update(self.vars_overrides)
@@ -95,7 +126,13 @@ class Playbook(ABC):
 
         # execute the playbook
         logger.info("Run playbook %s with inventory %s and limit %s", self.playbook_file, self.inventory_file, self.limit)
-        runner = ansible_runner.run(playbook=self.playbook_file, inventory=self.inventory_file, extravars=self.extravars, limit=self.limit)
+        runner = ansible_runner.run(
+            playbook=self.playbook_file,
+            inventory=self.inventory_file,
+            extravars=self.extravars,
+            limit=self.limit,
+            envvars=self.config_envvars,
+        )
 
         stdout_lines = []
         for event in runner.events:
@@ -14,19 +14,28 @@
 # ==============================================================================
 """Utilities for interacting with MinIO object storage."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
+import certifi
+import urllib3
 from minio import Minio, S3Error
 
 from thc_devops_toolkit.observability import LogLevel, logger
 
+# Files larger than one part are uploaded as multipart objects with parts sent in parallel
+_MULTIPART_PART_SIZE = 16 << 20
+_MULTIPART_PARALLEL_UPLOADS = 4
 
-def get_minio_service(
+
+def get_minio_service(  # pylint: disable=too-many-arguments
     s3_server: str,
     s3_access_key: str,
     s3_secret_key: str,
     secure: bool = True,
+    max_connections: int = 64,
 ) -> Minio:
     """Connects to the S3 server.
 
@@ -35,16 +44,27 @@ def get_minio_service(
         s3_access_key (str): The access key.
         s3_secret_key (str): The secret key.
         secure (bool, optional): Use HTTPS if True, HTTP if False. Defaults to True
+        max_connections (int, optional): Connections kept open to the server, shared by all concurrent requests.
+            Defaults to 64.
 
     Returns:
         Minio: The MinIO client instance.
     """
     endpoint = s3_server.replace("http://", "").replace("https://", "")
+    timeout = 300
+    http_client = urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=max_connections,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
     return Minio(
         endpoint=endpoint,
         access_key=s3_access_key,
         secret_key=s3_secret_key,
         secure=secure,
+        http_client=http_client,
     )
 
 
@@ -103,15 +123,20 @@ def mirror_dir_to_bucket(
     source: str | Path,
     bucket: str,
     directory: str | Path | None = None,
+    max_workers: int = 32,
 ) -> None:
     """Mirrors a local directory to a S3 bucket.
 
+    Files are uploaded concurrently. Small files and multipart files use separate worker pools so that
+    a few large uploads do not hold up the many small ones.
+
     Args:
         minio_ (Minio): The MinIO client instance.
         source (str | Path): Source directory path.
         bucket (str): Bucket name.
         directory (str | Path | None, optional): Target directory in bucket.
             Defaults to None.
+        max_workers (int, optional): Maximum number of concurrent uploads per pool. Defaults to 32.
 
     Raises:
         ValueError: If the bucket does not exist.
@@ -120,13 +145,34 @@ def mirror_dir_to_bucket(
         raise ValueError(f"Bucket '{bucket}' does not exist")
     source = Path(source)
     directory = Path(directory) if directory else None
+    small_files: list[tuple[str, str]] = []
+    large_files: list[tuple[str, str]] = []
     for file_path in source.rglob("*"):
         if file_path.is_file():
             if directory:
                 object_name = str(directory / file_path.relative_to(source))
             else:
                 object_name = str(file_path.relative_to(source))
-            minio_.fput_object(bucket, object_name, str(file_path))
+            if file_path.stat().st_size > _MULTIPART_PART_SIZE:
+                large_files.append((object_name, str(file_path)))
+            else:
+                small_files.append((object_name, str(file_path)))
+    large_workers = max(1, max_workers // _MULTIPART_PARALLEL_UPLOADS)
+    with ThreadPoolExecutor(max_workers=max_workers) as small_pool, ThreadPoolExecutor(max_workers=large_workers) as large_pool:
+        futures = [small_pool.submit(minio_.fput_object, bucket, object_name, file_path) for object_name, file_path in small_files]
+        futures.extend(
+            large_pool.submit(
+                minio_.fput_object,
+                bucket,
+                object_name,
+                file_path,
+                part_size=_MULTIPART_PART_SIZE,
+                num_parallel_uploads=_MULTIPART_PARALLEL_UPLOADS,
+            )
+            for object_name, file_path in large_files
+        )
+        for future in futures:
+            future.result()
     destination = f"{bucket}/{directory}" if directory else str(bucket)
     logger.highlight(
         LogLevel.INFO,
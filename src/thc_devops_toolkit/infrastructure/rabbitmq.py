@@ -13,19 +13,238 @@
 # limitations under the License.
 # ==============================================================================
 """RabbitMQ manager for sending and receiving messages using RabbitMQ."""
+import os
 import ssl
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from queue import Empty, Queue
+from queue import Empty, Full
 from threading import Event, Thread
-from typing import Any
+from typing import Any, Generic, Iterable, TypeVar
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 
 from thc_devops_toolkit.observability import LogLevel, logger
 
+_T = TypeVar("_T")
+
+# maximum number of queued messages published together
+_PUBLISH_BATCH_SIZE = 256
+
+
+class SPSCQueue(Generic[_T]):
+    """A queue for one producer thread and one consumer thread, API compatible with queue.Queue.
+
+    Items live in a deque whose append and popleft are atomic, so no lock is taken to pass an item.
+    Blocking calls wait on an Event that the other side sets only when it is cleared, instead of on
+    the Condition that queue.Queue notifies on every put and get.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        """Initializes the queue.
+
+        Args:
+            capacity (int, optional): Maximum number of queued items, unbounded if 0 or less. Defaults to 0.
+        """
+        self.capacity = capacity
+        self._items: deque[_T] = deque()
+        self._not_empty = Event()
+        # number of queued items the consumer waits for, the producer signals once it is reached
+        self._wanted = 1
+        self._not_full = Event()
+        # put and task_done counters, each only written by its own side so no lock is needed
+        self._puts = 0
+        self._done = 0
+        self._all_done = Event()
+
+    def qsize(self) -> int:
+        """Returns the number of queued items.
+
+        Returns:
+            int: The number of queued items.
+        """
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Returns whether the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty, False otherwise.
+        """
+        return not self._items
+
+    def full(self) -> bool:
+        """Returns whether the queue is full.
+
+        Returns:
+            bool: True if the queue is bounded and full, False otherwise.
+        """
+        return 0 < self.capacity <= len(self._items)
+
+    @staticmethod
+    def _wait(event: Event, deadline: float | None) -> bool:
+        """Waits for an event until the deadline.
+
+        Args:
+            event (Event): The event to wait for.
+            deadline (float | None): The time.monotonic() deadline, or None to wait forever.
+
+        Returns:
+            bool: False if the deadline passed, True otherwise.
+        """
+        if deadline is None:
+            event.wait()
+            return True
+        remaining = deadline - time.monotonic()
+        return remaining > 0 and event.wait(remaining)
+
+    def put(self, item: _T, block: bool = True, timeout: float | None = None) -> None:
+        """Puts an item into the queue.
+
+        Args:
+            item (_T): The item to put.
+            block (bool, optional): Wait for a free slot if the queue is full. Defaults to True.
+            timeout (float | None, optional): Maximum seconds to wait, forever if None. Defaults to None.
+
+        Raises:
+            Full: If no slot became free.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.full():
+            if not block:
+                raise Full
+            self._not_full.clear()
+            # re-check after clearing, the consumer may have taken an item in between
+            if self.full() and not self._wait(self._not_full, deadline):
+                raise Full
+        self._puts += 1
+        self._items.append(item)
+        if len(self._items) >= self._wanted and not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def put_many(self, items: Iterable[_T]) -> None:
+        """Puts items into the queue in order, waking the consumer once.
+
+        Args:
+            items (Iterable[_T]): The items to put.
+        """
+        if self.capacity > 0:
+            for item in items:
+                self.put(item)
+            return
+        items = list(items)
+        self._puts += len(items)
+        self._items.extend(items)
+        if len(self._items) >= self._wanted and not self._not_empty.is_set():
+            self._not_empty.set()
+
+    def put_nowait(self, item: _T) -> None:
+        """Puts an item into the queue without blocking.
+
+        Args:
+            item (_T): The item to put.
+
+        Raises:
+            Full: If the queue is full.
+        """
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> _T:
+        """Removes and returns an item from the queue.
+
+        Args:
+            block (bool, optional): Wait for an item if the queue is empty. Defaults to True.
+            timeout (float | None, optional): Maximum seconds to wait, forever if None. Defaults to None.
+
+        Returns:
+            _T: The oldest item.
+
+        Raises:
+            Empty: If no item arrived.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                if not block:
+                    raise Empty from None
+                self._not_empty.clear()
+                # re-check after clearing, the producer may have put an item in between
+                if not self._items and not self._wait(self._not_empty, deadline):
+                    raise Empty from None
+                continue
+            if self.capacity > 0 and not self._not_full.is_set():
+                self._not_full.set()
+            return item
+
+    def drain(self, n: int, timeout: float | None = None) -> list[_T]:
+        """Waits until n items are queued or the timeout expires, then removes and returns up to n items.
+
+        The producer wakes the consumer once, when the n-th item arrives, instead of once per item.
+
+        Args:
+            n (int): The number of items to wait for.
+            timeout (float | None, optional): Maximum seconds to wait, forever if None. Defaults to None.
+
+        Returns:
+            list[_T]: The oldest items, fewer than n if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._wanted = n
+        try:
+            while len(self._items) < n:
+                self._not_empty.clear()
+                # re-check after clearing, the producer may have put the n-th item in between
+                if len(self._items) < n and not self._wait(self._not_empty, deadline):
+                    break
+        finally:
+            self._wanted = 1
+        items = [self._items.popleft() for _ in range(min(n, len(self._items)))]
+        if items and self.capacity > 0 and not self._not_full.is_set():
+            self._not_full.set()
+        return items
+
+    def task_done(self, count: int = 1) -> None:
+        """Marks items taken from the queue as processed, like queue.Queue.task_done.
+
+        Args:
+            count (int, optional): The number of processed items. Defaults to 1.
+        """
+        self._done += count
+        if self._done >= self._puts and not self._all_done.is_set():
+            self._all_done.set()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Waits until every item put into the queue has been marked processed, like queue.Queue.join.
+
+        Args:
+            timeout (float | None, optional): Maximum seconds to wait, forever if None. Defaults to None.
+
+        Returns:
+            bool: True if all items were processed, False if the timeout expired first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._done < self._puts:
+            self._all_done.clear()
+            # re-check after clearing, the consumer may have finished in between
+            if self._done < self._puts and not self._wait(self._all_done, deadline):
+                return False
+        return True
+
+    def get_nowait(self) -> _T:
+        """Removes and returns an item from the queue without blocking.
+
+        Returns:
+            _T: The oldest item.
+
+        Raises:
+            Empty: If the queue is empty.
+        """
+        return self.get(block=False)
+
 
 class RabbitMQActions(Enum):
     """RabbitMQ actions."""
@@ -47,8 +266,15 @@ class RabbitMQConfig:  # pylint: disable=too-many-instance-attributes
         exchange_type (str): RabbitMQ exchange type.
         routing_key (str): RabbitMQ routing key.
         tls (bool): Whether to use TLS.
-        message_queue (Queue): Queue for message passing or receiving.
+        publisher_confirms (bool): Whether the broker acknowledges every published message. Defaults to False.
+        transactional (bool): Whether a batch is published in one AMQP transaction, so it reaches the exchange
+            completely or not at all. Costs a synchronous commit per batch and is ignored with publisher
+            confirms. Defaults to False.
+        durable (bool): Whether the exchange survives a broker restart. Defaults to False.
+        delivery_mode (int): 1 for transient messages, 2 for messages persisted to disk. Defaults to 1.
+        message_queue (SPSCQueue): Queue for message passing or receiving.
         channel (BlockingChannel | None): RabbitMQ channel.
+        ready (Event): Set while a receiver's queue is bound and consuming.
     """
 
     host: str
@@ -59,15 +285,27 @@ class RabbitMQConfig:  # pylint: disable=too-many-instance-attributes
     exchange_type: str
     routing_key: str
     tls: bool
-    message_queue: Queue[bytes] = field(default_factory=Queue, init=False, repr=False)
+    publisher_confirms: bool = False
+    transactional: bool = False
+    durable: bool = False
+    delivery_mode: int = 1
+    message_queue: SPSCQueue[bytes] = field(default_factory=SPSCQueue, init=False, repr=False)
     channel: BlockingChannel | None = field(default=None, init=False, repr=False)
+    ready: Event = field(default_factory=Event, init=False, repr=False)
 
 
 class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
     """Manages sending and receiving messages using RabbitMQ."""
 
-    def __init__(self) -> None:
-        """Initializes the RabbitMQ manager."""
+    def __init__(self, cpu_affinity: set[int] | None = None) -> None:
+        """Initializes the RabbitMQ manager.
+
+        Args:
+            cpu_affinity (set[int] | None, optional): CPUs the sender and receiver threads are pinned to, e.g. the
+                CPUs of the thread using the message queues, so the queues stay in one cache. Only supported on
+                platforms with os.sched_setaffinity. Defaults to None, which leaves the threads unpinned.
+        """
+        self.cpu_affinity = cpu_affinity
         self.senders: dict[str, RabbitMQConfig] = {}
         self.receivers: dict[str, RabbitMQConfig] = {}
         self.threads: list[Thread] = []
@@ -110,8 +348,17 @@ class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
         )
         return False
 
-    def run(self) -> None:
-        """Starts all registered sender and receiver threads."""
+    def run(self, ready_timeout: float = 10.0) -> bool:
+        """Starts all registered sender and receiver threads.
+
+        Returns once every receiver is consuming, so messages sent afterwards are routed to them.
+
+        Args:
+            ready_timeout (float, optional): Max seconds to wait for the receivers. Defaults to 10.0.
+
+        Returns:
+            bool: True if all receivers are consuming, False if the timeout expired first.
+        """
         for receiver_id, receiver_config in self.receivers.items():
             logger.info("[RabbitMQ] starting receiver: %s", receiver_id)
             thread = Thread(
@@ -120,6 +367,7 @@ class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
                 daemon=True,
             )
             thread.start()
+            self._pin_thread(thread)
             logger.info("[RabbitMQ] receiver: %s started", receiver_id)
             self.threads.append(thread)
         for sender_id, sender_config in self.senders.items():
@@ -130,8 +378,70 @@ class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
                 daemon=True,
             )
             thread.start()
+            self._pin_thread(thread)
             logger.info("[RabbitMQ] sender: %s started", sender_id)
             self.threads.append(thread)
+        return self.wait_ready(timeout=ready_timeout)
+
+    def _pin_thread(self, thread: Thread) -> None:
+        """Pins a started thread to the configured CPUs.
+
+        Args:
+            thread (Thread): The started thread.
+        """
+        if not self.cpu_affinity or thread.native_id is None:
+            return
+        if not hasattr(os, "sched_setaffinity"):
+            logger.highlight(
+                level=LogLevel.WARNING,
+                message="[RabbitMQ] cpu_affinity is not supported on this platform, ignored.",
+            )
+            return
+        try:
+            os.sched_setaffinity(thread.native_id, self.cpu_affinity)
+        except OSError as exception:
+            logger.highlight(
+                level=LogLevel.WARNING,
+                message=f"[RabbitMQ] Failed to pin thread {thread.name} to CPUs {self.cpu_affinity}: {exception}",
+            )
+
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Waits until every receiver has its queue bound and is consuming.
+
+        Args:
+            timeout (float, optional): Max seconds to wait. Defaults to 10.0.
+
+        Returns:
+            bool: True if all receivers are consuming, False if the timeout expired first.
+        """
+        deadline = time.monotonic() + timeout
+        for receiver_id, receiver_config in self.receivers.items():
+            if not receiver_config.ready.wait(max(0.0, deadline - time.monotonic())):
+                logger.highlight(
+                    level=LogLevel.WARNING,
+                    message=f"[RabbitMQ] receiver: {receiver_id} not consuming within {timeout}s",
+                )
+                return False
+        return True
+
+    def drain(self, timeout: float = 10.0) -> bool:
+        """Waits until every message put into the sender queues has been published.
+
+        Args:
+            timeout (float, optional): Max seconds to wait. Defaults to 10.0.
+
+        Returns:
+            bool: True if all messages were published, False if the timeout expired first.
+        """
+        deadline = time.monotonic() + timeout
+        for sender_id, sender_config in self.senders.items():
+            if not sender_config.message_queue.join(timeout=max(0.0, deadline - time.monotonic())):
+                logger.highlight(
+                    level=LogLevel.WARNING,
+                    message=f"[RabbitMQ] sender: {sender_id} not drained within {timeout}s",
+                )
+                return False
+        return True
 
     @staticmethod
     def _connect(host: str, port: int, user: str, password: str, tls: bool) -> pika.BlockingConnection:
@@ -207,13 +517,15 @@ class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
                 )
                 channel = connection.channel()
                 config.channel = channel
-                channel.exchange_declare(exchange=config.exchange_name, exchange_type=config.exchange_type)
+                channel.exchange_declare(exchange=config.exchange_name, exchange_type=config.exchange_type, durable=config.durable)
                 result = channel.queue_declare("", exclusive=True)
                 queue_name = result.method.queue
                 channel.queue_bind(exchange=config.exchange_name, queue=queue_name, routing_key=config.routing_key)
                 channel.basic_consume(queue=queue_name, on_message_callback=callback, auto_ack=True)
+                config.ready.set()
                 channel.start_consuming()
             except Exception as exception:  # pylint: disable=broad-except
+                config.ready.clear()
                 if self.shutdown_event.is_set():
                     break
                 logger.info(
@@ -227,45 +539,155 @@ class RabbitMQManager:  # pylint: disable=too-many-instance-attributes
                 )
                 time.sleep(10)
 
-    def send(self, config: RabbitMQConfig) -> None:
+    def _open_publisher(self, config: RabbitMQConfig) -> tuple[pika.BlockingConnection, BlockingChannel]:
+        """Opens a connection and a channel ready to publish to the configured exchange.
+
+        Args:
+            config (RabbitMQConfig): RabbitMQ configuration.
+
+        Returns:
+            tuple[pika.BlockingConnection, BlockingChannel]: The connection and its channel.
+        """
+        connection = self._connect(
+            host=config.host,
+            port=config.port,
+            user=config.user,
+            password=config.password,
+            tls=config.tls,
+        )
+        channel = connection.channel()
+        channel.exchange_declare(exchange=config.exchange_name, exchange_type=config.exchange_type, durable=config.durable)
+        # a channel is either in confirm or in transaction mode, confirms wait for the broker per message
+        if config.publisher_confirms:
+            channel.confirm_delivery()
+        elif config.transactional:
+            channel.tx_select()
+        return connection, channel
+
+    @staticmethod
+    def _publish(config: RabbitMQConfig, channel: BlockingChannel, messages: list[bytes]) -> int:
+        """Publishes messages on a channel opened by _open_publisher.
+
+        Outside a transaction every basic_publish that returned has reached the broker, so published
+        messages are removed from the front of messages even if a later one fails, and a retry of the
+        rest does not duplicate them. An uncommitted transaction is discarded, so it is left whole.
+
+        Args:
+            config (RabbitMQConfig): RabbitMQ configuration.
+            channel (BlockingChannel): The publishing channel.
+            messages (list[bytes]): Messages to publish, in order.
+
+        Returns:
+            int: The number of published messages.
+        """
+        properties = pika.BasicProperties(delivery_mode=config.delivery_mode)
+        transaction = config.transactional and not config.publisher_confirms
+        count = 0
+        try:
+            for data in messages:
+                channel.basic_publish(exchange=config.exchange_name, routing_key=config.routing_key, body=data, properties=properties)
+                count += 1
+            if transaction:
+                channel.tx_commit()
+        finally:
+            if not transaction:
+                del messages[:count]
+        logger.info(
+            "[RabbitMQ] %d data send to %s/%s",
+            count,
+            config.exchange_name,
+            config.routing_key,
+        )
+        return count
+
+    def publish_batch(self, config: RabbitMQConfig, messages: Iterable[bytes]) -> int:
+        """Publishes messages over one connection.
+
+        Without publisher confirms, the messages are published without waiting for the broker in between,
+        so the batch costs one connection instead of one per message. With publisher confirms every message
+        waits for its acknowledgement, with transactional the batch is committed once at the end.
+
+        Args:
+            config (RabbitMQConfig): RabbitMQ configuration.
+            messages (Iterable[bytes]): Messages to publish, in order.
+
+        Returns:
+            int: The number of published messages.
+        """
+        connection, channel = self._open_publisher(config)
+        try:
+            return self._publish(config, channel, list(messages))
+        finally:
+            connection.close()
+
+    def send(self, config: RabbitMQConfig) -> None:  # pylint: disable=too-many-branches
         """Sends messages from the queue to RabbitMQ.
 
+        Messages already waiting in the queue are published together, up to _PUBLISH_BATCH_SIZE at a time,
+        and marked done in the queue once published. The connection is kept open between batches and
+        reopened after an error.
+
         Args:
             config (RabbitMQConfig): RabbitMQ configuration.
         """
-        while not self.shutdown_event.is_set():
-            try:
-                # Add timeout to allow shutdown check
-                data = config.message_queue.get(block=True, timeout=1)
-                connection = self._connect(
-                    host=config.host,
-                    port=config.port,
-                    user=config.user,
-                    password=config.password,
-                    tls=config.tls,
-                )
-                channel = connection.channel()
-                channel.exchange_declare(exchange=config.exchange_name, exchange_type=config.exchange_type)
-                channel.basic_publish(exchange=config.exchange_name, routing_key=config.routing_key, body=data)
-                logger.info(
-                    "[RabbitMQ] data send to %s/%s",
-                    config.exchange_name,
-                    config.routing_key,
-                )
-                connection.close()
-            except Empty:
-                continue
-            except Exception as exception:  # pylint: disable=broad-except
-                if self.shutdown_event.is_set():
-                    break
-                logger.highlight(
-                    level=LogLevel.ERROR,
-                    message=f"[RabbitMQ] Error occurred: {exception}",
-                )
-                # Brief pause before retry
-                time.sleep(10)
-                if "data" in locals():
-                    config.message_queue.put(data)
+        batch: list[bytes] = []
+        connection: pika.BlockingConnection | None = None
+        channel: BlockingChannel | None = None
+        try:
+            while not self.shutdown_event.is_set():
+                # The unpublished rest of a batch that failed is kept and retried first
+                if not batch:
+                    try:
+                        # Add timeout to allow shutdown check
+                        batch.append(config.message_queue.get(block=True, timeout=1))
+                        while len(batch) < _PUBLISH_BATCH_SIZE:
+                            batch.append(config.message_queue.get_nowait())
+                    except Empty:
+                        if not batch:
+                            # Serve heartbeats while idle so the broker keeps the connection open
+                            if connection is not None:
+                                try:
+                                    connection.process_data_events(time_limit=0)
+                                except Exception:  # pylint: disable=broad-except
+                                    connection, channel = None, None
+                            continue
+                batch_size = len(batch)
+                try:
+                    if connection is None or channel is None:
+                        connection, channel = self._open_publisher(config)
+                    self._publish(config, channel, batch)
+                except Exception as exception:  # pylint: disable=broad-except
+                    if len(batch) < batch_size:
+                        config.message_queue.task_done(batch_size - len(batch))
+                    if self.shutdown_event.is_set():
+                        break
+                    logger.highlight(
+                        level=LogLevel.ERROR,
+                        message=f"[RabbitMQ] Error occurred: {exception}",
+                    )
+                    self._close_quietly(connection)
+                    connection, channel = None, None
+                    # Brief pause before retry
+                    time.sleep(10)
+                    continue
+                config.message_queue.task_done(batch_size)
+                batch = []
+        finally:
+            self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection: pika.BlockingConnection | None) -> None:
+        """Closes a connection, ignoring errors of an already broken one.
+
+        Args:
+            connection (pika.BlockingConnection | None): The connection to close.
+        """
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
 
     def shutdown(self) -> None:
         """Gracefully shuts down the RabbitMQ manager and all threads."""
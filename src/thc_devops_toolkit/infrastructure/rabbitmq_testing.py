@@ -0,0 +1,156 @@
+# Copyright 2025 Tsung-Han Chang. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A throwaway RabbitMQ broker in a docker container for examples and integration tests."""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import pika
+
+from thc_devops_toolkit.containerization.docker import (
+    docker_inspect,
+    docker_remove,
+    docker_run_daemon,
+    docker_stop,
+    docker_wait_healthy,
+    ensure_image,
+)
+from thc_devops_toolkit.observability import logger, wait_for_tcp
+
+_RETRY_INTERVAL = 0.05
+
+
+def _wait_for_rabbitmq(host: str, port: int, user: str, password: str, deadline: float) -> None:
+    """Waits until the broker accepts TCP connections and completes an AMQP handshake.
+
+    Args:
+        host (str): RabbitMQ host.
+        port (int): RabbitMQ port.
+        user (str): RabbitMQ user.
+        password (str): RabbitMQ password.
+        deadline (float): Max seconds to wait.
+
+    Raises:
+        RuntimeError: If the port does not accept connections before the deadline.
+        pika.exceptions.AMQPConnectionError: If no handshake succeeds before the deadline.
+    """
+    end = time.monotonic() + deadline
+    wait_for_tcp(host=host, port=port, deadline=deadline)
+    parameters = pika.ConnectionParameters(
+        host=host,
+        port=port,
+        credentials=pika.PlainCredentials(user, password),
+        connection_attempts=1,
+    )
+    while True:
+        try:
+            pika.BlockingConnection(parameters).close()
+            return
+        except pika.exceptions.AMQPConnectionError:
+            if time.monotonic() >= end:
+                raise
+            time.sleep(_RETRY_INTERVAL)
+
+
+def _is_container_running(container_name: str) -> bool | None:
+    """Checks the state of a container.
+
+    Args:
+        container_name (str): The container name.
+
+    Returns:
+        bool | None: Whether the container is running, or None if it does not exist.
+    """
+    try:
+        container_info = docker_inspect(target_object=container_name)
+    except RuntimeError:
+        return None
+    return bool(container_info.get("State", {}).get("Running"))
+
+
+@contextmanager
+def rabbitmq_fixture(  # pylint: disable=too-many-arguments
+    user: str,
+    password: str,
+    *,
+    host: str = "0.0.0.0",
+    port: int = 5672,
+    image: str = "rabbitmq:4.1.4-alpine",
+    container_name: str = "test-rabbitmq-server",
+    pool: bool | None = None,
+    ready_deadline: float = 30.0,
+) -> Iterator[None]:
+    """Runs a RabbitMQ broker in a docker container until the context exits.
+
+    With pooling, a running container of the same name is reused and the container is left running on exit,
+    so repeated runs skip the broker start-up. Without pooling, a container of the same name is replaced and
+    the new one is stopped on exit, also when the broker does not become ready or the body raises.
+
+    Args:
+        user (str): RabbitMQ user.
+        password (str): RabbitMQ password.
+        host (str, optional): Host the broker is reached on. Defaults to "0.0.0.0".
+        port (int, optional): Port published by the container. Defaults to 5672.
+        image (str, optional): The broker image. Defaults to "rabbitmq:4.1.4-alpine".
+        container_name (str, optional): The container name. Defaults to "test-rabbitmq-server".
+        pool (bool | None, optional): Keep the container between runs. Defaults to None, which reads the
+            THC_RABBIT_POOL environment variable and pools unless it is "0".
+        ready_deadline (float, optional): Max seconds to wait for the broker. Defaults to 30.0.
+
+    Yields:
+        None: Once the broker completes an AMQP handshake.
+    """
+    if pool is None:
+        pool = os.environ.get("THC_RABBIT_POOL", "1") != "0"
+    running = _is_container_running(container_name)
+    if running and pool:
+        logger.info("[RabbitMQ] Reusing running container %s", container_name)
+    else:
+        if running is not None:
+            # A leftover container holds the name, replace it
+            if running:
+                docker_stop(obj=container_name)
+            # a leftover started with --rm is already gone once stopped
+            docker_remove(obj=container_name, ignore_errors=True)
+        ensure_image(full_image_name=image)
+        docker_run_daemon(
+            full_image_name=image,
+            remove=not pool,
+            container_name=container_name,
+            env_vars=[
+                f"RABBITMQ_DEFAULT_USER={user}",
+                f"RABBITMQ_DEFAULT_PASS={password}",
+            ],
+            port_mappings=[f"{port}:5672"],
+            restart_policy="unless-stopped" if pool else None,
+            health_cmd="rabbitmq-diagnostics -q ping",
+            health_interval="500ms",
+            health_timeout="2s",
+            health_retries=20,
+        )
+    try:
+        # The healthcheck runs inside the container, the handshake below then confirms the published port
+        docker_wait_healthy(obj=container_name, timeout=ready_deadline)
+        _wait_for_rabbitmq(host=host, port=port, user=user, password=password, deadline=ready_deadline)
+
+        yield
+    finally:
+        # Exclusive queues are deleted by the broker with their connections, so a pooled broker can be kept running.
+        if pool:
+            logger.info("[RabbitMQ] Container %s is kept running for the next run", container_name)
+        else:
+            docker_stop(obj=container_name)
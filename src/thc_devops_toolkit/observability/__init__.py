@@ -15,8 +15,11 @@
 """A collection of utilities for observability tasks."""
 
 from .logger import LogLevel, logger
+from .probe import wait_for_tcp, wait_http_ready
 
 __all__ = [
     "LogLevel",
     "logger",
+    "wait_for_tcp",
+    "wait_http_ready",
 ]
@@ -22,7 +22,7 @@ import logging
 import sys
 from enum import Enum
 from logging.handlers import TimedRotatingFileHandler
-from typing import Union
+from typing import Any, Union
 
 
 class ANSIEscapeCode(Enum):
@@ -154,6 +154,15 @@ class LogLevel(Enum):
     DEBUG = "DEBUG"
     CRITICAL = "CRITICAL"
 
+    @property
+    def levelno(self) -> int:
+        """Get the standard logging level number for the log level.
+
+        Returns:
+            int: The logging level number (e.g., logging.INFO).
+        """
+        return int(getattr(logging, self.value))
+
 
 class THCLogger(logging.Logger):
     """Enhanced logger class with ANSI color highlighting support.
@@ -189,16 +198,37 @@ class THCLogger(logging.Logger):
             handler.setFormatter(self.formatter)
             self.addHandler(handler)
 
-    def highlight(self, level: LogLevel, message: str) -> None:
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Check whether a message of the given level would be logged.
+
+        Use this to skip building expensive log messages when the level is disabled.
+
+        Args:
+            level (LogLevel): The log level to check.
+
+        Returns:
+            bool: True if messages of the level are logged.
+        """
+        return self.isEnabledFor(level.levelno)
+
+    def highlight(self, level: LogLevel, message: str, *args: Any) -> None:
         """Log a message with ANSI color highlighting based on the log level.
 
         This method provides colored console output for different log levels
         to improve readability and visual distinction of log messages.
+        Like the standard logging methods, the message is only %-formatted with args
+        when the level is enabled.
 
         Args:
             level (LogLevel): The highlight level determining color.
             message (str): The message to log with highlighting.
+            *args (Any): Arguments merged into message with %-formatting.
         """
+        if not self.is_enabled(level):
+            return
+        if args:
+            message = message % args
+
         if level == LogLevel.ERROR:
             self.error(ansi_format(text=message, color=ANSIEscapeCode.RED, bold=True, underline=False))
         elif level == LogLevel.WARNING:
@@ -14,6 +14,7 @@
 # ==============================================================================
 """Monitoring utilities for system and process metrics."""
 
+import os
 import time
 from datetime import datetime
 from threading import Event, Thread
@@ -31,6 +32,59 @@ from thc_devops_toolkit.observability.monitor.models import (
     Unit,
 )
 
+_PROC_NET_DEV = "/proc/net/dev"
+_NET_DEV_READ_SIZE = 1 << 16
+
+
+def _read_net_dev_counters(net_dev_fd: int, net_iface_name: str) -> tuple[int, int]:
+    """Reads the received and sent byte counters of a network interface from an open /proc/net/dev.
+
+    The file is re-read with pread from offset 0 until a short read, so the descriptor stays open across samples.
+
+    Args:
+        net_dev_fd (int): File descriptor of /proc/net/dev.
+        net_iface_name (str): The network interface name.
+
+    Returns:
+        tuple[int, int]: The received and sent bytes.
+
+    Raises:
+        KeyError: If the network interface is not listed.
+    """
+    chunks: list[bytes] = []
+    offset = 0
+    while True:
+        chunk = os.pread(net_dev_fd, _NET_DEV_READ_SIZE, offset)
+        chunks.append(chunk)
+        offset += len(chunk)
+        # a short or empty read marks the end of the table
+        if len(chunk) < _NET_DEV_READ_SIZE:
+            break
+    net_dev = b"".join(chunks).decode("ascii")
+    # The first two lines are the table header
+    for line in net_dev.splitlines()[2:]:
+        name, _, counters = line.partition(":")
+        if name.strip() == net_iface_name:
+            fields = counters.split()
+            return int(fields[0]), int(fields[8])
+    raise KeyError(net_iface_name)
+
+
+def _counter_delta(before: int, after: int) -> int:
+    """Returns the increase of a byte counter between two samples.
+
+    A counter that went down wrapped around or was reset with its interface, it is then counted from zero
+    like psutil's nowrap correction does.
+
+    Args:
+        before (int): The earlier sample.
+        after (int): The later sample.
+
+    Returns:
+        int: The non-negative increase.
+    """
+    return after - before if after >= before else after
+
 
 class Monitor:
     """A class to monitor system and process metrics."""
@@ -87,46 +141,50 @@ class Monitor:
             precision (int): The number of decimal places for the measurements.
             retry (int): The number of retries on failure before stopping monitoring.
         """
-        failure_count = 0
-        while not self.shutdown_event.is_set():
-            try:
-                logger.info("[Monitor] Measuring network interface %s statistics...", net_iface.name)
-                start_time = datetime.now()
+        # The descriptor is opened on the first attempt and kept across samples
+        net_dev_fd: int | None = None
+        try:
+            failure_count = 0
+            while not self.shutdown_event.is_set():
+                try:
+                    logger.info("[Monitor] Measuring network interface %s statistics...", net_iface.name)
+                    start_time = datetime.now()
 
-                net_stat = psutil.net_io_counters(pernic=True, nowrap=True)[net_iface.name]
-                inbound_1 = net_stat.bytes_recv
-                outbound_1 = net_stat.bytes_sent
+                    if net_dev_fd is None:
+                        net_dev_fd = os.open(_PROC_NET_DEV, os.O_RDONLY)
+                    inbound_1, outbound_1 = _read_net_dev_counters(net_dev_fd, net_iface.name)
 
-                time.sleep(1)
+                    time.sleep(1)
 
-                net_stat = psutil.net_io_counters(pernic=True, nowrap=True)[net_iface.name]
-                inbound_2 = net_stat.bytes_recv
-                outbound_2 = net_stat.bytes_sent
+                    inbound_2, outbound_2 = _read_net_dev_counters(net_dev_fd, net_iface.name)
 
-                end_time = datetime.now()
-                logger.info("[Monitor] Successfully measured network interface %s statistics.", net_iface.name)
+                    end_time = datetime.now()
+                    logger.info("[Monitor] Successfully measured network interface %s statistics.", net_iface.name)
 
-                net_status = NetworkInterfaceStatus(
-                    inbound_rate=round((inbound_2 - inbound_1) / unit.factor, precision),
-                    outbound_rate=round((outbound_2 - outbound_1) / unit.factor, precision),
-                    unit=unit,
-                    timestamp=end_time.strftime("%Y-%m-%d %H:%M:%S"),
-                )
-                logger.highlight(level=LogLevel.INFO, message=f"[Monitor] Network Interface {net_iface.name} status: {net_status}")
-                failure_count = 0
-                time.sleep(interval - (end_time - start_time).total_seconds())
-            except Exception as exception:  # pylint: disable=broad-except
-                logger.highlight(
-                    level=LogLevel.ERROR,
-                    message=f"[Monitor] Error monitoring network interface {net_iface.name}: {exception}",
-                )
-                failure_count += 1
-                if failure_count >= retry:
+                    net_status = NetworkInterfaceStatus(
+                        inbound_rate=round(_counter_delta(inbound_1, inbound_2) / unit.factor, precision),
+                        outbound_rate=round(_counter_delta(outbound_1, outbound_2) / unit.factor, precision),
+                        unit=unit,
+                        timestamp=end_time.strftime("%Y-%m-%d %H:%M:%S"),
+                    )
+                    logger.highlight(level=LogLevel.INFO, message=f"[Monitor] Network Interface {net_iface.name} status: {net_status}")
+                    failure_count = 0
+                    time.sleep(interval - (end_time - start_time).total_seconds())
+                except Exception as exception:  # pylint: disable=broad-except
                     logger.highlight(
                         level=LogLevel.ERROR,
-                        message=f"[Monitor] Stopping monitoring for network interface {net_iface.name} after multiple failures.",
+                        message=f"[Monitor] Error monitoring network interface {net_iface.name}: {exception}",
                     )
-                    break
+                    failure_count += 1
+                    if failure_count >= retry:
+                        logger.highlight(
+                            level=LogLevel.ERROR,
+                            message=f"[Monitor] Stopping monitoring for network interface {net_iface.name} after multiple failures.",
+                        )
+                        break
+        finally:
+            if net_dev_fd is not None:
+                os.close(net_dev_fd)
 
     def monitor_process(  # pylint: disable=too-many-arguments
         self,
@@ -171,19 +229,29 @@ class Monitor:
             precision (int): The number of decimal places for the measurements.
             retry (int): The number of retries on failure before stopping monitoring.
         """
+        # The process handle is kept across samples so that cpu_percent measures the time since the previous sample,
+        # it is attached on the first attempt, so a process that is not up yet is retried
+        process: psutil.Process | None = None
+        memory_total = 0
         failure_count = 0
         while not self.shutdown_event.is_set():
             try:
                 logger.info("[Monitor] Measuring process %d statistics...", pid)
                 start_time = datetime.now()
 
-                process = psutil.Process(pid)
-                memory_info = process.memory_info()
+                if process is None:
+                    memory_total = psutil.virtual_memory().total
+                    process = psutil.Process(pid)
+
+                # Read /proc/<pid> once for all counters of this sample
+                with process.oneshot():
+                    memory_info = process.memory_info()
+                    cpu_usage = process.cpu_percent()
 
                 process_status = ProcessStatus(
-                    cpu_usage=round(process.cpu_percent(), precision),
+                    cpu_usage=round(cpu_usage, precision),
                     memory_used=round(memory_info.rss / memory_unit.factor, precision),
-                    memory_total=round(psutil.virtual_memory().total / memory_unit.factor, precision),
+                    memory_total=round(memory_total / memory_unit.factor, precision),
                     memory_unit=memory_unit,
                     timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 )
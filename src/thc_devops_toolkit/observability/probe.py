@@ -0,0 +1,81 @@
+# Copyright 2025 Tsung-Han Chang. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Readiness probes for services started by the toolkit."""
+
+import socket
+import time
+import urllib.error
+import urllib.request
+
+from .logger import LogLevel, logger
+
+
+def wait_http_ready(url: str, deadline: float = 30.0, interval: float = 0.1) -> None:
+    """Waits until an HTTP endpoint answers with status 200.
+
+    Args:
+        url (str): The readiness endpoint (e.g., "http://0.0.0.0:9000/minio/health/ready").
+        deadline (float, optional): Max seconds to wait. Defaults to 30.0.
+        interval (float, optional): Seconds between probes, also used as the per-request timeout. Defaults to 0.1.
+
+    Raises:
+        RuntimeError: If the endpoint is not ready before the deadline.
+    """
+    logger.info("Waiting for %s to be ready", url)
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            with urllib.request.urlopen(url, timeout=interval) as response:
+                if response.status == 200:
+                    logger.info("%s is ready", url)
+                    return
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(interval)
+    logger.highlight(
+        level=LogLevel.ERROR,
+        message=f"Timeout waiting for {url} to be ready",
+    )
+    raise RuntimeError(f"Timeout waiting for {url} to be ready")
+
+
+def wait_for_tcp(host: str, port: int, deadline: float = 30.0, interval: float = 0.05, connect_timeout: float = 0.25) -> None:
+    """Waits until a TCP port accepts connections.
+
+    Args:
+        host (str): The host to connect to.
+        port (int): The port to connect to.
+        deadline (float, optional): Max seconds to wait. Defaults to 30.0.
+        interval (float, optional): Seconds between attempts. Defaults to 0.05.
+        connect_timeout (float, optional): Timeout of a single connection attempt. Defaults to 0.25.
+
+    Raises:
+        RuntimeError: If the port does not accept connections before the deadline.
+    """
+    logger.info("Waiting for %s:%d to accept connections", host, port)
+    end = time.monotonic() + deadline
+    while time.monotonic() < end:
+        try:
+            with socket.create_connection((host, port), timeout=connect_timeout):
+                logger.info("%s:%d is accepting connections", host, port)
+                return
+        except OSError:
+            pass
+        time.sleep(interval)
+    logger.highlight(
+        level=LogLevel.ERROR,
+        message=f"Timeout waiting for {host}:{port} to accept connections",
+    )
+    raise RuntimeError(f"Timeout waiting for {host}:{port} to accept connections")
@@ -17,9 +17,15 @@ import json
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from thc_devops_toolkit.observability import logger
 
+# One session for all Mend API calls, so consecutive requests reuse the pooled TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=Retry(total=3, backoff_factor=0.3)))
+
 
 def get_refresh_token(email: str, user_key: str) -> str:
     """Obtains a Mend API refresh token.
@@ -33,7 +39,7 @@ def get_refresh_token(email: str, user_key: str) -> str:
     """
     url = "https://api-saas.whitesourcesoftware.com/api/v3.0/login"
     headers = {"Content-Type": "application/json"}
-    response = requests.post(url, headers=headers, data=json.dumps({"email": email, "userKey": user_key}))
+    response = _SESSION.post(url, headers=headers, data=json.dumps({"email": email, "userKey": user_key}))
 
     data = response.json()
     return str(data["response"]["refreshToken"])
@@ -50,7 +56,7 @@ def get_jwt_token(refresh_token: str) -> str:
     """
     url = "https://api-saas.whitesourcesoftware.com/api/v3.0/login/accessToken"
     headers = {"Content-Type": "application/json", "wss-refresh-token": refresh_token}
-    response = requests.post(url, headers=headers)
+    response = _SESSION.post(url, headers=headers)
 
     data = response.json()
     return str(data["response"]["jwtToken"])
@@ -72,7 +78,7 @@ def get_alerts_by_library(project_token: str, jwt_token: str) -> list[dict[str,
         "/alerts/security/groupBy/component?search=status:equals:ACTIVE"
     )
     headers = {"Authorization": f"Bearer {jwt_token}", "Content-Type": "application/json"}
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
 
     data = response.json()["retVal"]
     if not isinstance(data, list):
@@ -100,7 +106,7 @@ def get_vulnerabilities_by_project(project_token: str, jwt_token: str) -> list[d
     logger.info("Start getting vulnerabilities by project")
     url = f"https://api-saas.whitesourcesoftware.com/api/v2.0/projects/{project_token}/alerts/security?search=status:equals:ACTIVE"
     headers = {"Authorization": f"Bearer {jwt_token}", "Content-Type": "application/json"}
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
 
     data = response.json()["retVal"]
     if not isinstance(data, list):
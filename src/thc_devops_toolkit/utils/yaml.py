@@ -15,6 +15,7 @@
 """This module provides utility functions for parsing and manipulating YAML data."""
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from thc_devops_toolkit.observability import LogLevel, logger
@@ -95,12 +96,28 @@ def parse_key_path(key_path: str) -> list[str | int]:
     return tokens
 
 
-def get_value_from_dict(dictionary: dict[str, Any], key_path: str) -> tuple[Any, bool]:
+@lru_cache(maxsize=512)
+def compile_key_path(key_path: str) -> tuple[str | int, ...]:
+    """Parses a key path string once, like re.compile, for reuse across lookups.
+
+    The result is cached per key path string, and get_value_from_dict and set_value_to_dict
+    accept it in place of the string to skip parsing entirely.
+
+    Args:
+        key_path (str): The key path string (e.g., 'foo.bar[0].baz', "foo.'complex.key'.baz").
+
+    Returns:
+        tuple[str | int, ...]: Tuple of keys and indices.
+    """
+    return tuple(parse_key_path(key_path))
+
+
+def get_value_from_dict(dictionary: dict[str, Any], key_path: str | tuple[str | int, ...]) -> tuple[Any, bool]:
     """Gets a value from a nested dictionary using a key path.
 
     Args:
         dictionary (dict[str, Any]): The dictionary to search.
-        key_path (str): The key path string.
+        key_path (str | tuple[str | int, ...]): The key path string, or its compile_key_path result.
 
     Returns:
         tuple[Any, bool]: (value, True) if found, (None, False) otherwise.
@@ -109,7 +126,7 @@ def get_value_from_dict(dictionary: dict[str, Any], key_path: str) -> tuple[Any,
         level=LogLevel.DEBUG,
         message=f"Getting value from dict for key_path: {key_path}",
     )
-    tokens = parse_key_path(key_path)
+    tokens = key_path if isinstance(key_path, tuple) else compile_key_path(key_path)
     dict_iter: Any = dictionary
     for token in tokens:
         if isinstance(dict_iter, list):
@@ -130,6 +147,42 @@ def get_value_from_dict(dictionary: dict[str, Any], key_path: str) -> tuple[Any,
     return dict_iter, True
 
 
+def resolve_parent(dictionary: dict[str, Any], key_path: str | tuple[str | int, ...]) -> tuple[Any, str | int]:
+    """Resolves the container holding the last key of a key path.
+
+    The returned container and key can be read and assigned directly, so repeated accesses of the same
+    path skip the traversal, e.g. ``parent, key = resolve_parent(data, "foo.bar[0].baz"); parent[key] = 1``.
+
+    Args:
+        dictionary (dict[str, Any]): The dictionary to search.
+        key_path (str | tuple[str | int, ...]): The key path string, or its compile_key_path result.
+
+    Returns:
+        tuple[Any, str | int]: The parent container and the last key or index.
+
+    Raises:
+        ValueError: If the key path is empty.
+        KeyError: If a container on the path does not exist.
+    """
+    tokens = key_path if isinstance(key_path, tuple) else compile_key_path(key_path)
+    if not tokens:
+        raise ValueError("key_path must not be empty")
+    parent: Any = dictionary
+    for token in tokens[:-1]:
+        if isinstance(parent, list):
+            found = isinstance(token, int) and token < len(parent)
+        else:
+            found = isinstance(parent, dict) and token in parent
+        if not found:
+            logger.highlight(
+                level=LogLevel.ERROR,
+                message=f"Container {token} not found for key_path: {key_path}",
+            )
+            raise KeyError(f"Container {token} not found for key_path: {key_path}")
+        parent = parent[token]
+    return parent, tokens[-1]
+
+
 def _get_or_create_next(container: Any, token: str | int, next_token: str | int) -> Any:
     if isinstance(next_token, int):
         if token in container:
@@ -169,19 +222,19 @@ def _set_final_value(container: Any, token: str | int, value: Any) -> None:
         container[token] = value
 
 
-def set_value_to_dict(dictionary: dict[str, Any], key_path: str, value: Any) -> None:
+def set_value_to_dict(dictionary: dict[str, Any], key_path: str | tuple[str | int, ...], value: Any) -> None:
     """Sets a value in a nested dictionary using a key path.
 
     Args:
         dictionary (dict[str, Any]): The dictionary to modify.
-        key_path (str): The key path string.
+        key_path (str | tuple[str | int, ...]): The key path string, or its compile_key_path result.
         value (Any): The value to set.
     """
     logger.highlight(
         level=LogLevel.DEBUG,
         message=f"Setting value for key_path: {key_path} to {value}",
     )
-    tokens = parse_key_path(key_path)
+    tokens = key_path if isinstance(key_path, tuple) else compile_key_path(key_path)
     dict_iter: Any = dictionary
     for i, token in enumerate(tokens[:-1]):
         next_token = tokens[i + 1]
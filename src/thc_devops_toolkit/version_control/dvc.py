@@ -15,7 +15,9 @@
 """A collection of utilities for DVC version control tasks."""
 import bisect
 import json
+import os
 from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -25,6 +27,10 @@ from dvc.repo import Repo
 
 from thc_devops_toolkit.observability import LogLevel, logger
 
+# libyaml-backed loader/dumper when PyYAML was built with it, the pure Python ones otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class DvcOutput:
@@ -93,7 +99,7 @@ class DvcFile:
             raise FileNotFoundError(f"DVC file not found: {file_path}")
 
         with file_path.open("r", encoding="utf-8") as file:
-            data = yaml.load(file, Loader=yaml.FullLoader)
+            data = yaml.load(file, Loader=_YAML_LOADER)
 
         return cls.from_dict(data)
 
@@ -113,7 +119,7 @@ class DvcFile:
         """
         file_path = Path(file_path)
         with file_path.open("w", encoding="utf-8") as file:
-            yaml.dump(self.to_dict(), file, default_flow_style=False)
+            yaml.dump(self.to_dict(), file, Dumper=_YAML_DUMPER, default_flow_style=False)
 
     def get_output_by_path(self, path: str | Path) -> DvcOutput | None:
         """Find an output by its path.
@@ -324,6 +330,7 @@ class DvcRepo:
             local_path (str | Path): Path to the local DVC repository.
         """
         self.local_path: Path = Path(local_path)
+        self._repo: Repo | None = None
 
     def init(self) -> None:
         """Initialize a DVC repository at the local path."""
@@ -333,11 +340,36 @@ class DvcRepo:
     def _get_repo(self) -> Repo:
         """Get a DVC Repo object for the given path.
 
+        Inside a metadata_cache block the shared Repo object is returned.
+
         Returns:
             Repo: The DVC Repo object.
         """
+        if self._repo is not None:
+            return self._repo
         return Repo(str(self.local_path))
 
+    @contextmanager
+    def metadata_cache(self) -> Iterator["DvcRepo"]:
+        """Share one DVC Repo object across all operations inside the block.
+
+        DVC keeps the parsed config, index and file metadata on the Repo object, so reusing it avoids
+        rebuilding them for every add, push or remote call. The Repo object is closed when the block exits
+        so that later calls never read stale metadata.
+
+        Yields:
+            DvcRepo: This DvcRepo instance.
+        """
+        if self._repo is not None:
+            yield self
+            return
+        self._repo = Repo(str(self.local_path))
+        try:
+            yield self
+        finally:
+            repo, self._repo = self._repo, None
+            repo.close()
+
     def _get_cache_dir(self) -> Path:
         """Get the cache path for a given MD5 hash.
 
@@ -346,6 +378,30 @@ class DvcRepo:
         """
         return Path(self.local_path) / ".dvc" / "cache" / "files" / "md5"
 
+    def set_checksum_jobs(self, jobs: int | None = None) -> None:
+        """Set the number of threads DVC uses to hash files on add.
+
+        DVC hashes files larger than 1 MB concurrently with this many threads and hashes smaller files
+        inline, where the thread overhead would outweigh the hashing cost.
+
+        Args:
+            jobs (int | None, optional): Number of hashing threads. Defaults to None, which uses os.cpu_count().
+
+        Raises:
+            ValueError: If jobs is less than 1.
+        """
+        jobs = jobs if jobs is not None else os.cpu_count() or 1
+        if jobs < 1:
+            logger.highlight(
+                level=LogLevel.ERROR,
+                message=f"Checksum jobs must be at least 1, got {jobs}",
+            )
+            raise ValueError(f"Checksum jobs must be at least 1, got {jobs}")
+        repo = self._get_repo()
+        with repo.config.edit() as conf:
+            conf["core"]["checksum_jobs"] = jobs
+        logger.info("Set DVC checksum jobs to %d", jobs)
+
     def set_remote(
         self,
         remote_name: str,
@@ -458,12 +514,17 @@ class DvcRepo:
         cached_file.parent.mkdir(parents=True, exist_ok=True)
         return DvcTrackedFiles.from_json_file(cached_file)
 
-    def push(self, remote_name: str) -> None:
+    def push(self, remote_name: str, jobs: int | None = None) -> None:
         """Push tracked files to the DVC remote.
 
+        DVC estimates the remote size and either lists the remote once or queries the missing objects
+        individually, whichever is cheaper. The individual queries and the uploads run concurrently.
+
         Args:
             remote_name (str): Name of the remote.
+            jobs (int | None, optional): Number of concurrent remote queries and uploads.
+                Defaults to None, which uses the DVC default for the remote.
         """
         repo = self._get_repo()
-        repo.push(remote=remote_name)
+        repo.push(remote=remote_name, jobs=jobs)
         logger.info("Pushed tracked files to DVC remote '%s'", remote_name)
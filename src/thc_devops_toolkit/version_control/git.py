@@ -211,7 +211,19 @@ class GitRepo:
 
         logger.info("Cloning repo from %s on branch %s to %s", masked_pat_format_url, branch, self.local_path)
 
-        cmd = ["git", "clone", "-b", branch, pat_format_url, self.local_path]
+        # Write the local user config during the clone instead of spawning git config afterwards
+        cmd = [
+            "git",
+            "clone",
+            "-b",
+            branch,
+            "-c",
+            f"user.email={self.email}",
+            "-c",
+            f"user.name={self.credential.user}",
+            pat_format_url,
+            self.local_path,
+        ]
         process = subprocess.run(cmd, capture_output=True, check=False)
 
         if process.returncode != 0:
@@ -221,8 +233,8 @@ class GitRepo:
             )
             raise RuntimeError(f"Failed to clone repo (exit code: {process.returncode})")
 
-        self._set_config()
-        self._get_remotes()
+        # A fresh clone has exactly one remote, origin, pointing at the clone URL
+        self.remotes = {"origin": pat_format_url}
         logger.info("Successfully cloned repo from %s", masked_pat_format_url)
 
     def get_remote_url(self, mask_token: bool, remote_name: str = "origin") -> str:
@@ -1,3 +1,6 @@
+import os
+import shutil
+import subprocess
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -15,8 +18,8 @@ class TestPlaybook:
         def __init__(self, playbook_file: str | Path, inventory_file: str | Path, 
                      limit: str, extravars: dict[str, Any],
                      vars_overrides: dict[str, Any] = None,
-                     mandatory_vars: set[str] = None):
-            super().__init__(playbook_file, inventory_file, limit, extravars)
+                     mandatory_vars: set[str] = None, **kwargs: Any):
+            super().__init__(playbook_file, inventory_file, limit, extravars, **kwargs)
             self._vars_overrides = vars_overrides or {}
             self._mandatory_vars = mandatory_vars or set()
         
@@ -129,7 +132,8 @@ class TestPlaybook:
             playbook="test.yml",
             inventory="inventory",
             extravars={"var1": "value1", "override_var": "override_value"},
-            limit="all"
+            limit="all",
+            envvars={},
         )
         
         # Verify return value
@@ -202,6 +206,58 @@ class TestPlaybook:
         result = playbook.run()
         assert result == ""
 
+    def test_config_envvars(self):
+        """Test the execution settings are passed as ANSIBLE_* environment variables."""
+        playbook = self.ConcretePlaybook(
+            playbook_file="test.yml",
+            inventory_file="inventory",
+            limit="all",
+            extravars={}
+        )
+
+        assert playbook.config_envvars == {}
+
+        playbook = self.ConcretePlaybook(
+            playbook_file="test.yml",
+            inventory_file="inventory",
+            limit="all",
+            extravars={},
+            forks=30,
+            strategy="free",
+            pipelining=True,
+        )
+
+        assert playbook.config_envvars == {
+            "ANSIBLE_FORKS": "30",
+            "ANSIBLE_STRATEGY": "free",
+            "ANSIBLE_PIPELINING": "True",
+        }
+
+    @pytest.mark.skipif(shutil.which("ansible-config") is None, reason="ansible-config is not installed")
+    def test_config_envvars_keep_user_ansible_cfg(self, tmp_path):
+        """Test that settings of the user's ansible.cfg still apply next to the execution settings."""
+        (tmp_path / "ansible.cfg").write_text("[defaults]\nhost_key_checking = False\nforks = 7\n")
+        playbook = self.ConcretePlaybook(
+            playbook_file="test.yml",
+            inventory_file="inventory",
+            limit="all",
+            extravars={},
+            strategy="linear",
+        )
+        env = {key: value for key, value in os.environ.items() if key != "ANSIBLE_CONFIG"}
+        process = subprocess.run(
+            ["ansible-config", "dump", "--only-changed"],
+            cwd=tmp_path,
+            env={**env, **playbook.config_envvars},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert "HOST_KEY_CHECKING(" + str(tmp_path / "ansible.cfg") + ") = False" in process.stdout
+        assert "DEFAULT_FORKS(" + str(tmp_path / "ansible.cfg") + ") = 7" in process.stdout
+        assert "DEFAULT_STRATEGY(env: ANSIBLE_STRATEGY) = linear" in process.stdout
+
     def test_abstract_methods_not_implemented(self):
         """Test that abstract methods raise NotImplementedError when not implemented."""
         with pytest.raises(TypeError):
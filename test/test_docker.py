@@ -1,7 +1,36 @@
+import asyncio
+import http.server
+import json
+import pickle
+import socketserver
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from thc_devops_toolkit.containerization import docker as docker_mod
 
+_engine_socket_path = docker_mod._engine_socket_path
+
+@pytest.fixture(autouse=True)
+def _no_engine_api(monkeypatch):
+    # keep inspect on the mocked CLI path even where a local daemon socket exists
+    monkeypatch.setattr(docker_mod, "_engine_socket_path", lambda: None)
+
+@pytest.fixture(autouse=True)
+def _empty_auth_cache(monkeypatch):
+    monkeypatch.setattr(docker_mod, "_AUTH_CACHE", {})
+
+@pytest.fixture(autouse=True)
+def _empty_unprobeable_registries(monkeypatch):
+    monkeypatch.setattr(docker_mod, "_UNPROBEABLE_REGISTRIES", set())
+
+@pytest.fixture(autouse=True)
+def _empty_inspect_cache():
+    docker_mod.invalidate_inspect_cache()
+
 def _mock_inspect_output():
     return MagicMock(returncode=0, stdout=b'[{"RepoDigests": ["repo@sha256:abcdef1234567890"], "Size": 1234567}]')
 
@@ -14,12 +43,39 @@ def test_docker_login_success(mock_run):
     assert args[:3] == ["docker", "login", "docker.io"]
     assert "--password-stdin" in args
 
+@patch("subprocess.run")
+def test_docker_login_strips_ansi_escapes(mock_run):
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_login("docker.io", "user", "\x1b[200~päss\x1b[201~")
+    assert mock_run.call_args[1]["input"] == "päss".encode("utf-8")
+
 @patch("subprocess.run")
 def test_docker_login_fail(mock_run):
     mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
     with pytest.raises(RuntimeError):
         docker_mod.docker_login("docker.io", "user", "pass")
 
+@patch("subprocess.run")
+def test_docker_login_reuses_cached_login(mock_run, monkeypatch):
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_login("docker.io", "user", "pass")
+    docker_mod.docker_login("docker.io", "user", "pass")
+    assert mock_run.call_count == 1
+    docker_mod.docker_login("docker.io", "other", "pass")
+    assert mock_run.call_count == 2
+    monkeypatch.setattr(docker_mod.time, "monotonic", lambda: float("inf"))
+    docker_mod.docker_login("docker.io", "user", "pass")
+    assert mock_run.call_count == 3
+
+@patch("subprocess.run")
+def test_docker_login_fail_not_cached(mock_run):
+    mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_login("docker.io", "user", "pass")
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_login("docker.io", "user", "pass")
+    assert mock_run.call_count == 2
+
 @patch("subprocess.run")
 def test_docker_pull_success(mock_run):
     mock_run.return_value = MagicMock(returncode=0)
@@ -28,12 +84,129 @@ def test_docker_pull_success(mock_run):
     args = mock_run.call_args[0][0]
     assert args == ["docker", "pull", "repo/image:tag"]
 
+@patch("subprocess.run")
+def test_docker_pull_disables_cli_hints(mock_run, monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "unix:///tmp/docker.sock")
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_pull("repo/image:tag")
+    env = mock_run.call_args[1]["env"]
+    assert env["DOCKER_CLI_HINTS"] == "false"
+    assert env["DOCKER_HOST"] == "unix:///tmp/docker.sock"
+
 @patch("subprocess.run")
 def test_docker_pull_fail(mock_run):
     mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
     with pytest.raises(RuntimeError):
         docker_mod.docker_pull("repo/image:tag")
 
+@patch("subprocess.run")
+def test_docker_pull_fail_message(mock_run):
+    mock_run.return_value = MagicMock(returncode=2, stderr=b"manifest unknown")
+    with pytest.raises(RuntimeError, match=r"^Failed to pull image: repo/image:tag \(exit code: 2\)\nmanifest unknown$"):
+        docker_mod.docker_pull("repo/image:tag")
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("busybox", ("docker.io", "library/busybox", "latest")),
+        ("team/app:1.0", ("docker.io", "team/app", "1.0")),
+        ("registry:5000/team/app", ("registry:5000", "team/app", "latest")),
+        ("ghcr.io/org/app:v2", ("ghcr.io", "org/app", "v2")),
+    ],
+)
+def test_split_image_name(name, expected):
+    assert docker_mod._split_image_name(name) == expected
+
+@patch("subprocess.run")
+def test_docker_pull_skips_up_to_date_image(mock_run, monkeypatch):
+    monkeypatch.setattr(docker_mod, "_engine_inspect", lambda name, kinds: {"RepoDigests": ["repo/image@sha256:abc"]})
+    monkeypatch.setattr(docker_mod, "_remote_digest", lambda name: "sha256:abc")
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_pull("repo/image:tag")
+    mock_run.assert_not_called()
+    docker_mod.docker_pull("repo/image:tag", force=True)
+    mock_run.assert_called_once()
+
+@patch("subprocess.run")
+def test_docker_pull_outdated_image(mock_run, monkeypatch):
+    monkeypatch.setattr(docker_mod, "_engine_inspect", lambda name, kinds: {"RepoDigests": ["repo/image@sha256:old"]})
+    monkeypatch.setattr(docker_mod, "_remote_digest", lambda name: "sha256:new")
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_pull("repo/image:tag")
+    mock_run.assert_called_once()
+
+def test_remote_digest_anonymous_token(monkeypatch):
+    challenge = urllib.error.HTTPError(
+        "url", 401, "Unauthorized", {"WWW-Authenticate": 'Bearer realm="https://auth.example/token",service="registry.example"'}, None
+    )
+    token = MagicMock()
+    token.__enter__.return_value.read.return_value = b'{"token": "t0k"}'
+    digest = MagicMock()
+    digest.__enter__.return_value.headers = {"Docker-Content-Digest": "sha256:abc"}
+    responses = [challenge, token, digest]
+    opened = []
+
+    def fake_urlopen(request, timeout):
+        opened.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert docker_mod._remote_digest("registry.example/team/app:1.0") == "sha256:abc"
+    assert opened[0].full_url == "https://registry.example/v2/team/app/manifests/1.0"
+    assert opened[1] == "https://auth.example/token?service=registry.example"
+    assert opened[2].get_header("Authorization") == "Bearer t0k"
+
+def test_remote_digest_skips_logged_in_registry(monkeypatch):
+    docker_mod._AUTH_CACHE[("registry.example", "user")] = time.monotonic() + 60
+    monkeypatch.setattr(urllib.request, "urlopen", MagicMock(side_effect=AssertionError("registry probed")))
+    assert docker_mod._remote_digest("registry.example/team/app:1.0") is None
+
+def test_remote_digest_remembers_unreachable_registry(monkeypatch):
+    fake_urlopen = MagicMock(side_effect=urllib.error.URLError(TimeoutError("timed out")))
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert docker_mod._remote_digest("registry.example/team/app:1.0") is None
+    assert docker_mod._remote_digest("registry.example/team/other:2.0") is None
+    fake_urlopen.assert_called_once()
+    assert fake_urlopen.call_args.kwargs["timeout"] == docker_mod._REGISTRY_TIMEOUT
+
+def test_remote_digest_remembers_denied_registry(monkeypatch):
+    denied = urllib.error.HTTPError("url", 401, "Unauthorized", {"WWW-Authenticate": 'Basic realm="registry"'}, None)
+    fake_urlopen = MagicMock(side_effect=denied)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert docker_mod._remote_digest("registry.example/team/app:1.0") is None
+    assert docker_mod._remote_digest("registry.example/team/app:1.0") is None
+    fake_urlopen.assert_called_once()
+
+@patch("subprocess.run")
+def test_docker_command_error(mock_run):
+    mock_run.return_value = MagicMock(returncode=1, stderr=b"denied")
+    with pytest.raises(docker_mod.DockerCommandError) as exc_info:
+        docker_mod.docker_push("repo/image:tag")
+    error = exc_info.value
+    assert (error.cmd, error.returncode, error.output) == (["docker", "push", "repo/image:tag"], 1, b"denied")
+    assert str(pickle.loads(pickle.dumps(error))) == "Failed to push image: repo/image:tag (exit code: 1)\ndenied"
+
+def test_docker_pull_many_bounded_transfers(monkeypatch):
+    running, peak = [], []
+    lock = threading.Lock()
+
+    def fake_run(cmd, **kwargs):
+        with lock:
+            running.append(cmd)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(cmd)
+        return MagicMock(returncode=0)
+
+    monkeypatch.setattr(docker_mod.subprocess, "run", fake_run)
+    docker_mod.docker_pull_many([f"repo/image:{index}" for index in range(12)], max_workers=12)
+    assert len(peak) == 12
+    assert max(peak) <= docker_mod._MAX_CONCURRENT_TRANSFERS
+
 @patch("subprocess.run")
 def test_docker_push_success(mock_run):
     mock_run.return_value = MagicMock(returncode=0)
@@ -61,22 +234,223 @@ def test_docker_inspect_fail(mock_run):
     with pytest.raises(RuntimeError):
         docker_mod.docker_inspect("repo/image:tag")
 
+class _EngineHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        return "docker.sock"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        if self.path.startswith("/images/"):
+            status, body = 200, json.dumps({"RepoDigests": ["repo@sha256:abc"], "Size": 42}).encode()
+        else:
+            status, body = 404, b'{"message": "No such container"}'
+        self._reply(status, body)
+
+    def do_POST(self):
+        self.server.calls.append(("POST", self.path))
+        self._reply(404 if "missing" in self.path else 201 if "/tag?" in self.path else 204, b"")
+
+    def do_DELETE(self):
+        self.server.calls.append(("DELETE", self.path))
+        self._reply(404 if "missing" in self.path else 200, b"[]")
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class _EngineServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        super().__init__(path, _EngineHandler)
+        self.paths = []
+        self.calls = []
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+@pytest.fixture
+def engine_server(tmp_path, monkeypatch):
+    server = _EngineServer(str(tmp_path / "docker.sock"))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(docker_mod, "_engine_socket_path", lambda: server.server_address)
+    monkeypatch.setattr(docker_mod, "_engine_local", threading.local())
+    yield server
+    server.shutdown()
+    server.server_close()
+
 @patch("subprocess.run")
-def test_docker_build_success(mock_run):
-    mock_run.return_value = MagicMock(returncode=0)
-    docker_mod.docker_build("repo/image:tag", "Dockerfile", [{"key": "ARG1", "value": "val1"}])
+def test_docker_inspect_engine_api(mock_run, engine_server):
+    assert docker_mod.docker_inspect("repo/image:tag")["Size"] == 42
+    assert docker_mod.get_image_size("repo/image:tag") == "42.0B"
+    mock_run.assert_not_called()
+    assert engine_server.paths[:2] == ["/containers/repo/image:tag/json", "/images/repo/image:tag/json"]
+    assert engine_server.connections == 1
+
+@patch("subprocess.run")
+def test_engine_control_plane(mock_run, engine_server):
+    docker_mod.docker_tag("repo/image:tag", "registry:5000/team/image:v2")
+    docker_mod.docker_remove_image("repo/image:tag")
+    assert engine_server.calls == [
+        ("POST", "/images/repo/image:tag/tag?repo=registry%3A5000%2Fteam%2Fimage&tag=v2"),
+        ("DELETE", "/images/repo/image:tag"),
+    ]
+    mock_run.assert_not_called()
+
+@patch("subprocess.run")
+def test_engine_control_plane_failure_uses_cli(mock_run, engine_server):
+    mock_run.return_value = MagicMock(returncode=1, stderr=b"Error: No such image: missing:tag")
+    with pytest.raises(docker_mod.DockerCommandError, match="No such image"):
+        docker_mod.docker_remove_image("missing:tag")
+    assert engine_server.calls == [("DELETE", "/images/missing:tag")]
+    assert mock_run.call_args[0][0] == ["docker", "rmi", "missing:tag"]
+
+@patch("subprocess.run")
+def test_docker_inspect_engine_unreachable_falls_back(mock_run, tmp_path, monkeypatch):
+    monkeypatch.setattr(docker_mod, "_engine_socket_path", lambda: str(tmp_path / "missing.sock"))
+    mock_run.return_value = _mock_inspect_output()
+    assert docker_mod.docker_inspect("repo/image:tag")["Size"] == 1234567
     mock_run.assert_called_once()
-    args = mock_run.call_args[0][0]
+
+@patch("subprocess.run")
+def test_docker_inspect_many_single_cli_call(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout=b'[{"Size": 1}, {"Size": 2}]')
+    infos = docker_mod.docker_inspect_many(["repo/a:1", docker_mod.ImageRef("host", "repo", "b", "2")])
+    assert [info["Size"] for info in infos] == [1, 2]
+    mock_run.assert_called_once()
+    assert mock_run.call_args[0][0] == ["docker", "inspect", "repo/a:1", "host/repo/b:2"]
+
+@patch("subprocess.run")
+def test_docker_inspect_many_fail(mock_run):
+    mock_run.return_value = MagicMock(returncode=1, stdout=b"[]", stderr=b"No such object: repo/a:1")
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_inspect_many(["repo/a:1"])
+
+@patch("subprocess.run")
+def test_docker_inspect_many_engine_api(mock_run, engine_server):
+    infos = docker_mod.docker_inspect_many(["repo/a:1", "repo/b:2"])
+    assert [info["Size"] for info in infos] == [42, 42]
+    mock_run.assert_not_called()
+    assert engine_server.connections == 1
+
+def test_engine_socket_path_remote_host(monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "tcp://10.0.0.1:2376")
+    assert _engine_socket_path() is None
+    monkeypatch.setenv("DOCKER_HOST", "unix:///tmp/docker.sock")
+    assert _engine_socket_path() == "/tmp/docker.sock"
+
+def test_engine_socket_path_remote_context(monkeypatch, tmp_path):
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    monkeypatch.delenv("DOCKER_CONTEXT", raising=False)
+    (tmp_path / "config.json").write_text('{"currentContext": "remote"}')
+    monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+    assert _engine_socket_path() is None
+
+@patch("subprocess.Popen")
+def test_docker_build_success(mock_popen):
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout = [b"#1 building\n"]
+    process.wait.return_value = 0
+    docker_mod.docker_build(
+        "repo/image:tag", "Dockerfile", [{"key": "ARG1", "value": "val1"}], cache_from=["type=registry,ref=repo/image:cache"]
+    )
+    mock_popen.assert_called_once()
+    args = mock_popen.call_args[0][0]
     assert "--build-arg" in args
+    assert args[args.index("--cache-from") + 1] == "type=registry,ref=repo/image:cache"
     assert "-t" in args
     assert "-f" in args
     assert args[-1] == "."
-
-@patch("subprocess.run")
-def test_docker_build_fail(mock_run):
-    mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
-    with pytest.raises(RuntimeError):
+    assert mock_popen.call_args.kwargs["env"]["DOCKER_BUILDKIT"] == "1"
+
+@patch("subprocess.Popen")
+def test_docker_build_buildx_platform(mock_popen):
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout = []
+    process.wait.return_value = 0
+    docker_mod.docker_build(
+        "repo/image:tag",
+        "Dockerfile",
+        None,
+        cache_to=["type=registry,ref=repo/image:cache,mode=max"],
+        platform="linux/arm64",
+        buildx=True,
+    )
+    args = mock_popen.call_args[0][0]
+    assert args[:4] == ["docker", "buildx", "build", "--load"]
+    assert args[args.index("--platform") + 1] == "linux/arm64"
+    assert args[args.index("--cache-to") + 1] == "type=registry,ref=repo/image:cache,mode=max"
+
+@patch("subprocess.Popen")
+def test_docker_build_fail(mock_popen):
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout = [b"step %d\n" % i for i in range(100)]
+    process.wait.return_value = 1
+    with pytest.raises(RuntimeError) as excinfo:
         docker_mod.docker_build("repo/image:tag", "Dockerfile", None)
+    assert "step 99" in str(excinfo.value)
+    assert "step 0\n" not in str(excinfo.value)
+
+@patch("subprocess.Popen")
+def test_make_builder(mock_popen):
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout = []
+    process.wait.return_value = 0
+    build = docker_mod.make_builder("Dockerfile", ["PY", "OS"])
+    build("repo/app:py3.11", PY="3.11", OS="alpine")
+    build("repo/app:py3.12", PY=3.12, OS="alpine")
+    assert mock_popen.call_args_list[0][0][0] == [
+        "docker", "build", "--build-arg", "PY=3.11", "--build-arg", "OS=alpine", "-t", "repo/app:py3.11", "-f", "Dockerfile", ".",
+    ]
+    assert mock_popen.call_args_list[1][0][0][3] == "PY=3.12"
+    with pytest.raises(KeyError):
+        build("repo/app:bad", PY="3.11")
+
+@patch("subprocess.Popen")
+def test_docker_build_many_bake(mock_popen, monkeypatch, tmp_path):
+    monkeypatch.setattr(docker_mod, "_has_buildx", lambda: True)
+    bake_files = []
+
+    def read_bake_file(cmd, **kwargs):
+        bake_files.append(json.loads(open(cmd[cmd.index("-f") + 1]).read()))
+        return mock_popen.return_value
+
+    mock_popen.side_effect = read_bake_file
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout = [b"#1 done\n"]
+    process.wait.return_value = 0
+    specs = [
+        docker_mod.BuildSpec("repo/a:1", "Dockerfile.a", [{"key": "VERSION", "value": 1}]),
+        docker_mod.BuildSpec("repo/b:1", str(tmp_path / "Dockerfile.b"), context=str(tmp_path)),
+    ]
+    docker_mod.docker_build_many(specs, push=True)
+    cmd = mock_popen.call_args[0][0]
+    assert cmd[:3] == ["docker", "buildx", "bake"] and cmd[-1] == "--push"
+    targets = bake_files[0]["target"]
+    assert bake_files[0]["group"]["default"]["targets"] == ["target-0", "target-1"]
+    assert targets["target-0"]["tags"] == ["repo/a:1"]
+    assert targets["target-0"]["args"] == {"VERSION": "1"}
+    assert targets["target-1"]["context"] == str(tmp_path)
+    assert targets["target-1"]["dockerfile"] == str(tmp_path / "Dockerfile.b")
+
+def test_docker_build_many_without_buildx(monkeypatch):
+    monkeypatch.setattr(docker_mod, "_has_buildx", lambda: False)
+    built, pushed = [], []
+    monkeypatch.setattr(docker_mod, "docker_build", lambda image, path, args, context: built.append((image, context)))
+    monkeypatch.setattr(docker_mod, "docker_push", pushed.append)
+    specs = [docker_mod.BuildSpec("repo/a:1", "Dockerfile"), docker_mod.BuildSpec("repo/b:1", "Dockerfile", context="b")]
+    docker_mod.docker_build_many(specs, push=True)
+    assert sorted(built) == [("repo/a:1", "."), ("repo/b:1", "b")]
+    assert sorted(pushed) == ["repo/a:1", "repo/b:1"]
 
 @patch("subprocess.run")
 def test_docker_tag_success(mock_run):
@@ -85,6 +459,8 @@ def test_docker_tag_success(mock_run):
     mock_run.assert_called_once()
     args = mock_run.call_args[0][0]
     assert args == ["docker", "tag", "repo/image:tag", "repo/image:newtag"]
+    assert mock_run.call_args[1]["stdout"] == docker_mod.subprocess.DEVNULL
+    assert mock_run.call_args[1]["stderr"] == docker_mod.subprocess.PIPE
 
 @patch("subprocess.run")
 def test_docker_tag_fail(mock_run):
@@ -124,6 +500,26 @@ def test_docker_run_daemon_with_env_and_ports(mock_run):
     assert "8080:80" in args
     assert "3000:3000" in args
 
+@patch("subprocess.run")
+def test_docker_run_daemon_restart_policy(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout=b"containerid\n")
+    docker_mod.docker_run_daemon("repo/image:tag", restart_policy="unless-stopped")
+    args = mock_run.call_args[0][0]
+    assert args[args.index("--restart") + 1] == "unless-stopped"
+    assert args.index("--restart") < args.index("repo/image:tag")
+
+@patch("subprocess.run")
+def test_docker_run_daemon_healthcheck(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout=b"containerid\n")
+    docker_mod.docker_run_daemon(
+        "repo/image:tag", health_cmd="true", health_interval="500ms", health_timeout="2s", health_retries=20
+    )
+    args = mock_run.call_args[0][0]
+    assert args[args.index("--health-cmd") + 1] == "true"
+    assert args[args.index("--health-interval") + 1] == "500ms"
+    assert args[args.index("--health-timeout") + 1] == "2s"
+    assert args[args.index("--health-retries") + 1] == "20"
+
 @patch("subprocess.run")
 def test_docker_run_daemon_fail(mock_run):
     mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
@@ -131,26 +527,51 @@ def test_docker_run_daemon_fail(mock_run):
         docker_mod.docker_run_daemon("repo/image:tag")
 
 @patch("subprocess.run")
-@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
-def test_docker_stop_success(mock_inspect, mock_run):
+def test_inspect_state(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stdout=b"running\n")
+    assert docker_mod._inspect_state("cname") == "running"
+    assert mock_run.call_args[0][0] == ["docker", "inspect", "--type", "container", "--format", "{{.State.Status}}", "cname"]
+    mock_run.return_value = MagicMock(returncode=1, stdout=b"")
+    assert docker_mod._inspect_state("cname") == ""
+
+@patch("subprocess.run")
+def test_inspect_state_engine_api_missing_container(mock_run, engine_server):
+    assert docker_mod._inspect_state("cname") == ""
+    assert engine_server.paths == ["/containers/cname/json"]
+    mock_run.assert_not_called()
+
+@patch("subprocess.run")
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_stop_success(mock_inspect, mock_wait, mock_run):
     mock_run.return_value = MagicMock(returncode=0)
-    mock_inspect.side_effect = [
-        {"State": {"Status": "running"}},
-        {"State": {"Status": "exited"}}
-    ]
-    docker_mod.docker_stop("cname", timeout=2, poll_interval=0.01)
+    mock_inspect.return_value = "running"
+    mock_wait.return_value = True
+    docker_mod.docker_stop("cname", timeout=2)
     mock_run.assert_called_once()
     args = mock_run.call_args[0][0]
     assert args == ["docker", "stop", "cname"]
-    assert mock_inspect.call_count >= 2
+    mock_inspect.assert_called_once_with("cname")
+    assert mock_wait.call_args[0][:2] == ("cname", ["die"])
 
 @patch("subprocess.run")
-@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
-def test_docker_stop_timeout(mock_inspect, mock_run):
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_stop_already_exited(mock_inspect, mock_wait, mock_run):
     mock_run.return_value = MagicMock(returncode=0)
-    mock_inspect.return_value = {"State": {"Status": "running"}}
+    mock_inspect.return_value = "exited"
+    docker_mod.docker_stop("cname", timeout=2)
+    mock_wait.assert_not_called()
+
+@patch("subprocess.run")
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_stop_timeout(mock_inspect, mock_wait, mock_run):
+    mock_run.return_value = MagicMock(returncode=0)
+    mock_inspect.return_value = "running"
+    mock_wait.return_value = False
     with pytest.raises(RuntimeError):
-        docker_mod.docker_stop("cname", timeout=0.05, poll_interval=0.01)
+        docker_mod.docker_stop("cname", timeout=1)
 
 @patch("subprocess.run")
 def test_docker_stop_fail(mock_run):
@@ -159,26 +580,38 @@ def test_docker_stop_fail(mock_run):
         docker_mod.docker_stop("cname")
 
 @patch("subprocess.run")
-@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
-def test_docker_remove_success(mock_inspect, mock_run):
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_remove_success(mock_inspect, mock_wait, mock_run):
     mock_run.return_value = MagicMock(returncode=0)
-    mock_inspect.side_effect = [
-        {},
-        Exception("not found")
-    ]
-    docker_mod.docker_remove("cname", timeout=2, poll_interval=0.01)
+    mock_inspect.return_value = ""
+    docker_mod.docker_remove("cname", timeout=2)
     mock_run.assert_called_once()
     args = mock_run.call_args[0][0]
     assert args == ["docker", "rm", "cname"]
-    assert mock_inspect.call_count >= 2
+    mock_wait.assert_not_called()
 
 @patch("subprocess.run")
-@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
-def test_docker_remove_timeout(mock_inspect, mock_run):
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_remove_waits_for_destroy(mock_inspect, mock_wait, mock_run):
+    mock_run.return_value = MagicMock(returncode=0)
+    mock_inspect.return_value = "exited"
+    mock_wait.return_value = True
+    docker_mod.docker_remove("cname", timeout=2)
+    assert mock_wait.call_args[0][:2] == ("cname", ["destroy"])
+
+@patch("subprocess.run")
+@patch("thc_devops_toolkit.containerization.docker._wait_for_container_event")
+@patch("thc_devops_toolkit.containerization.docker._inspect_state")
+def test_docker_remove_timeout(mock_inspect, mock_wait, mock_run):
     mock_run.return_value = MagicMock(returncode=0)
-    mock_inspect.return_value = {}
+    mock_inspect.return_value = "exited"
+    mock_wait.return_value = False
     with pytest.raises(RuntimeError):
-        docker_mod.docker_remove("cname", timeout=0.05, poll_interval=0.01)
+        docker_mod.docker_remove("cname", timeout=1)
+    # ignore_errors True should not raise
+    docker_mod.docker_remove("cname", ignore_errors=True, timeout=1)
 
 @patch("subprocess.run")
 def test_docker_remove_fail(mock_run):
@@ -188,6 +621,20 @@ def test_docker_remove_fail(mock_run):
     # ignore_errors True should not raise
     docker_mod.docker_remove("cname", ignore_errors=True)
 
+@patch("subprocess.Popen")
+def test_wait_for_container_event(mock_popen):
+    process = mock_popen.return_value.__enter__.return_value
+    process.stdout.readline.return_value = b"die\n"
+    assert docker_mod._wait_for_container_event("cname", ["die"], since=100.0, until=110.0)
+    args = mock_popen.call_args[0][0]
+    assert args[:2] == ["docker", "events"]
+    assert ["--since", "100.000", "--until", "110.000"] == args[2:6]
+    assert "container=cname" in args
+    assert "event=die" in args
+    process.terminate.assert_called_once()
+    process.stdout.readline.return_value = b""
+    assert not docker_mod._wait_for_container_event("cname", ["die"], since=100.0, until=110.0)
+
 @patch("subprocess.run")
 def test_docker_remove_image_success(mock_run):
     mock_run.return_value = MagicMock(returncode=0)
@@ -226,6 +673,14 @@ def test_docker_exec_success(mock_run):
     assert "-w" in args
     assert "ls" in args
 
+@patch("subprocess.run")
+def test_docker_exec_print_output_skipped_when_info_disabled(mock_run, monkeypatch):
+    monkeypatch.setattr(docker_mod.logger, "is_enabled", lambda level: False)
+    stdout = MagicMock()
+    mock_run.return_value = MagicMock(returncode=0, stdout=stdout, stderr=b"")
+    docker_mod.docker_exec(command=["ls"], obj="cname", print_output=True)
+    stdout.decode.assert_not_called()
+
 @patch("subprocess.run")
 def test_docker_exec_fail(mock_run):
     mock_run.return_value = MagicMock(returncode=1, stderr=b"fail")
@@ -248,9 +703,14 @@ def test_get_image_digest_fail(mock_inspect):
     mock_inspect.return_value = {"RepoDigests": []}
     assert docker_mod.get_image_digest("repo/image:tag") == ""
     mock_inspect.return_value = {"RepoDigests": ["repo@sha256:"]}
+    docker_mod.invalidate_inspect_cache()
     assert docker_mod.get_image_digest("repo/image:tag") == ""
     mock_inspect.return_value = {"RepoDigests": ["repo@sha256:123"]}
+    docker_mod.invalidate_inspect_cache()
     assert docker_mod.get_image_digest("repo/image:tag", precision=6) == "123"
+    mock_inspect.return_value = {"RepoDigests": ["repo@md5:123"]}
+    docker_mod.invalidate_inspect_cache()
+    assert docker_mod.get_image_digest("repo/image:tag") == ""
     with pytest.raises(ValueError):
         docker_mod.get_image_digest("repo/image:tag", precision=4)
 
@@ -260,8 +720,208 @@ def test_get_image_size_success(mock_inspect):
     size = docker_mod.get_image_size("repo/image:tag")
     assert size.endswith("MB") or size.endswith("KB") or size.endswith("B")
 
+@pytest.mark.parametrize(
+    "size, expected",
+    [(0, "0.00B"), (1000, "1000B"), (1001, "1.00KB"), (10**6, "1000KB"), (45_600_000, "45.6MB"), (2 * 10**18, "2000PB")],
+)
+def test_get_image_size_units(size, expected):
+    assert docker_mod.get_image_size("repo/image:tag", image_info={"Size": size}) == expected
+
+@patch("subprocess.run")
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_image_inspect_cache(mock_inspect, mock_run):
+    mock_inspect.return_value = {"Size": 1234567, "RepoDigests": ["repo@sha256:abcdef1234567890"]}
+    assert docker_mod.get_image_size("repo/image:tag") == "1.23MB"
+    assert docker_mod.get_image_digest("repo/image:tag") == "abcdef"
+    assert mock_inspect.call_count == 1
+    mock_run.return_value = MagicMock(returncode=0)
+    docker_mod.docker_tag("other/image:tag", "repo/image:tag")
+    docker_mod.get_image_digest("repo/image:tag")
+    assert mock_inspect.call_count == 2
+
 @patch("thc_devops_toolkit.containerization.docker.docker_inspect")
 def test_get_image_size_fail(mock_inspect):
     mock_inspect.return_value = {"RepoDigests": ["repo@sha256:abcdef1234567890"]}
     with pytest.raises(KeyError):
         docker_mod.get_image_size("repo/image:tag")
+
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_get_image_metadata_from_image_info(mock_inspect):
+    image_info = {"Size": 1234567, "RepoDigests": ["repo@sha256:abcdef1234567890"]}
+    assert docker_mod.get_image_size("repo/image:tag", image_info=image_info) == "1.23MB"
+    assert docker_mod.get_image_digest("repo/image:tag", precision=8, image_info=image_info) == "abcdef12"
+    mock_inspect.assert_not_called()
+
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_get_image_metadata(mock_inspect):
+    mock_inspect.return_value = {"Size": 1234567, "RepoDigests": ["repo@sha256:abcdef1234567890"]}
+    assert docker_mod.get_image_metadata("repo/image:tag", precision=8) == ("abcdef12", "1.23MB")
+    mock_inspect.assert_called_once_with("repo/image:tag")
+
+def test_image_ref():
+    ref = docker_mod.ImageRef(host="docker.io", repo="user", name="busybox", tag="1.0")
+    assert str(ref) == "docker.io/user/busybox:1.0"
+    assert str(docker_mod.ImageRef(host="docker.io", repo="", name="busybox")) == "docker.io/busybox:latest"
+    assert ref == docker_mod.ImageRef(host="docker.io", repo="user", name="busybox", tag="1.0")
+    assert {ref: 1}[ref.with_tag("1.0")] == 1
+    assert ref.with_tag("tmp").full == "docker.io/user/busybox:tmp"
+
+@patch("subprocess.run")
+def test_docker_pull_image_ref(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+    docker_mod.docker_pull(docker_mod.ImageRef(host="docker.io", repo="user", name="busybox", tag="1.0"))
+    assert mock_run.call_args[0][0] == ["docker", "pull", "docker.io/user/busybox:1.0"]
+
+@patch("thc_devops_toolkit.containerization.docker.docker_pull")
+@patch("subprocess.run")
+def test_ensure_image_present(mock_run, mock_pull):
+    mock_run.return_value = MagicMock(returncode=0, stdout=b"sha256:abc\n", stderr=b"")
+    assert docker_mod.ensure_image("img:tag") is False
+    assert mock_run.call_args[0][0][:3] == ["docker", "image", "inspect"]
+    assert mock_run.call_args[1]["stdout"] is subprocess.DEVNULL
+    assert mock_run.call_args[1]["stderr"] is subprocess.DEVNULL
+    mock_pull.assert_not_called()
+
+@patch("thc_devops_toolkit.containerization.docker.docker_pull")
+@patch("subprocess.run")
+def test_ensure_image_missing(mock_run, mock_pull):
+    mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"No such image")
+    assert docker_mod.ensure_image("img:tag") is True
+    mock_pull.assert_called_once_with("img:tag")
+
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_docker_wait_healthy(mock_inspect):
+    mock_inspect.side_effect = [
+        {"State": {"Health": {"Status": "starting"}}},
+        {"State": {"Health": {"Status": "healthy"}}},
+    ]
+    docker_mod.docker_wait_healthy("cname", timeout=5, poll_interval=0)
+    assert mock_inspect.call_count == 2
+
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_docker_wait_healthy_without_healthcheck(mock_inspect):
+    mock_inspect.return_value = {"State": {"Running": True}}
+    docker_mod.docker_wait_healthy("cname", timeout=0)
+
+@patch("thc_devops_toolkit.containerization.docker.docker_inspect")
+def test_docker_wait_healthy_unhealthy_and_timeout(mock_inspect):
+    mock_inspect.return_value = {"State": {"Health": {"Status": "unhealthy"}}}
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_wait_healthy("cname", timeout=5, poll_interval=0)
+    mock_inspect.return_value = {"State": {"Health": {"Status": "starting"}}}
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_wait_healthy("cname", timeout=0, poll_interval=0)
+
+@patch("subprocess.run")
+def test_docker_pull_many(mock_run):
+    mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+    docker_mod.docker_pull_many(["a:1", "b:1", "c:1"], max_workers=2)
+    assert sorted(call[0][0][2] for call in mock_run.call_args_list) == ["a:1", "b:1", "c:1"]
+
+@patch("subprocess.run")
+def test_docker_push_many_aggregates_failures(mock_run):
+    def run(cmd, **kwargs):
+        return MagicMock(returncode=1 if cmd[2] != "ok:1" else 0, stderr=b"denied")
+    mock_run.side_effect = run
+    with pytest.raises(RuntimeError) as excinfo:
+        docker_mod.docker_push_many(["ok:1", "bad:1", "worse:1"])
+    assert mock_run.call_count == 3
+    assert "2 of 3" in str(excinfo.value)
+    assert "bad:1" in str(excinfo.value) and "worse:1" in str(excinfo.value)
+
+@pytest.fixture
+def local_exec_session(monkeypatch):
+    # run the session shell locally instead of inside a container
+    real_popen = docker_mod.subprocess.Popen
+    calls = []
+
+    def fake_popen(cmd, **kwargs):
+        calls.append(cmd)
+        return real_popen(["sh"], **kwargs)
+
+    monkeypatch.setattr(docker_mod.subprocess, "Popen", fake_popen)
+    with docker_mod.DockerExecSession("cname", workdir="/app") as session:
+        yield session, calls
+
+def test_docker_exec_session_run(local_exec_session):
+    session, calls = local_exec_session
+    assert calls == [["docker", "exec", "-i", "-w", "/app", "cname", "sh"]]
+    assert session.run(["echo", "hello world"]) == (0, b"hello world\n", b"")
+    assert session.run(["sh", "-c", "printf out; printf err >&2; exit 3"]) == (3, b"out", b"err")
+    # commands do not read the session's command stream
+    assert session.run(["cat"]) == (0, b"", b"")
+    big = session.run(["sh", "-c", "head -c 200000 /dev/zero; head -c 200000 /dev/zero >&2"])
+    assert (len(big[1]), len(big[2])) == (200000, 200000)
+
+@patch("subprocess.run")
+def test_docker_exec_with_session(mock_run, local_exec_session):
+    session, _ = local_exec_session
+    docker_mod.docker_exec(command=["true"], session=session, print_output=True)
+    with pytest.raises(RuntimeError):
+        docker_mod.docker_exec(command=["false"], session=session)
+    mock_run.assert_not_called()
+
+def test_docker_exec_session_exited(local_exec_session):
+    session, _ = local_exec_session
+    with pytest.raises(RuntimeError):
+        session.run(["exit", "1"])
+
+def _mock_async_process(returncode=0, stdout=b"", stderr=b""):
+    process = MagicMock(returncode=returncode)
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    return AsyncMock(return_value=process)
+
+def test_adocker_pull_bounded_transfers(monkeypatch):
+    monkeypatch.setattr(docker_mod, "_is_up_to_date", lambda name: False)
+    running, peak = [], []
+
+    async def fake_exec(*cmd, **kwargs):
+        running.append(cmd)
+        peak.append(len(running))
+        process = MagicMock(returncode=0)
+
+        async def communicate():
+            await asyncio.sleep(0.02)
+            running.remove(cmd)
+            return b"", b""
+        process.communicate = communicate
+        return process
+
+    monkeypatch.setattr(docker_mod.asyncio, "create_subprocess_exec", fake_exec)
+
+    async def main():
+        await asyncio.gather(*(docker_mod.adocker_pull(f"repo/image:{index}") for index in range(12)))
+
+    asyncio.run(main())
+    assert len(peak) == 12
+    assert max(peak) <= docker_mod._MAX_CONCURRENT_TRANSFERS
+    assert docker_mod._transfer_slots.acquire(blocking=False)
+    docker_mod._transfer_slots.release()
+
+def test_adocker_pull_and_push(monkeypatch):
+    monkeypatch.setattr(docker_mod, "_is_up_to_date", lambda name: False)
+    create = _mock_async_process()
+    monkeypatch.setattr(docker_mod.asyncio, "create_subprocess_exec", create)
+
+    async def main():
+        await asyncio.gather(*(docker_mod.adocker_pull(f"repo/image:{tag}") for tag in ("a", "b")))
+        await docker_mod.adocker_push("repo/image:a")
+
+    asyncio.run(main())
+    assert sorted(call.args for call in create.call_args_list) == [
+        ("docker", "pull", "repo/image:a"),
+        ("docker", "pull", "repo/image:b"),
+        ("docker", "push", "repo/image:a"),
+    ]
+    assert create.call_args.kwargs["stdout"] == asyncio.subprocess.DEVNULL
+
+def test_adocker_tag_fail(monkeypatch):
+    monkeypatch.setattr(docker_mod.asyncio, "create_subprocess_exec", _mock_async_process(returncode=1, stderr=b"No such image"))
+    with pytest.raises(RuntimeError, match="No such image"):
+        asyncio.run(docker_mod.adocker_tag("repo/image:a", "repo/image:b"))
+
+def test_adocker_inspect_cli_fallback(monkeypatch):
+    create = _mock_async_process(stdout=b'[{"Size": 7}]')
+    monkeypatch.setattr(docker_mod.asyncio, "create_subprocess_exec", create)
+    assert asyncio.run(docker_mod.adocker_inspect("repo/image:a")) == {"Size": 7}
+    assert create.call_args.args == ("docker", "inspect", "repo/image:a")
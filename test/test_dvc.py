@@ -34,6 +34,35 @@ def test_dvc_repo_get_repo():
         repo_cls.assert_called_once_with("/tmp/repo")
         assert repo == repo_cls.return_value
 
+def test_dvc_repo_metadata_cache():
+    repo_mock = MagicMock()
+    with patch("thc_devops_toolkit.version_control.dvc.Repo", return_value=repo_mock) as repo_cls:
+        dvc_repo = dvc_mod.DvcRepo("/tmp/repo")
+        with dvc_repo.metadata_cache():
+            dvc_repo.add_directory("data")
+            dvc_repo.add_files(["a.txt"])
+            with dvc_repo.metadata_cache():
+                dvc_repo.push("myremote")
+            repo_mock.close.assert_not_called()
+        repo_cls.assert_called_once_with("/tmp/repo")
+        repo_mock.close.assert_called_once()
+        dvc_repo._get_repo()
+        assert repo_cls.call_count == 2
+
+def test_dvc_repo_set_checksum_jobs():
+    repo_mock = MagicMock()
+    config_ctx = {"core": {}}
+    repo_mock.config.edit.return_value.__enter__.return_value = config_ctx
+    with patch("thc_devops_toolkit.version_control.dvc.Repo", return_value=repo_mock), \
+            patch("thc_devops_toolkit.version_control.dvc.os.cpu_count", return_value=8):
+        dvc_repo = dvc_mod.DvcRepo("/tmp/repo")
+        dvc_repo.set_checksum_jobs()
+        assert config_ctx["core"]["checksum_jobs"] == 8
+        dvc_repo.set_checksum_jobs(jobs=2)
+        assert config_ctx["core"]["checksum_jobs"] == 2
+        with pytest.raises(ValueError):
+            dvc_repo.set_checksum_jobs(jobs=0)
+
 def test_dvc_repo_set_remote():
     repo_mock = MagicMock()
     config_ctx = {"remote": {}}
@@ -89,7 +118,14 @@ def test_dvc_repo_push():
     with patch("thc_devops_toolkit.version_control.dvc.Repo", return_value=repo_mock):
         dvc_repo = dvc_mod.DvcRepo("/tmp/repo")
         dvc_repo.push("myremote")
-        repo_mock.push.assert_called_once_with(remote="myremote")
+        repo_mock.push.assert_called_once_with(remote="myremote", jobs=None)
+
+def test_dvc_repo_push_jobs():
+    repo_mock = MagicMock()
+    with patch("thc_devops_toolkit.version_control.dvc.Repo", return_value=repo_mock):
+        dvc_repo = dvc_mod.DvcRepo("/tmp/repo")
+        dvc_repo.push("myremote", jobs=64)
+        repo_mock.push.assert_called_once_with(remote="myremote", jobs=64)
 
 def test_DvcOutput_from_to_dict():
     d = {"path": "foo.txt", "md5": "abc", "hash": "md5"}
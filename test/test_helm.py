@@ -1,5 +1,8 @@
+import dataclasses
+import sys
+import threading
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from pathlib import Path
 from thc_devops_toolkit.containerization import helm as helm_mod
 
@@ -63,6 +66,35 @@ def test_helm_push_fail():
         with pytest.raises(RuntimeError):
             helm_mod.helm_push(chart, "repo")
 
+def _mock_async_process(returncode_by_chart):
+    async def create(*cmd, **kwargs):
+        process = MagicMock(returncode=next((rc for name, rc in returncode_by_chart.items() if name in cmd[2]), 0))
+        process.communicate = AsyncMock(return_value=(None, b"fail"))
+        create.calls.append((cmd, kwargs))
+        return process
+
+    create.calls = []
+    return create
+
+def test_helm_pull_many(monkeypatch):
+    create = _mock_async_process({})
+    monkeypatch.setattr(helm_mod.asyncio, "create_subprocess_exec", create)
+    helm_mod.helm_pull_many([("oci://repo/a", "1.0.0"), ("oci://repo/b", "2.0.0")], untar=True, max_workers=1)
+    assert sorted(cmd for cmd, _ in create.calls) == [
+        ("helm", "pull", "oci://repo/a", "--version", "1.0.0", "--untar"),
+        ("helm", "pull", "oci://repo/b", "--version", "2.0.0", "--untar"),
+    ]
+    assert create.calls[0][1]["env"]["HELM_EXPERIMENTAL_OCI"] == "1"
+
+def test_helm_push_many_reports_failures(monkeypatch):
+    create = _mock_async_process({"b-": 1})
+    monkeypatch.setattr(helm_mod.asyncio, "create_subprocess_exec", create)
+    charts = [DummyChart(name="a"), DummyChart(name="b"), DummyChart(name="c")]
+    with pytest.raises(RuntimeError, match="Failed to push 1 of 3 charts") as excinfo:
+        helm_mod.helm_push_many(charts, "oci://repo")
+    assert "b: Failed to push 'b-1.0.0.tgz'" in str(excinfo.value)
+    assert len(create.calls) == 3
+
 def test_verify_chart_version_match(tmp_path):
     chart_dir = tmp_path / "test"
     chart_dir.mkdir()
@@ -122,6 +154,19 @@ def test_verify_chart_values_invalid_checklist(tmp_path):
     chart = DummyChart(path_prefix=tmp_path, name="test")
     assert not helm_mod.verify_chart_values(chart, ["foo"])
 
+def test_verify_charts(tmp_path):
+    for name, version, values in (("a", "1.0.0", "foo: 1\n"), ("b", "2.0.0", "foo: 2\n"), ("c", "3.0.0", "foo: 3\n")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "Chart.yaml").write_text(f"version: {version}\n")
+        (tmp_path / name / "values.yaml").write_text(values)
+    charts = [
+        DummyChart(path_prefix=tmp_path, name="a", check_list={"foo": 1}),
+        DummyChart(path_prefix=tmp_path, name="b", check_list={"foo": 1}),
+        DummyChart(path_prefix=tmp_path, name="c"),
+    ]
+    results = helm_mod.verify_charts(charts, expected_versions={"a": "1.0.0", "c": "9.9.9"}, max_workers=2)
+    assert results == {"a": True, "b": False, "c": False}
+
 def test_verify_dependencies_acyclic():
     c1 = DummyChart(name="a", dependencies=["b"])
     c2 = DummyChart(name="b", dependencies=[])
@@ -138,6 +183,27 @@ def test_verify_dependencies_missing():
     with pytest.raises(ValueError):
         helm_mod.verify_dependencies([c1])
 
+def test_verify_dependencies_shared_and_self_cycle():
+    c1 = DummyChart(name="a", dependencies=["b", "c"])
+    c2 = DummyChart(name="b", dependencies=["d"])
+    c3 = DummyChart(name="c", dependencies=["d"])
+    c4 = DummyChart(name="d", dependencies=[])
+    helm_mod.verify_dependencies([c1, c2, c3, c4])
+    with pytest.raises(ValueError, match="Cyclic"):
+        helm_mod.verify_dependencies([DummyChart(name="a", dependencies=["a"])])
+
+def test_verify_dependencies_deep_chain():
+    depth = sys.getrecursionlimit() * 2
+    charts = [DummyChart(name=f"c{i}", dependencies=[f"c{i + 1}"]) for i in range(depth)]
+    charts.append(DummyChart(name=f"c{depth}"))
+    helm_mod.verify_dependencies(charts)
+
+def test_chart_is_frozen_and_slotted():
+    chart = helm_mod.Chart(name="a", version="1.0.0", path_prefix="/tmp", dependencies=[], check_list={})
+    assert not hasattr(chart, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        chart.version = "2.0.0"
+
 def test_chart_from_path_success(tmp_path):
     chart_dir = tmp_path / "test"
     chart_dir.mkdir()
@@ -182,3 +248,20 @@ def test_chart_from_path_missing_version(tmp_path):
     values_yaml.write_text("foo: bar\n")
     with pytest.raises(ValueError):
         helm_mod.Chart.from_path(tmp_path, "test")
+
+def test_load_yaml_reuses_parse_until_file_changes(tmp_path):
+    chart_yaml = tmp_path / "Chart.yaml"
+    chart_yaml.write_text("version: 1.0.0\n")
+    first = helm_mod._load_yaml(chart_yaml)
+    assert helm_mod._load_yaml(chart_yaml) is first
+    chart_yaml.write_text("version: 1.0.10\n")
+    assert helm_mod._load_yaml(chart_yaml) == {"version": "1.0.10"}
+
+def test_safe_yaml_reused_per_thread():
+    loader = helm_mod._safe_yaml()
+    assert helm_mod._safe_yaml() is loader
+    others = []
+    thread = threading.Thread(target=lambda: others.append(helm_mod._safe_yaml()))
+    thread.start()
+    thread.join()
+    assert others[0] is not loader
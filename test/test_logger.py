@@ -229,6 +229,24 @@ class TestTHCLogger:
         assert "critical message" in output
         assert "\033[35m" in output  # Magenta color code
 
+    def test_logger_highlight_lazy_args(self, string_handler):
+        """Test highlight formats args only when the level is enabled."""
+        logger = THCLogger(level=logging.INFO, handlers=[string_handler])
+        logger.highlight(LogLevel.INFO, "value: %s, count: %d", "abc", 3)
+        logger.highlight(LogLevel.DEBUG, "hidden %s %s", "too few args")
+
+        output = string_handler.stream.getvalue()
+        assert "value: abc, count: 3" in output
+        assert "hidden" not in output
+
+    def test_logger_is_enabled(self, string_handler):
+        """Test is_enabled follows the logger level."""
+        logger = THCLogger(level=logging.WARNING, handlers=[string_handler])
+        assert logger.is_enabled(LogLevel.ERROR)
+        assert logger.is_enabled(LogLevel.WARNING)
+        assert not logger.is_enabled(LogLevel.INFO)
+        assert not logger.is_enabled(LogLevel.DEBUG)
+
     def test_logger_regular_logging_methods(self, string_handler):
         """Test that regular logging methods still work."""
         logger = THCLogger(handlers=[string_handler])
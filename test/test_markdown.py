@@ -1,6 +1,7 @@
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import MagicMock
 from thc_devops_toolkit.documentation import markdown as md_mod
 import pandas as pd
 import pytest
@@ -28,10 +29,55 @@ def test_markdown_table_upsert_row():
     table.upsert_row(data3, primary_key="id", insert_ahead=True)
     assert table.dataframe.iloc[0]["id"] == "2"
 
+def test_markdown_table_upsert_native_rows():
+    table = md_mod.MarkdownTable(table_id="t1", rows=[{"id": "1", "name": "Alice"}])
+    table.upsert_row({"id": "1", "name": "Bob"}, primary_key="id")
+    table.upsert_row({"id": "2", "name": "Carol"}, primary_key="id", insert_ahead=True)
+    table.upsert_row({"id": "3", "name": "Dave"}, primary_key="id")
+    assert table.dataframe is None
+    assert [row["name"] for row in table.rows] == ["Carol", "Bob", "Dave"]
+
+@pytest.mark.parametrize("insert_ahead", [False, True])
+@pytest.mark.parametrize(
+    "make_table",
+    [
+        lambda: md_mod.MarkdownTable(table_id="t"),
+        lambda: md_mod.MarkdownTable(table_id="t", dataframe=pd.DataFrame([{"id": "2", "name": "x"}, {"id": "9", "name": "z"}])),
+        lambda: md_mod.MarkdownTable(table_id="t", rows=[{"id": "2", "name": "x"}]),
+    ],
+)
+def test_markdown_table_upsert_rows_matches_upsert_row(make_table, insert_ahead):
+    rows = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}, {"id": "1", "name": None}, {"id": "3", "name": "c"}]
+    one_by_one, bulk = make_table(), make_table()
+    for row in rows:
+        one_by_one.upsert_row(row, primary_key="id", insert_ahead=insert_ahead)
+    bulk.upsert_rows(rows, primary_key="id", insert_ahead=insert_ahead)
+    assert bulk.to_markdown_lines() == one_by_one.to_markdown_lines()
+
+def test_markdown_table_native_rows_render_like_dataframe():
+    rows = [{"id": "1", "name": "Alice"}, {"id": "2", "name": "Bob"}]
+    native = md_mod.MarkdownTable(table_id="t1", rows=rows)
+    frame = md_mod.MarkdownTable(table_id="t1", dataframe=pd.DataFrame(rows))
+    assert native.to_markdown_lines() == frame.to_markdown_lines()
+    assert md_mod.MarkdownTable(table_id="t1", rows=[]).to_markdown_lines() == []
+
+def test_match_mask_uses_dataframe_index():
+    dataframe = pd.DataFrame([{"id": "1"}, {"id": "2"}], index=[10, 20])
+    mask = md_mod.match_mask(dataframe, "id", "2")
+    assert mask.tolist() == [False, True]
+    assert dataframe[mask].index.tolist() == [20]
+
 def test_generate_table_marker():
     marker = md_mod.MarkdownDocumentManager.generate_table_marker("table-xyz")
     assert "table_id=table-xyz" in marker
 
+@pytest.mark.parametrize(
+    "line, expected",
+    [("| a | b |", True), ("||", True), ("|", False), ("| a | b", False), ("a | b |", False), ("", False)],
+)
+def test_is_table_line(line, expected):
+    assert md_mod._is_table_line(line) is expected
+
 def test_document_manager_parse_and_list_tables(tmp_md_file):
     content = [
         md_mod._markdown_comment_head + md_mod._markdown_table_marker + " " + md_mod._markdown_table_id_argument + "t1" + md_mod._markdown_comment_tail,
@@ -50,6 +96,26 @@ def test_document_manager_parse_and_list_tables(tmp_md_file):
     assert table.dataframe.shape[0] == 2
     assert table.dataframe.iloc[0]["name"] == "Alice"
 
+def test_document_manager_parse_multiple_tables_keeps_line_order(tmp_md_file):
+    marker = md_mod.MarkdownDocumentManager.generate_table_marker
+    content = [
+        "# Title",
+        marker("t1"),
+        "| a |",
+        "|---|",
+        "| 1 |",
+        "between",
+        "| lonely |",
+        marker("t2"),
+        "| b |",
+        "|---|",
+        "after",
+    ]
+    tmp_md_file.write_text("\n".join(content))
+    mgr = md_mod.MarkdownDocumentManager(tmp_md_file)
+    assert mgr.list_tables() == ["t1", "t2"]
+    assert mgr.lines == ["# Title", marker("t1"), mgr.tables["t1"], "between", "| lonely |", marker("t2"), mgr.tables["t2"], "after"]
+
 def test_insert_table_and_save(tmp_md_file):
     mgr = md_mod.MarkdownDocumentManager(tmp_md_file)
     df = pd.DataFrame([{"id": "1", "name": "A"}, {"id": "2", "name": "B"}])
@@ -61,6 +127,36 @@ def test_insert_table_and_save(tmp_md_file):
     assert "id" in saved and "name" in saved
     assert "A" in saved and "B" in saved
 
+def test_extend_and_atomic_save(tmp_md_file):
+    tmp_md_file.write_text("old content\n")
+    mgr = md_mod.MarkdownDocumentManager(tmp_md_file)
+    mgr.extend(["# Title", "", "text"])
+    mgr.save_document()
+    assert tmp_md_file.read_text() == "old content\n# Title\n\ntext\n"
+    assert list(tmp_md_file.parent.iterdir()) == [tmp_md_file]
+
+def test_save_keeps_symlink_and_mode(tmp_md_file):
+    tmp_md_file.write_text("old content\n")
+    tmp_md_file.chmod(0o640)
+    link = tmp_md_file.with_name("link.md")
+    link.symlink_to(tmp_md_file)
+    mgr = md_mod.MarkdownDocumentManager(link)
+    mgr.extend(["text"])
+    mgr.save_document()
+    assert link.is_symlink()
+    assert tmp_md_file.read_text() == "old content\ntext\n"
+    assert tmp_md_file.stat().st_mode & 0o777 == 0o640
+
+def test_save_removes_temp_file_on_failure(tmp_md_file, monkeypatch):
+    tmp_md_file.write_text("old content\n")
+    mgr = md_mod.MarkdownDocumentManager(tmp_md_file)
+    mgr.extend(["text"])
+    monkeypatch.setattr(md_mod.os, "replace", MagicMock(side_effect=OSError("disk full")))
+    with pytest.raises(OSError):
+        mgr.save_document()
+    assert tmp_md_file.read_text() == "old content\n"
+    assert list(tmp_md_file.parent.iterdir()) == [tmp_md_file]
+
 def test_table_without_marker(tmp_md_file):
     content = [
         "| id | name |",
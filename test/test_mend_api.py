@@ -4,7 +4,7 @@ from unittest.mock import patch, MagicMock
 import thc_devops_toolkit.security.mend_api_helper as mend
 
 def test_get_refresh_token_success():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.post") as post:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.post") as post:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": {"refreshToken": "REFRESH"}}
         post.return_value = mock_resp
@@ -16,7 +16,7 @@ def test_get_refresh_token_success():
         assert kwargs["headers"]["Content-Type"] == "application/json"
 
 def test_get_jwt_token_success():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.post") as post:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.post") as post:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"response": {"jwtToken": "JWT"}}
         post.return_value = mock_resp
@@ -28,7 +28,7 @@ def test_get_jwt_token_success():
         assert kwargs["headers"]["wss-refresh-token"] == "REFRESH"
 
 def test_get_alerts_by_library_success():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.get") as get:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.get") as get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"retVal": [{"lib1": []}, {"lib2": []}]}
         get.return_value = mock_resp
@@ -41,7 +41,7 @@ def test_get_alerts_by_library_success():
         assert kwargs["headers"]["Authorization"].startswith("Bearer ")
 
 def test_get_alerts_by_library_type_error():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.get") as get:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.get") as get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"retVal": "not a list"}
         get.return_value = mock_resp
@@ -49,7 +49,7 @@ def test_get_alerts_by_library_type_error():
             mend.get_alerts_by_library("projtoken", "jwt")
 
 def test_get_vulnerabilities_by_project_success():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.get") as get:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.get") as get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"retVal": [{"vuln1": {}}, {"vuln2": {}}]}
         get.return_value = mock_resp
@@ -62,9 +62,14 @@ def test_get_vulnerabilities_by_project_success():
         assert kwargs["headers"]["Authorization"].startswith("Bearer ")
 
 def test_get_vulnerabilities_by_project_type_error():
-    with patch("thc_devops_toolkit.security.mend_api_helper.requests.get") as get:
+    with patch("thc_devops_toolkit.security.mend_api_helper._SESSION.get") as get:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"retVal": "not a list"}
         get.return_value = mock_resp
         with pytest.raises(ValueError):
             mend.get_vulnerabilities_by_project("projtoken", "jwt")
+
+def test_session_reuses_pooled_connections():
+    adapter = mend._SESSION.get_adapter("https://api-saas.whitesourcesoftware.com")
+    assert adapter._pool_maxsize == 10
+    assert adapter.max_retries.total == 3
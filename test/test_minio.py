@@ -32,6 +32,12 @@ def test_get_minio_service():
         assert "https://" not in kwargs["endpoint"]
         assert "http://" not in kwargs["endpoint"]
 
+def test_get_minio_service_connection_pool():
+    with patch("thc_devops_toolkit.infrastructure.minio.Minio") as minio_cls:
+        minio_mod.get_minio_service("http://s3.server.com", "access_key", "secret_key", secure=False, max_connections=16)
+        http_client = minio_cls.call_args.kwargs["http_client"]
+        assert http_client.connection_pool_kw["maxsize"] == 16
+
 def test_minio_makedir_bucket_and_dir():
     minio_ = MagicMock()
     minio_.bucket_exists.return_value = False
@@ -123,6 +129,37 @@ def test_mirror_dir_to_bucket_with_directory(temp_dir):
     assert args[1] == "mydir/a.txt"
     assert args[2] == str(file1)
 
+def test_mirror_dir_to_bucket_large_file_multipart(temp_dir):
+    minio_ = MagicMock()
+    minio_.bucket_exists.return_value = True
+
+    source = Path(temp_dir)
+    small_file = source / "small.txt"
+    small_file.write_text("hello")
+    large_file = source / "large.bin"
+    with large_file.open("wb") as file:
+        file.truncate(minio_mod._MULTIPART_PART_SIZE + 1)
+
+    minio_mod.mirror_dir_to_bucket(minio_, source, "mybk")
+
+    kwargs_by_object = {call[0][1]: call.kwargs for call in minio_.fput_object.call_args_list}
+    assert kwargs_by_object["small.txt"] == {}
+    assert kwargs_by_object["large.bin"] == {
+        "part_size": minio_mod._MULTIPART_PART_SIZE,
+        "num_parallel_uploads": minio_mod._MULTIPART_PARALLEL_UPLOADS,
+    }
+
+def test_mirror_dir_to_bucket_upload_error(temp_dir):
+    minio_ = MagicMock()
+    minio_.bucket_exists.return_value = True
+    minio_.fput_object.side_effect = S3Error("InternalError", "msg", "req", "host", "id", "response")
+
+    source = Path(temp_dir)
+    (source / "a.txt").write_text("hello")
+
+    with pytest.raises(S3Error):
+        minio_mod.mirror_dir_to_bucket(minio_, source, "mybk")
+
 def test_mirror_dir_to_bucket_bucket_not_exist(temp_dir):
     minio_ = MagicMock()
     minio_.bucket_exists.return_value = False
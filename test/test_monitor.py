@@ -1,5 +1,6 @@
+import os
 import socket
-from unittest.mock import Mock, patch, call
+from unittest.mock import MagicMock, Mock, patch, call
 
 import pytest
 
@@ -12,6 +13,7 @@ from thc_devops_toolkit.observability.monitor import (
     GPUStatus,
     SystemStatus,
 )
+from thc_devops_toolkit.observability.monitor.monitor import _counter_delta, _read_net_dev_counters
 
 
 # Tests for models.py
@@ -216,25 +218,22 @@ class TestMonitor:
             daemon=True
         )
 
-    @patch("psutil.net_io_counters")
+    @patch("thc_devops_toolkit.observability.monitor.monitor.logger")
+    @patch("thc_devops_toolkit.observability.monitor.monitor.os")
     @patch("time.sleep")
-    def test_monitor_net_iface_internal_success(self, mock_sleep, mock_net_io):
+    def test_monitor_net_iface_internal_success(self, mock_sleep, mock_os, mock_logger):
         """Test internal network interface monitoring success."""
         monitor = Monitor()
         net_iface = NetworkInterface(name="eth0")
         
         # Mock network statistics
-        mock_stat_1 = Mock()
-        mock_stat_1.bytes_recv = 1000
-        mock_stat_1.bytes_sent = 500
-        
-        mock_stat_2 = Mock()
-        mock_stat_2.bytes_recv = 2000
-        mock_stat_2.bytes_sent = 1000
-        
-        mock_net_io.side_effect = [
-            {"eth0": mock_stat_1},
-            {"eth0": mock_stat_2}
+        header = (
+            b"Inter-|   Receive                            |  Transmit\n"
+            b" face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+        )
+        mock_os.pread.side_effect = [
+            header + b"  eth0:    1000  10 0 0 0 0 0 0     500  5 0 0 0 0 0 0\n",
+            header + b"  eth0:    2000  20 0 0 0 0 0 0    1000 10 0 0 0 0 0 0\n",
         ]
         
         # Set shutdown after first iteration
@@ -243,7 +242,57 @@ class TestMonitor:
         
         mock_sleep.side_effect = set_shutdown
         
-        monitor._monitor_net_iface(net_iface, interval=1.0)
+        monitor._monitor_net_iface(net_iface, interval=1.0, unit=Unit.BYTES)
+
+        mock_os.open.assert_called_once_with("/proc/net/dev", mock_os.O_RDONLY)
+        assert mock_os.pread.call_count == 2
+        mock_os.close.assert_called_once_with(mock_os.open.return_value)
+        status = mock_logger.highlight.call_args.kwargs["message"]
+        assert "inbound_rate=1000" in status
+        assert "outbound_rate=500" in status
+
+    @patch("thc_devops_toolkit.observability.monitor.monitor.os")
+    def test_monitor_net_iface_internal_open_failure_retry(self, mock_os):
+        """Test a failure to open /proc/net/dev counts against the retry limit."""
+        monitor = Monitor()
+        mock_os.open.side_effect = OSError("Permission denied")
+
+        monitor._monitor_net_iface(NetworkInterface(name="eth0"), retry=3)
+
+        assert mock_os.open.call_count == 3
+        mock_os.close.assert_not_called()
+
+    def test_counter_delta(self):
+        """Test byte counter increases, including a wrapped or reset counter."""
+        assert _counter_delta(1000, 2500) == 1500
+        assert _counter_delta(2**32 - 100, 400) == 400
+        assert _counter_delta(0, 0) == 0
+
+    def test_read_net_dev_counters_missing_iface(self):
+        """Test reading counters of a network interface that does not exist."""
+        fd = os.open("/proc/net/dev", os.O_RDONLY)
+        try:
+            with pytest.raises(KeyError):
+                _read_net_dev_counters(fd, "no-such-iface0")
+        finally:
+            os.close(fd)
+
+    def test_read_net_dev_counters_past_first_read(self, tmp_path):
+        """Test reading counters of a network interface listed past the first pread chunk."""
+        header = (
+            "Inter-|   Receive                            |  Transmit\n"
+            " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n"
+        )
+        filler = "".join(f"  veth{index}:    1 1 0 0 0 0 0 0     1 1 0 0 0 0 0 0\n" for index in range(2000))
+        net_dev = tmp_path / "net_dev"
+        net_dev.write_text(header + filler + "  eth9:    4000  40 0 0 0 0 0 0    3000 30 0 0 0 0 0 0\n")
+        assert net_dev.stat().st_size > 1 << 16
+
+        fd = os.open(net_dev, os.O_RDONLY)
+        try:
+            assert _read_net_dev_counters(fd, "eth9") == (4000, 3000)
+        finally:
+            os.close(fd)
 
     @patch("thc_devops_toolkit.observability.monitor.monitor.Thread")
     def test_monitor_process_success(self, mock_thread_class):
@@ -286,7 +335,7 @@ class TestMonitor:
         mock_memory_info = Mock()
         mock_memory_info.rss = 1024 * 1024 * 100  # 100MB
         
-        mock_process = Mock()
+        mock_process = MagicMock()
         mock_process.cpu_percent.return_value = 25.5
         mock_process.memory_info.return_value = mock_memory_info
         mock_process_class.return_value = mock_process
@@ -458,8 +507,9 @@ class TestMonitor:
                 monitor.shutdown_event.set()
             raise Exception("Network error")
         
-        with patch("psutil.net_io_counters", side_effect=side_effect):
+        with patch("thc_devops_toolkit.observability.monitor.monitor._read_net_dev_counters", side_effect=side_effect):
             monitor._monitor_net_iface(net_iface, retry=3)
+        assert call_count == 3
 
     @patch("psutil.Process")
     def test_monitor_process_internal_exception_retry(self, mock_process_class):
@@ -475,9 +525,37 @@ class TestMonitor:
                 monitor.shutdown_event.set()
             raise Exception("Process error")
         
-        mock_process_class.side_effect = side_effect
+        mock_process_class.return_value.memory_info.side_effect = side_effect
         
         monitor._monitor_process(pid, retry=3)
+        assert call_count == 3
+        mock_process_class.assert_called_once_with(pid)
+
+    @patch("psutil.Process")
+    def test_monitor_process_internal_no_such_process(self, mock_process_class):
+        """Test process monitoring stops when the process cannot be attached within the retry limit."""
+        monitor = Monitor()
+        mock_process_class.side_effect = Exception("No such process")
+
+        monitor._monitor_process(1234, retry=3)
+
+        assert mock_process_class.call_args_list == [call(1234)] * 3
+
+    @patch("psutil.Process")
+    @patch("time.sleep")
+    def test_monitor_process_internal_attaches_late_process(self, mock_sleep, mock_process_class):
+        """Test a process that is not up yet when monitoring starts is attached on a later attempt."""
+        monitor = Monitor()
+        mock_process = MagicMock()
+        mock_process.cpu_percent.return_value = 1.0
+        mock_process.memory_info.return_value.rss = 1024
+        mock_process_class.side_effect = [Exception("No such process"), mock_process]
+        mock_sleep.side_effect = lambda *args: monitor.shutdown_event.set()
+
+        monitor._monitor_process(1234, retry=3)
+
+        assert mock_process_class.call_count == 2
+        mock_process.memory_info.assert_called_once()
 
     @patch("psutil.cpu_percent")
     def test_monitor_system_internal_exception_retry(self, mock_cpu_percent):
@@ -0,0 +1,60 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from thc_devops_toolkit.observability import wait_for_tcp, wait_http_ready
+
+
+class _ReadyAfterHandler(BaseHTTPRequestHandler):
+    """Answers 503 for the first requests and 200 afterwards."""
+
+    not_ready_responses = 2
+
+    def do_GET(self):
+        server = self.server
+        server.requests += 1
+        status = 503 if server.requests <= self.not_ready_responses else 200
+        self.send_response(status)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ReadyAfterHandler)
+    server.requests = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_wait_http_ready(http_server):
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/ready"
+    wait_http_ready(url, deadline=5, interval=0.01)
+    assert http_server.requests == 3
+
+
+def test_wait_http_ready_timeout():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ReadyAfterHandler)
+    port = server.server_address[1]
+    server.server_close()
+    with pytest.raises(RuntimeError):
+        wait_http_ready(f"http://127.0.0.1:{port}/ready", deadline=0.2, interval=0.01)
+
+
+def test_wait_for_tcp():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        wait_for_tcp("127.0.0.1", server.getsockname()[1], deadline=5, interval=0.01)
+
+
+def test_wait_for_tcp_timeout():
+    with socket.create_server(("127.0.0.1", 0)) as server:
+        port = server.getsockname()[1]
+    with pytest.raises(RuntimeError):
+        wait_for_tcp("127.0.0.1", port, deadline=0.2, interval=0.01)
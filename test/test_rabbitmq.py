@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, patch
-from queue import Queue
-from thc_devops_toolkit.infrastructure.rabbitmq import RabbitMQManager, RabbitMQActions, RabbitMQConfig
+from queue import Empty, Full, Queue
+from threading import Thread
+import pytest
+from thc_devops_toolkit.infrastructure.rabbitmq import RabbitMQManager, RabbitMQActions, RabbitMQConfig, SPSCQueue
 
 def test_rabbitmq_manager_init():
     mgr = RabbitMQManager()
@@ -127,7 +129,7 @@ def test_run_starts_threads():
     ) as send_mock, patch.object(
         mgr, "recv"
     ) as recv_mock:
-        mgr.run()
+        assert mgr.run(ready_timeout=0) is False
         assert len(mgr.threads) == 2
         # Threads should be started (daemon)
         for t in mgr.threads:
@@ -246,10 +248,14 @@ def test_send_exception_and_retry(monkeypatch):
             def channel(self):
                 class DummyChan:
                     def exchange_declare(self, *a, **k): pass
+                    def tx_select(self): pass
                     def basic_publish(self, *a, **k): pass
+                    def tx_commit(self): pass
                 return DummyChan()
+            def process_data_events(self, time_limit=None):
+                mgr.shutdown_event.set()  # trigger exit once idle after success
             def close(self):
-                mgr.shutdown_event.set()  # trigger exit after success
+                pass
         return DummyConn()
     
     monkeypatch.setattr("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection", conn_side_effect)
@@ -337,3 +343,240 @@ def test_callback_put_exception(monkeypatch):
     
     monkeypatch.setattr("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection", lambda *a, **k: DummyConn())
     mgr.recv(config)
+
+def test_spsc_queue_fifo_and_bounds():
+    q = SPSCQueue(capacity=2)
+    assert q.empty()
+    q.put(b"a")
+    q.put_nowait(b"b")
+    assert q.full() and q.qsize() == 2
+    with pytest.raises(Full):
+        q.put(b"c", timeout=0.01)
+    assert q.get() == b"a"
+    assert q.get_nowait() == b"b"
+    with pytest.raises(Empty):
+        q.get_nowait()
+    with pytest.raises(Empty):
+        q.get(timeout=0.01)
+
+def test_spsc_queue_blocking_get_wakes_on_put():
+    q = SPSCQueue()
+    received = []
+    consumer = Thread(target=lambda: received.extend(q.get(timeout=5) for _ in range(1000)))
+    consumer.start()
+    for i in range(1000):
+        q.put(i)
+    consumer.join(timeout=5)
+    assert received == list(range(1000))
+
+def test_spsc_queue_drain():
+    q = SPSCQueue()
+    producer = Thread(target=lambda: [q.put(i) for i in range(5)])
+    producer.start()
+    assert q.drain(3, timeout=5) == [0, 1, 2]
+    producer.join(timeout=5)
+    assert q.drain(3, timeout=0.01) == [3, 4]
+    assert q.drain(1, timeout=0.01) == []
+
+def test_spsc_queue_join():
+    q = SPSCQueue()
+    assert q.join(timeout=0)
+    q.put_many([1, 2])
+    assert not q.join(timeout=0.01)
+    q.drain(2, timeout=0)
+    q.task_done(2)
+    assert q.join(timeout=0)
+
+def test_spsc_queue_blocking_put_wakes_on_get():
+    q = SPSCQueue(capacity=1)
+    q.put(0)
+    producer = Thread(target=lambda: q.put(1, timeout=5))
+    producer.start()
+    assert q.get(timeout=5) == 0
+    assert q.get(timeout=5) == 1
+    producer.join(timeout=5)
+
+def test_send_publishes_queued_messages_in_one_transaction():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False,
+        transactional=True,
+    )
+    config.message_queue.put_many([b"m1", b"m2", b"m3"])
+    with patch("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection") as conn_mock:
+        channel = conn_mock.return_value.channel.return_value
+        channel.tx_commit.side_effect = lambda: mgr.shutdown_event.set()
+        mgr.send(config)
+    assert conn_mock.call_count == 1
+    channel.tx_select.assert_called_once()
+    channel.tx_commit.assert_called_once()
+    assert [c.kwargs["body"] for c in channel.basic_publish.call_args_list] == [b"m1", b"m2", b"m3"]
+    assert config.message_queue.empty()
+    assert mgr.drain(timeout=0)
+
+def test_run_waits_for_receivers_ready():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False
+    )
+    mgr.register(RabbitMQActions.RECV, config)
+    with patch.object(mgr, "recv", side_effect=lambda cfg: cfg.ready.set()):
+        assert mgr.run(ready_timeout=5) is True
+    assert config.ready.is_set()
+
+def test_publish_batch_with_confirms_and_persistence():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False,
+        publisher_confirms=True,
+        durable=True,
+        delivery_mode=2,
+    )
+    with patch("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection") as conn_mock:
+        channel = conn_mock.return_value.channel.return_value
+        assert mgr.publish_batch(config, [b"m1", b"m2"]) == 2
+    channel.exchange_declare.assert_called_once_with(exchange="test_exchange", exchange_type="direct", durable=True)
+    channel.confirm_delivery.assert_called_once()
+    channel.tx_select.assert_not_called()
+    channel.tx_commit.assert_not_called()
+    assert all(c.kwargs["properties"].delivery_mode == 2 for c in channel.basic_publish.call_args_list)
+
+def test_publish_batch_without_confirms_publishes_plainly():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False
+    )
+    with patch("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection") as conn_mock:
+        channel = conn_mock.return_value.channel.return_value
+        assert mgr.publish_batch(config, [b"m1", b"m2"]) == 2
+    channel.confirm_delivery.assert_not_called()
+    channel.tx_select.assert_not_called()
+    channel.tx_commit.assert_not_called()
+    assert channel.basic_publish.call_count == 2
+
+def test_send_retries_only_unpublished_messages_with_confirms(monkeypatch):
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False,
+        publisher_confirms=True,
+    )
+    monkeypatch.setattr("time.sleep", lambda x: None)
+    config.message_queue.put_many([b"m1", b"m2", b"m3"])
+    with patch("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection") as conn_mock:
+        channel = conn_mock.return_value.channel.return_value
+        confirmed = []
+        calls = []
+
+        def publish(**kwargs):
+            calls.append(kwargs["body"])
+            # the connection drops on the second basic_publish
+            if len(calls) == 2:
+                raise ConnectionError("connection lost")
+            confirmed.append(kwargs["body"])
+            if len(confirmed) == 3:
+                mgr.shutdown_event.set()
+        channel.basic_publish.side_effect = publish
+        mgr.send(config)
+    assert confirmed == [b"m1", b"m2", b"m3"]
+    assert conn_mock.call_count == 2
+    assert config.message_queue.join(timeout=0)
+
+def test_drain_times_out_with_unpublished_messages():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False
+    )
+    mgr.register(RabbitMQActions.SEND, config)
+    config.message_queue.put(b"msg")
+    assert mgr.drain(timeout=0.01) is False
+
+def test_send_reuses_connection_across_batches():
+    mgr = RabbitMQManager()
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False
+    )
+    config.message_queue.put(b"m1")
+    with patch("thc_devops_toolkit.infrastructure.rabbitmq.pika.BlockingConnection") as conn_mock:
+        channel = conn_mock.return_value.channel.return_value
+        published = []
+
+        def publish(**kwargs):
+            published.append(kwargs["body"])
+            if len(published) == 1:
+                config.message_queue.put(b"m2")
+            else:
+                mgr.shutdown_event.set()
+        channel.basic_publish.side_effect = publish
+        mgr.send(config)
+    assert conn_mock.call_count == 1
+    assert conn_mock.return_value.channel.call_count == 1
+    assert published == [b"m1", b"m2"]
+    conn_mock.return_value.close.assert_called_once()
+
+def test_run_pins_threads_to_cpu_affinity():
+    mgr = RabbitMQManager(cpu_affinity={0})
+    config = RabbitMQConfig(
+        host="localhost",
+        port=5672,
+        user="user",
+        password="pass",
+        exchange_name="test_exchange",
+        exchange_type="direct",
+        routing_key="test_key",
+        tls=False
+    )
+    mgr.register(RabbitMQActions.SEND, config)
+    with patch.object(mgr, "send"), patch(
+        "thc_devops_toolkit.infrastructure.rabbitmq.os.sched_setaffinity", create=True
+    ) as affinity_mock:
+        assert mgr.run(ready_timeout=0) is True
+    affinity_mock.assert_called_once_with(mgr.threads[0].native_id, {0})
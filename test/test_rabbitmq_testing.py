@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from thc_devops_toolkit.infrastructure import rabbitmq_testing as testing_mod
+
+
+@pytest.fixture
+def docker_mocks():
+    with patch.object(testing_mod, "docker_inspect") as inspect_mock, patch.object(
+        testing_mod, "docker_remove"
+    ) as remove_mock, patch.object(testing_mod, "docker_run_daemon") as run_mock, patch.object(
+        testing_mod, "docker_stop"
+    ) as stop_mock, patch.object(testing_mod, "docker_wait_healthy") as healthy_mock, patch.object(
+        testing_mod, "ensure_image"
+    ) as ensure_mock, patch.object(
+        testing_mod, "_wait_for_rabbitmq"
+    ) as wait_mock:
+        yield {
+            "inspect": inspect_mock,
+            "remove": remove_mock,
+            "run": run_mock,
+            "stop": stop_mock,
+            "healthy": healthy_mock,
+            "ensure": ensure_mock,
+            "wait": wait_mock,
+        }
+
+
+def test_fixture_reuses_running_pooled_container(docker_mocks):
+    docker_mocks["inspect"].return_value = {"State": {"Running": True}}
+    with testing_mod.rabbitmq_fixture("user", "pass", pool=True):
+        pass
+    docker_mocks["run"].assert_not_called()
+    docker_mocks["stop"].assert_not_called()
+    docker_mocks["wait"].assert_called_once()
+
+
+def test_fixture_replaces_stopped_pooled_container(docker_mocks):
+    docker_mocks["inspect"].return_value = {"State": {"Running": False}}
+    with testing_mod.rabbitmq_fixture("user", "pass", pool=True):
+        pass
+    docker_mocks["remove"].assert_called_once()
+    assert docker_mocks["run"].call_args.kwargs["restart_policy"] == "unless-stopped"
+    assert docker_mocks["run"].call_args.kwargs["remove"] is False
+    docker_mocks["stop"].assert_not_called()
+
+
+def test_fixture_without_pool_starts_and_stops(docker_mocks, monkeypatch):
+    monkeypatch.setenv("THC_RABBIT_POOL", "0")
+    docker_mocks["inspect"].side_effect = RuntimeError("No such object")
+    with testing_mod.rabbitmq_fixture("user", "pass", port=5673):
+        pass
+    docker_mocks["inspect"].assert_called_once()
+    docker_mocks["remove"].assert_not_called()
+    docker_mocks["ensure"].assert_called_once()
+    assert docker_mocks["run"].call_args.kwargs["remove"] is True
+    assert docker_mocks["run"].call_args.kwargs["port_mappings"] == ["5673:5672"]
+    docker_mocks["stop"].assert_called_once()
+    docker_mocks["healthy"].assert_called_once()
+    assert docker_mocks["run"].call_args.kwargs["health_cmd"] == "rabbitmq-diagnostics -q ping"
+
+
+def test_fixture_without_pool_replaces_pooled_leftover(docker_mocks):
+    docker_mocks["inspect"].return_value = {"State": {"Running": True}}
+    with testing_mod.rabbitmq_fixture("user", "pass", pool=False):
+        docker_mocks["stop"].assert_called_once()
+        docker_mocks["remove"].assert_called_once()
+    docker_mocks["run"].assert_called_once()
+    assert docker_mocks["run"].call_args.kwargs["remove"] is True
+    assert docker_mocks["stop"].call_count == 2
+
+
+def test_fixture_without_pool_stops_container_when_body_raises(docker_mocks):
+    docker_mocks["inspect"].side_effect = RuntimeError("No such object")
+    with pytest.raises(ValueError):
+        with testing_mod.rabbitmq_fixture("user", "pass", pool=False):
+            raise ValueError("test failed")
+    docker_mocks["stop"].assert_called_once_with(obj="test-rabbitmq-server")
+
+
+def test_fixture_without_pool_stops_container_when_not_ready(docker_mocks):
+    docker_mocks["inspect"].side_effect = RuntimeError("No such object")
+    docker_mocks["healthy"].side_effect = RuntimeError("not healthy")
+    with pytest.raises(RuntimeError):
+        with testing_mod.rabbitmq_fixture("user", "pass", pool=False):
+            pass
+    docker_mocks["stop"].assert_called_once_with(obj="test-rabbitmq-server")
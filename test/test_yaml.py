@@ -94,3 +94,25 @@ def test_set_value_to_dict_list_element():
     d = {"foo": [10, 20, 30]}
     yaml_mod.set_value_to_dict(d, "foo[1]", 99)
     assert d["foo"][1] == 99
+
+def test_compile_key_path():
+    compiled = yaml_mod.compile_key_path("foo.bar[0].baz")
+    assert compiled == ("foo", "bar", 0, "baz")
+    assert yaml_mod.compile_key_path("foo.bar[0].baz") is compiled
+    data = {"foo": {"bar": [{"baz": 1}]}}
+    assert yaml_mod.get_value_from_dict(data, compiled) == (1, True)
+    yaml_mod.set_value_to_dict(data, compiled, 2)
+    assert data["foo"]["bar"][0]["baz"] == 2
+
+def test_resolve_parent():
+    data = {"foo": {"bar": [{"baz": 1}]}}
+    parent, key = yaml_mod.resolve_parent(data, "foo.bar[0].baz")
+    assert parent is data["foo"]["bar"][0] and key == "baz"
+    parent[key] = 2
+    assert data["foo"]["bar"][0]["baz"] == 2
+    parent, key = yaml_mod.resolve_parent(data, yaml_mod.compile_key_path("foo.bar[0]"))
+    assert parent is data["foo"]["bar"] and key == 0
+    with pytest.raises(KeyError):
+        yaml_mod.resolve_parent(data, "foo.missing.baz")
+    with pytest.raises(KeyError):
+        yaml_mod.resolve_parent(data, "foo.bar[3].baz")